@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Statistics about where the time of captures goes.
+
+Usage: python analyze.py [--jobs N] [--json FILE] PATH [PATH ...]
+
+Each PATH is a capture or a directory searched recursively for captures,
+the files of a directory are analyzed in parallel.
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+
+import capture
+
+
+# Delay added by pyautogui after each call it makes (pyautogui.PAUSE)
+PYAUTOGUI_PAUSE = 0.1
+# Edges of the buckets of the idle gap histogram, in seconds
+GAP_BINS = (0.0, 0.001, 0.01, 0.1, 1.0, 10.0, 60.0, numpy.inf)
+# Edges of the buckets of the histogram of events per second
+RATE_BINS = (0, 1, 10, 50, 100, 250, 500, 1000, numpy.inf)
+# Side of the cells of the click heatmap, in pixels
+HEATMAP_CELL = 64
+# Bytes of a file searched for the header of a capture
+SNIFF_SIZE = 512
+
+
+def is_capture(path):
+    """Tell if path looks like a capture made by atbswp."""
+    try:
+        with open(path, "rb") as f:
+            return b"import pyautogui" in f.read(SNIFF_SIZE)
+    except OSError:
+        return False
+
+
+def find_captures(paths):
+    """Return the captures given or contained in the directories given."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                found.extend(os.path.join(root, name) for name in sorted(files)
+                             if is_capture(os.path.join(root, name)))
+        else:
+            found.append(path)
+    return found
+
+
+def columns(events):
+    """Return the columns of an EventBuffer as NumPy arrays."""
+    return {name: numpy.frombuffer(events.column(name), dtype=typecode)
+            for name, typecode in capture.COLUMNS}
+
+
+def analyze(path):
+    """Return the statistics of the capture at path, JSON serializable."""
+    events = columns(capture.load(path))
+    time, kind = events["time"], events["kind"]
+    x, y = events["x"], events["y"]
+    duration = float(time[-1]) if len(time) else 0.0
+    checkpoints = kind == capture.CHECKPOINT
+    calls = int(len(kind) - checkpoints.sum())
+
+    per_second = numpy.bincount(time.astype(numpy.int64)) if len(time) else numpy.zeros(0)
+    gaps = numpy.diff(time, prepend=0.0)
+
+    pointer = numpy.isin(kind, (capture.MOVE, capture.MOUSE_DOWN, capture.MOUSE_UP))
+    px, py = x[pointer].astype(numpy.float64), y[pointer].astype(numpy.float64)
+    distance = float(numpy.hypot(numpy.diff(px), numpy.diff(py)).sum())
+
+    clicks = kind == capture.MOUSE_DOWN
+    cx, cy = x[clicks] // HEATMAP_CELL, y[clicks] // HEATMAP_CELL
+    # The grid starts at the top left click, the screens left of or above
+    # the primary one have negative coordinates
+    left, top = int(cx.min(initial=0)), int(cy.min(initial=0))
+    heatmap = numpy.zeros((int(cy.max(initial=top - 1)) - top + 1, int(cx.max(initial=left - 1)) - left + 1),
+                          dtype=numpy.int64)
+    numpy.add.at(heatmap, (cy - top, cx - left), 1)
+
+    return {
+        "path": path,
+        "bytes": os.path.getsize(path),
+        "events": int(len(kind)),
+        "events_by_kind": {name: int((kind == value).sum()) for name, value in capture.KINDS.items()
+                           if name != "press"},
+        "checkpoints": int(checkpoints.sum()),
+        "recorded_duration": duration,
+        "estimated_replay_duration": duration + calls * PYAUTOGUI_PAUSE,
+        "idle_time": float(gaps[gaps >= 1.0].sum()),
+        "gap_histogram": numpy.histogram(gaps, bins=GAP_BINS)[0].tolist(),
+        "rate_histogram": numpy.histogram(per_second, bins=RATE_BINS)[0].tolist(),
+        "peak_rate": int(per_second.max(initial=0)),
+        "mouse_distance": distance,
+        "clicks": int(clicks.sum()),
+        "click_heatmap": heatmap.tolist(),
+        "click_heatmap_origin": [left * HEATMAP_CELL, top * HEATMAP_CELL],
+    }
+
+
+def try_analyze(path):
+    """Return the statistics of the capture at path, or its path and the error analyzing it.
+
+    Any error is reported instead of raised, one capture never ends the
+    analysis of a whole corpus.
+    """
+    try:
+        return analyze(path)
+    except Exception as error:
+        return {"path": path, "error": f"{type(error).__name__}: {error}"}
+
+
+def merge(results):
+    """Return the statistics of a whole corpus."""
+    total = {"files": len(results)}
+    for key in ("bytes", "events", "checkpoints", "recorded_duration", "estimated_replay_duration",
+                "idle_time", "mouse_distance", "clicks"):
+        total[key] = sum(result[key] for result in results)
+    total["peak_rate"] = max((result["peak_rate"] for result in results), default=0)
+    for key in ("gap_histogram", "rate_histogram"):
+        total[key] = numpy.sum([result[key] for result in results], axis=0).tolist() if results else []
+    total["events_by_kind"] = {name: sum(result["events_by_kind"][name] for result in results)
+                               for name in (results[0]["events_by_kind"] if results else ())}
+    # (left, top) in cells and the cells of each heatmap
+    maps = [([value // HEATMAP_CELL for value in result["click_heatmap_origin"]],
+             numpy.array(result["click_heatmap"], dtype=numpy.int64))
+            for result in results if result["click_heatmap"]]
+    left = min((origin[0] for origin, _ in maps), default=0)
+    top = min((origin[1] for origin, _ in maps), default=0)
+    right = max((origin[0] + cells.shape[1] for origin, cells in maps), default=left)
+    bottom = max((origin[1] + cells.shape[0] for origin, cells in maps), default=top)
+    heatmap = numpy.zeros((bottom - top, right - left), dtype=numpy.int64)
+    for (x, y), cells in maps:
+        heatmap[y - top:y - top + cells.shape[0], x - left:x - left + cells.shape[1]] += cells
+    total["click_heatmap"] = heatmap.tolist()
+    total["click_heatmap_origin"] = [left * HEATMAP_CELL, top * HEATMAP_CELL]
+    return total
+
+
+def histogram_labels(bins, unit=""):
+    """Return the label of each bucket of a histogram."""
+    return [f"<{upper:g}{unit}" if upper != numpy.inf else f">={bins[-2]:g}{unit}" for upper in bins[1:]]
+
+
+def summary(results, total, out=sys.stdout):
+    """Print the statistics as tables."""
+    header = f"{'capture':<40}{'events':>10}{'recorded':>11}{'replay':>11}{'idle':>10}{'distance':>11}{'clicks':>8}"
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    rows = sorted(results, key=lambda result: result["estimated_replay_duration"], reverse=True)
+    for result in rows + [dict(total, path="TOTAL")]:
+        name = result["path"] if len(result["path"]) <= 39 else "..." + result["path"][-36:]
+        print(f"{name:<40}{result['events']:>10}{result['recorded_duration']:>10.1f}s"
+              f"{result['estimated_replay_duration']:>10.1f}s{result['idle_time']:>9.1f}s"
+              f"{result['mouse_distance']:>10.0f}px{result['clicks']:>8}", file=out)
+    print(file=out)
+    print("Idle gaps between events:", file=out)
+    for label, count in zip(histogram_labels(GAP_BINS, "s"), total["gap_histogram"]):
+        print(f"  {label:>10} {count:>10}", file=out)
+    print("Seconds by number of events per second:", file=out)
+    for label, count in zip(histogram_labels(RATE_BINS), total["rate_histogram"]):
+        print(f"  {label:>10} {count:>10}", file=out)
+
+
+def main(argv=None):
+    """Analyze the captures given on the command line."""
+    parser = argparse.ArgumentParser(description="Statistics about where the time of captures goes.")
+    parser.add_argument("paths", nargs="+", metavar="PATH", help="capture or directory of captures")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of processes")
+    parser.add_argument("--json", metavar="FILE", help="write the statistics as JSON, - for stdout")
+    args = parser.parse_args(argv)
+
+    paths = find_captures(args.paths)
+    if len(paths) > 1 and args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(pool.map(try_analyze, paths, chunksize=max(1, len(paths) // (args.jobs * 4))))
+    else:
+        results = [try_analyze(path) for path in paths]
+    failed = [result for result in results if "error" in result]
+    results = [result for result in results if "error" not in result]
+    total = merge(results)
+    for result in failed:
+        print(f"{result['path']}: {result['error']}", file=sys.stderr)
+
+    if args.json == "-":
+        json.dump({"captures": results, "failed": failed, "total": total}, sys.stdout, indent=1)
+        print()
+    else:
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump({"captures": results, "failed": failed, "total": total}, f, indent=1)
+        summary(results, total)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Convert and optimize a whole library of captures.
+
+Usage: python batch.py [-o OUTDIR] [--jobs N] [--manifest FILE] PATH [PATH ...]
+
+Each PATH is a capture or a directory searched recursively for captures.
+Every capture is checked by replaying it against a virtual clock, written
+again in the current format with its redundant mouse moves dropped and
+its repeated blocks folded into loops, then compiled and replayed again
+to make sure it makes the same clicks and keys. The files are processed
+in parallel, in place or into OUTDIR.
+
+The manifest records the SHA-256 of every file processed, an interrupted
+run started again only processes the files which changed since.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import analyze
+import capture
+import loops
+import replay
+import sampling
+import settings
+
+
+# Name of the manifest written at the top of the output
+MANIFEST = "atbswp-batch.json"
+# Seconds between two saves of the manifest during a run
+SAVE_INTERVAL = 1.0
+# Files submitted to the pool ahead of the ones being processed, per process
+QUEUE_DEPTH = 4
+# First line of capture.CHECKPOINT_IMPORT
+CHECKPOINT_IMPORT = capture.CHECKPOINT_IMPORT.splitlines()[0]
+# Functions atbswp writes in its captures, the others can't be converted
+SUPPORTED = frozenset([f"pyautogui.{name}" for name in capture.KINDS] + ["checkpoint.wait_for"])
+
+Options = namedtuple("Options", "max_rate min_distance time_tolerance position_tolerance")
+
+
+def sha256(path):
+    """Return the hex SHA-256 of the file at path, None if it doesn't exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+def preamble(lines):
+    """Return the lines at the top of a capture, before its first event."""
+    header = []
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("time.sleep(") or line[:1].isspace() or capture.LOOP.match(stripped):
+            break
+        match = capture.CALL.match(stripped)
+        if match is not None and match.group(2) in capture.KINDS:
+            break
+        if stripped == CHECKPOINT_IMPORT:
+            # serialize writes it again when there are checkpoints left
+            break
+        if stripped != "import checkpoint":
+            header.append(line)
+    return header
+
+
+def actions(timeline):
+    """Return what a replay does besides moving the pointer, to compare replays.
+
+    The press of an auto repeat is a keyDown and a keyUp, as it is loaded.
+    """
+    made = []
+    for step in timeline:
+        if step.function == "pyautogui.moveTo":
+            continue
+        if step.function == "pyautogui.press":
+            made.append(("pyautogui.keyDown", step.arguments))
+            made.append(("pyautogui.keyUp", step.arguments))
+        else:
+            made.append((step.function, step.arguments))
+    return made
+
+
+def optimize(text, path, options):
+    """Return the optimized capture and its statistics.
+
+    Raise ValueError when the capture can't be converted without changing
+    what it does.
+
+    Keyword arguments:
+    text -- the content of the capture
+    path -- where the capture was read, to load its events
+    options -- the Options of the batch
+    """
+    lines = text.splitlines(True)
+    try:
+        before, replay_before = replay.dry_run(replay.compile_capture(lines, path))
+    except Exception as error:
+        raise ValueError(f"does not replay: {type(error).__name__}: {error}")
+    unsupported = sorted({step.function for step in before} - SUPPORTED)
+    if unsupported:
+        raise ValueError(f"unsupported calls: {', '.join(unsupported)}")
+
+    events = sampling.decimate(capture.load(path),
+                               sampling.MouseDecimator(options.max_rate, options.min_distance))
+    header = "".join(preamble(lines)).rstrip("\n")
+    flat = (capture.serialize(events, header) + "\n").splitlines(True)
+    folded, found = loops.fold(flat, options.time_tolerance, options.position_tolerance)
+
+    # Recompile the result, it must make the same clicks and keys
+    after, replay_after = replay.dry_run(replay.compile_capture(folded, path))
+    if actions(after) != actions(before):
+        raise ValueError("the converted capture doesn't replay the same events")
+    return "".join(folded), {
+        "moves_before": sum(step.function == "pyautogui.moveTo" for step in before),
+        "moves_after": sum(step.function == "pyautogui.moveTo" for step in after),
+        "loops": len(found),
+        "replay_before": replay_before,
+        "replay_after": replay_after,
+    }
+
+
+def convert(source, output, previous, options):
+    """Convert one capture, return its entry of the manifest.
+
+    Nothing is done when the source, and the output, are the files the
+    previous entry was made from.
+
+    Keyword arguments:
+    source -- the capture to convert
+    output -- where to write it, source itself to convert in place
+    previous -- the entry of the manifest for source, or None
+    options -- the Options of the batch
+    """
+    source_sha256 = sha256(source)
+    if previous is not None and previous.get("options") == list(options):
+        if output == source:
+            unchanged = source_sha256 in (previous["source_sha256"], previous.get("output_sha256"))
+        else:
+            unchanged = source_sha256 == previous["source_sha256"] and \
+                (previous.get("output_sha256") is None or sha256(output) == previous["output_sha256"])
+        if unchanged:
+            return dict(previous, skipped=True)
+
+    start = time.perf_counter()
+    entry = {"output": output, "source_sha256": source_sha256, "options": list(options),
+             "bytes_before": os.path.getsize(source), "skipped": False}
+    try:
+        with open(source, encoding="utf-8") as f:
+            text = f.read()
+        optimized, statistics = optimize(text, source, options)
+    except (ValueError, OSError) as error:
+        entry.update(status="failed", error=str(error), output_sha256=None)
+        return entry
+    if optimized != text or output != source:
+        settings.atomic_write(output, optimized)
+    entry.update(statistics, status="converted", bytes_after=len(optimized.encode("utf-8")),
+                 output_sha256=hashlib.sha256(optimized.encode("utf-8")).hexdigest(),
+                 seconds=time.perf_counter() - start)
+    return entry
+
+
+def targets(paths, output_directory=None):
+    """Return the (source, output) of every capture to convert.
+
+    The captures found in a directory keep their place relative to it in
+    the output directory.
+    """
+    found = []
+    for path in paths:
+        root = path if os.path.isdir(path) else os.path.dirname(path)
+        for source in analyze.find_captures([path]):
+            if os.path.basename(source).startswith(".atbswp-"):
+                # Temporary file of an interrupted write
+                continue
+            source = os.path.abspath(source)
+            output = source
+            if output_directory:
+                output = os.path.abspath(os.path.join(output_directory, os.path.relpath(source, root)))
+            found.append((source, output))
+    return found
+
+
+def load_manifest(path):
+    """Return the entries of the manifest at path, by source."""
+    try:
+        with open(path) as f:
+            return json.load(f)["captures"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def save_manifest(path, entries):
+    """Write the manifest, atomically so an interruption never corrupts it."""
+    settings.atomic_write(path, json.dumps({"captures": entries}, indent=1, sort_keys=True))
+
+
+def run(files, manifest, options, jobs=1, progress=None):
+    """Convert the files, return the entry of each one by source.
+
+    The manifest is updated as the files are done.
+
+    Keyword arguments:
+    files -- the list of (source, output) returned by targets
+    manifest -- path of the manifest
+    options -- the Options of the batch
+    jobs -- number of processes
+    progress -- called with the source and the entry of each file done
+    """
+    entries = load_manifest(manifest)
+    done = {}
+    last_save = time.monotonic()
+
+    def finish(source, entry):
+        nonlocal last_save
+        done[source] = entries[source] = {key: value for key, value in entry.items() if key != "skipped"}
+        if progress is not None:
+            progress(source, entry)
+        if not entry["skipped"] and time.monotonic() - last_save >= SAVE_INTERVAL:
+            save_manifest(manifest, entries)
+            last_save = time.monotonic()
+
+    try:
+        if jobs > 1 and len(files) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                pending = {}
+                queue = iter(files)
+                try:
+                    while True:
+                        # Keep the pool busy without submitting the whole corpus at once
+                        for source, output in queue:
+                            pending[pool.submit(convert, source, output, entries.get(source), options)] = source
+                            if len(pending) >= jobs * QUEUE_DEPTH:
+                                break
+                        if not pending:
+                            break
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            finish(pending.pop(future), future.result())
+                except BaseException:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+        else:
+            for source, output in files:
+                finish(source, convert(source, output, entries.get(source), options))
+    finally:
+        save_manifest(manifest, entries)
+    return done
+
+
+def summary(entries, skipped, elapsed, out=sys.stdout):
+    """Print the files converted and what was saved."""
+    converted = [entry for entry in entries if entry["status"] == "converted"]
+    failed = [entry for entry in entries if entry["status"] == "failed"]
+    bytes_before = sum(entry["bytes_before"] for entry in converted)
+    bytes_after = sum(entry["bytes_after"] for entry in converted)
+    replay_before = sum(entry["replay_before"] for entry in converted)
+    replay_after = sum(entry["replay_after"] for entry in converted)
+    print(f"{len(converted)} converted ({skipped} unchanged since the last run), "
+          f"{len(failed)} failed, in {elapsed:.1f}s", file=out)
+    print(f"{'':<18}{'before':>14}{'after':>14}{'saved':>14}", file=out)
+    print(f"{'size (bytes)':<18}{bytes_before:>14}{bytes_after:>14}{bytes_before - bytes_after:>14}", file=out)
+    print(f"{'replay (s)':<18}{replay_before:>14.1f}{replay_after:>14.1f}"
+          f"{replay_before - replay_after:>14.1f}", file=out)
+    print(f"{'mouse moves':<18}{sum(entry['moves_before'] for entry in converted):>14}"
+          f"{sum(entry['moves_after'] for entry in converted):>14}", file=out)
+    print(f"{'loops':<18}{'':>14}{sum(entry['loops'] for entry in converted):>14}", file=out)
+    for entry in failed:
+        print(f"failed: {entry['output']}: {entry['error']}", file=out)
+
+
+def main(argv=None):
+    """Convert the captures given on the command line."""
+    parser = argparse.ArgumentParser(description="Convert and optimize a whole library of captures.")
+    parser.add_argument("paths", nargs="+", metavar="PATH", help="capture or directory of captures")
+    parser.add_argument("-o", "--output", metavar="OUTDIR", help="where to write the captures (default: in place)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of processes")
+    parser.add_argument("--manifest", metavar="FILE",
+                        help=f"progress of the conversion (default: {MANIFEST} in OUTDIR or the first PATH)")
+    parser.add_argument("--mouse-max-rate", type=int, default=settings.CONFIG.mouse_max_rate, metavar="HZ",
+                        help="maximum number of mouse moves kept per second, 0 for no limit")
+    parser.add_argument("--mouse-min-distance", type=int, default=settings.CONFIG.mouse_min_distance,
+                        metavar="PX", help="minimum distance between two mouse moves kept")
+    parser.add_argument("--time-tolerance", type=float, default=loops.TIME_TOLERANCE, metavar="S",
+                        help=f"maximum shift of an event replayed from a loop (default {loops.TIME_TOLERANCE})")
+    parser.add_argument("--position-tolerance", type=int, default=loops.POSITION_TOLERANCE, metavar="PX",
+                        help=f"coordinates closer than this are the same in loops (default {loops.POSITION_TOLERANCE})")
+    args = parser.parse_args(argv)
+
+    manifest = args.manifest
+    if manifest is None:
+        first = args.paths[0] if os.path.isdir(args.paths[0]) else os.path.dirname(args.paths[0]) or "."
+        manifest = os.path.join(args.output or first, MANIFEST)
+    options = Options(args.mouse_max_rate, args.mouse_min_distance, args.time_tolerance, args.position_tolerance)
+
+    start = time.perf_counter()
+    files = targets(args.paths, args.output)
+    skipped = 0
+
+    def progress(source, entry):
+        nonlocal skipped
+        skipped += entry["skipped"]
+        if entry["status"] == "failed" and not entry["skipped"]:
+            print(f"{source}: {entry['error']}", file=sys.stderr)
+
+    try:
+        done = run(files, manifest, options, args.jobs, progress)
+    except KeyboardInterrupt:
+        print(f"Interrupted, run again to resume ({manifest})", file=sys.stderr)
+        sys.exit(1)
+    summary(list(done.values()), skipped, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
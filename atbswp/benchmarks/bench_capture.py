@@ -0,0 +1,66 @@
+"""Compare the recording buffer with the former list of formatted lines.
+
+Run with `python benchmarks/bench_capture.py [events]`.
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import capture  # noqa: E402
+
+
+def record_lines(events):
+    """Mimic the former recorder: one sleep and one call line per move."""
+    lines = []
+    last = time.perf_counter()
+    for i in range(events):
+        b = time.perf_counter()
+        timeout = float(b - last)
+        if timeout > 0.0:
+            lines.append(f"time.sleep({timeout})")
+        last = b
+        lines.append("pyautogui" + "." + "moveTo" + '(' + f"{i % 1920}, {i % 1080}" + ')')
+    return lines
+
+
+def record_buffer(events):
+    """Record the same moves in an EventBuffer."""
+    buffer = capture.EventBuffer(time.perf_counter())
+    for i in range(events):
+        buffer.append(time.perf_counter(), capture.MOVE, i % 1920, i % 1080)
+    return buffer
+
+
+def measure(function, events):
+    """Return (bytes per event, microseconds per append)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(events)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    # Timing without tracemalloc overhead
+    start = time.perf_counter()
+    function(events)
+    elapsed = time.perf_counter() - start
+    return size / events, elapsed / events * 1e6
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    lines = measure(record_lines, events)
+    buffer = measure(record_buffer, events)
+    print(f"{events} mouse moves")
+    print(f"{'':<14}{'bytes/event':>12}{'us/append':>12}")
+    print(f"{'list of lines':<14}{lines[0]:>12.1f}{lines[1]:>12.3f}")
+    print(f"{'EventBuffer':<14}{buffer[0]:>12.1f}{buffer[1]:>12.3f}")
+    print(f"memory reduction: {lines[0] / buffer[0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Compare the timing jitter of recording in the GUI process and in the engine process.
+
+Run with `python benchmarks/bench_engine.py [seconds]`. No display is
+needed: a metronome stands in for the mouse listener and moves the pointer
+at a fixed rate, while a thread of the benchmark process keeps the GIL
+busy like the wx main loop repainting or writing a capture. The delay of
+each event is the time it was stamped minus the time it was due.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import capture  # noqa: E402
+import engine  # noqa: E402
+import listeners  # noqa: E402
+import sampling  # noqa: E402
+
+
+PERIOD = 0.001
+# y of the moves is the time they were due, in microseconds modulo WRAP
+WRAP = 10 ** 9
+
+
+class Metronome:
+    """Mouse listener moving the pointer every PERIOD seconds."""
+
+    def __init__(self, on_move, on_click, on_scroll):
+        self.on_move = on_move
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def run(self):
+        due = time.perf_counter()
+        i = 0
+        while not self._stop.is_set():
+            due += PERIOD
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self.on_move(i, int(due * 1e6) % WRAP)
+            i += 1
+
+    def wait(self):
+        pass
+
+    def stop(self):
+        self._stop.set()
+
+    def join(self):
+        self._thread.join()
+
+
+class Silent(Metronome):
+    """Keyboard listener never pressing anything."""
+
+    def __init__(self, on_press, on_release):
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._stop.wait, daemon=True)
+
+
+def busy(stop):
+    """Hold the GIL like the GUI does, with pure Python work."""
+    while not stop.is_set():
+        capture.serialize(events, "import pyautogui")
+
+
+events = capture.EventBuffer()
+for i in range(2000):
+    events.append(i * 0.01, capture.MOVE, i, i)
+
+
+def delays(times, due):
+    """Return the delays in microseconds."""
+    return (numpy.asarray(times) * 1e6 - numpy.asarray(due)) % WRAP
+
+
+def in_process(seconds):
+    ring = engine.SharedEventRing()
+    recorder = engine.RingRecorder(ring, sampling.MouseDecimator(0, 0), None)
+    manager = listeners.ListenerManager(Metronome, Silent)
+    manager.arm(recorder)
+    time.sleep(seconds)
+    manager.stop()
+    recorded = ring.read()
+    ring.close()
+    return delays(recorded["time"], recorded["y"])
+
+
+def out_of_process(seconds):
+    process = engine.CaptureProcess({"max_rate": 0, "min_distance": 0},
+                                    mouse_listener=Metronome, keyboard_listener=Silent)
+    process.start()
+    time.sleep(seconds)
+    recorded = process.stop()
+    return delays(recorded.column("time"), recorded.column("y"))
+
+
+def report(name, measured):
+    print(f"{name:<26}{len(measured):>8}{numpy.median(measured):>10.0f}{numpy.percentile(measured, 99):>10.0f}"
+          f"{measured.max():>10.0f}{measured.std():>10.0f}")
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    print(f"{seconds:g}s at {1 / PERIOD:g} moves/s, delay after the move was due (us)")
+    print(f"{'':<26}{'events':>8}{'median':>10}{'p99':>10}{'max':>10}{'stdev':>10}")
+    for load in (False, True):
+        stop = threading.Event()
+        if load:
+            threading.Thread(target=busy, args=(stop,), daemon=True).start()
+        suffix = ", busy GUI" if load else ""
+        report("in process" + suffix, in_process(seconds))
+        report("engine process" + suffix, out_of_process(seconds))
+        stop.set()
+
+
+if __name__ == "__main__":
+    main()
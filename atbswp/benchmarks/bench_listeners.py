@@ -0,0 +1,106 @@
+"""Compare starting listeners on every recording with arming persistent ones.
+
+Run with `python benchmarks/bench_listeners.py [rounds]`, the new
+listeners are only measured with pynput and a display. Without them the
+persistent listeners are stand-ins installing nothing, arming a sink
+costs the same once the listeners run.
+"""
+
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import listeners  # noqa: E402
+
+
+class Sink:
+    """Recorder doing nothing with the events."""
+
+    def on_move(self, x, y):
+        pass
+
+    on_click = on_scroll = on_press = on_release = on_move
+
+
+class Idle:
+    """Listener installing nothing."""
+
+    def __init__(self, **callbacks):
+        pass
+
+    def start(self):
+        pass
+
+    wait = stop = join = start
+
+
+def fresh_listeners(mouse, keyboard, sink):
+    """Mimic the former recorder: new listeners started and stopped each time."""
+    start = time.perf_counter()
+    pair = (mouse.Listener(on_move=sink.on_move, on_click=sink.on_click, on_scroll=sink.on_scroll),
+            keyboard.Listener(on_press=sink.on_press, on_release=sink.on_release))
+    for listener in pair:
+        listener.start()
+    for listener in pair:
+        listener.wait()
+    started = time.perf_counter()
+    for listener in pair:
+        listener.stop()
+    for listener in pair:
+        listener.join()
+    return started - start, time.perf_counter() - started
+
+
+def armed_sink(manager, sink):
+    """Arm and disarm a sink on listeners already running."""
+    start = time.perf_counter()
+    manager.arm(sink)
+    armed = time.perf_counter()
+    manager.disarm(sink)
+    return armed - start, time.perf_counter() - armed
+
+
+def dispatch(events):
+    """Return the microseconds added to each event by the manager."""
+    sink = Sink()
+    manager = listeners.ListenerManager()
+    manager.sinks = (sink,)
+    start = time.perf_counter()
+    for i in range(events):
+        sink.on_move(i, i)
+    direct = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(events):
+        manager.on_move(i, i)
+    return (time.perf_counter() - start - direct) / events * 1e6
+
+
+def report(name, samples):
+    starts, stops = zip(*samples)
+    print(f"{name:<22}{statistics.median(starts) * 1e3:>12.3f}{statistics.median(stops) * 1e3:>12.3f}")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print(f"manager dispatch overhead: {dispatch(1_000_000):.3f} us/event")
+    try:
+        from pynput import keyboard, mouse
+    except Exception as error:  # no pynput or no display
+        print(f"new listeners not measured: {error}")
+        keyboard = mouse = None
+    sink = Sink()
+    manager = listeners.ListenerManager() if mouse is not None else listeners.ListenerManager(Idle, Idle)
+    manager.start()
+    print(f"{rounds} rounds, median latency")
+    print(f"{'':<22}{'start (ms)':>12}{'stop (ms)':>12}")
+    if mouse is not None:
+        report("new listeners", [fresh_listeners(mouse, keyboard, sink) for _ in range(rounds)])
+    report("persistent listeners", [armed_sink(manager, sink) for _ in range(rounds)])
+    manager.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,610 @@
+"""In-memory representation of a capture and its serialization."""
+
+# atbswp: Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import ast
+import functools
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+
+import keycodes
+
+
+# Kind of the recorded events
+MOVE = 0
+MOUSE_DOWN = 1
+MOUSE_UP = 2
+SCROLL = 3
+KEY_DOWN = 4
+KEY_UP = 5
+CHECKPOINT = 6  # code is an index in EventBuffer.blobs
+
+# Flags of the recorded events
+SPECIAL_KEY = keycodes.SPECIAL_KEY  # code is an index in KEY_NAMES instead of a code point
+VIRTUAL_KEY = keycodes.VIRTUAL_KEY  # code is a virtual key code of the platform
+
+BUTTONS = ("left", "right", "middle")
+
+# Names understood by pyautogui for the keys without a character
+KEY_NAMES = keycodes.NAMES
+UNSUPPORTED_KEY = keycodes.UNSUPPORTED
+UNSUPPORTED_KEY_NAME = keycodes.UNSUPPORTED_NAME
+
+# Number of events allocated at once by EventBuffer
+CHUNK_SIZE = 4096
+# Rows of a capture file kept parsed by CaptureIndex
+ROW_CACHE_SIZE = 4096
+
+SLEEP = b"time.sleep("
+CALL = re.compile(r"^\s*(\w+)\.(\w+)\((.*)\)\s*$")
+BYTES_CALL = re.compile(CALL.pattern.encode())
+LOOP = re.compile(r"^for \w+ in range\((\d+)\):$")
+
+# Put at the top of the captures with checkpoints. A capture replayed
+# outside of atbswp compares the screen with Pillow, through pyautogui,
+# the lines are written so that load and CaptureIndex skip them.
+CHECKPOINT_IMPORT = """\
+def _checkpoint():
+    try:
+        import checkpoint
+        return checkpoint
+    except ImportError:
+        pass
+    import base64
+    import types
+
+    def wait_for(region, expected, timeout=60.0, tolerance=8.0):
+        reference = base64.b64decode(expected)
+        deadline = time.monotonic() + timeout
+        while True:
+            # 4 is Image.BOX, the mean of each block like checkpoint.thumbnail
+            image = pyautogui.screenshot(region=tuple(region)).convert("L").resize((16, 16), 4)
+            if sum(abs(a - b) for a, b in zip(image.tobytes(), reference)) <= tolerance * len(reference):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            pause(0.05)
+
+    pause = time.sleep
+    return types.SimpleNamespace(wait_for=wait_for)
+
+
+checkpoint = _checkpoint()"""
+
+COLUMNS = (("time", "d"), ("kind", "B"), ("x", "i"), ("y", "i"),
+           ("code", "i"), ("flags", "H"))
+
+
+class _Chunk:
+    """Fixed size slice of every column."""
+
+    __slots__ = tuple(name for name, _ in COLUMNS)
+
+    def __init__(self, size):
+        for name, typecode in COLUMNS:
+            column = array(typecode)
+            column.frombytes(bytes(size * column.itemsize))
+            setattr(self, name, column)
+
+
+class EventBuffer:
+    """Columnar storage of the recorded events.
+
+    Every event is a timestamp, a kind, the x and y coordinates, a button,
+    key or scroll code and flags, each stored in a typed array. The arrays
+    are allocated `chunk_size` events at a time so appending never copies
+    what was already recorded, and nothing is formatted before saving.
+
+    Keyword arguments:
+    start -- reference time of the recording, the first delay is computed from it
+    chunk_size -- number of events allocated at once
+    """
+
+    def __init__(self, start=0.0, chunk_size=CHUNK_SIZE):
+        """Create an empty buffer."""
+        self.start = start
+        self.chunk_size = chunk_size
+        self._chunks = []
+        self._chunk = None
+        self._used = chunk_size
+        self._count = 0
+        self.blobs = []
+
+    @classmethod
+    def from_columns(cls, columns, start=0.0, blobs=()):
+        """Return a buffer holding the given columns, without copying them.
+
+        Keyword arguments:
+        columns -- dictionary of arrays of the same length, by column name
+        start -- reference time of the recording
+        blobs -- the data of the checkpoints
+        """
+        count = len(columns["time"])
+        events = cls(start, max(count, 1))
+        if count:
+            chunk = _Chunk(0)
+            for name, _ in COLUMNS:
+                setattr(chunk, name, columns[name])
+            events._chunks = [chunk]
+            events._chunk = chunk
+            events._used = events._count = count
+        events.blobs = list(blobs)
+        return events
+
+    def __len__(self):
+        return self._count
+
+    def append(self, time, kind, x=0, y=0, code=0, flags=0):
+        """Record one event."""
+        i = self._used
+        if i == self.chunk_size:
+            self._chunk = _Chunk(self.chunk_size)
+            self._chunks.append(self._chunk)
+            i = 0
+        chunk = self._chunk
+        chunk.time[i] = time
+        chunk.kind[i] = kind
+        chunk.x[i] = x
+        chunk.y[i] = y
+        chunk.code[i] = code
+        chunk.flags[i] = flags
+        self._used = i + 1
+        self._count += 1
+
+    def last(self):
+        """Return the last event as (time, kind, x, y, code, flags), or None."""
+        if not self._count:
+            return None
+        chunk, i = self._chunk, self._used - 1
+        return (chunk.time[i], chunk.kind[i], chunk.x[i], chunk.y[i], chunk.code[i], chunk.flags[i])
+
+    def add_blob(self, value):
+        """Store data that doesn't fit in the columns, return its code."""
+        self.blobs.append(value)
+        return len(self.blobs) - 1
+
+    def truncate(self, count):
+        """Forget every event after the first `count` ones."""
+        count = max(0, min(count, self._count))
+        kept = -(-count // self.chunk_size)
+        del self._chunks[kept:]
+        self._chunk = self._chunks[-1] if self._chunks else None
+        self._used = count - (kept - 1) * self.chunk_size if kept else self.chunk_size
+        self._count = count
+
+    def clear(self, start=0.0):
+        """Forget every event and start over from `start`."""
+        self.truncate(0)
+        self.blobs = []
+        self.start = start
+
+    def column(self, name):
+        """Return a copy of a whole column as a single array."""
+        result = array(dict(COLUMNS)[name])
+        for chunk in self._chunks:
+            result.extend(getattr(chunk, name))
+        del result[self._count:]
+        return result
+
+    def __iter__(self):
+        """Yield (time, kind, x, y, code, flags) for every event."""
+        remaining = self._count
+        for chunk in self._chunks:
+            size = min(remaining, self.chunk_size)
+            yield from zip(chunk.time[:size], chunk.kind[:size], chunk.x[:size],
+                           chunk.y[:size], chunk.code[:size], chunk.flags[:size])
+            remaining -= size
+
+    def nbytes(self):
+        """Return the memory allocated by the columns."""
+        per_event = sum(array(typecode).itemsize for _, typecode in COLUMNS)
+        return len(self._chunks) * self.chunk_size * per_event
+
+
+class RingBuffer:
+    """Last events recorded, in a fixed amount of memory.
+
+    The columns are allocated once for `capacity` events, each new event
+    overwrites the oldest one when the buffer is full. It has the same
+    append and add_blob methods as EventBuffer, and can be read while the
+    recording goes on with snapshot.
+
+    Keyword arguments:
+    capacity -- number of events kept
+    """
+
+    def __init__(self, capacity):
+        """Allocate the columns."""
+        self.capacity = capacity
+        self._columns = _Chunk(capacity)
+        self._next = 0
+        self._count = 0
+        self._blobs = {}
+        self._blob_count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._count
+
+    def append(self, time, kind, x=0, y=0, code=0, flags=0):
+        """Record one event, forgetting the oldest one if full."""
+        with self._lock:
+            i = self._next
+            columns = self._columns
+            if self._count == self.capacity:
+                if columns.kind[i] == CHECKPOINT:
+                    self._blobs.pop(columns.code[i], None)
+            else:
+                self._count += 1
+            columns.time[i] = time
+            columns.kind[i] = kind
+            columns.x[i] = x
+            columns.y[i] = y
+            columns.code[i] = code
+            columns.flags[i] = flags
+            self._next = i + 1 if i + 1 < self.capacity else 0
+
+    def add_blob(self, value):
+        """Store data that doesn't fit in the columns, return its code."""
+        with self._lock:
+            code = self._blob_count
+            self._blob_count += 1
+            self._blobs[code] = value
+        return code
+
+    def clear(self):
+        """Forget every event."""
+        with self._lock:
+            self._next = 0
+            self._count = 0
+            self._blobs = {}
+
+    def snapshot(self, max_age=None):
+        """Return a copy of the events as an EventBuffer, oldest first.
+
+        Keyword arguments:
+        max_age -- only keep the events this many seconds older than the last one
+        """
+        with self._lock:
+            first = self._next if self._count == self.capacity else 0
+            columns = {}
+            for name, _ in COLUMNS:
+                column = getattr(self._columns, name)
+                columns[name] = column[first:self._count] + column[:first]
+            blobs = dict(self._blobs)
+        times = columns["time"]
+        if max_age is not None and times:
+            oldest = bisect_left(times, times[-1] - max_age)
+            for name in columns:
+                del columns[name][:oldest]
+        # Checkpoints refer to their position in the blobs of the copy
+        kept = []
+        kinds, codes = columns["kind"].tobytes(), columns["code"]
+        i = kinds.find(CHECKPOINT)
+        while i != -1:
+            kept.append(blobs[codes[i]])
+            codes[i] = len(kept) - 1
+            i = kinds.find(CHECKPOINT, i + 1)
+        return EventBuffer.from_columns(columns, times[0] if times else 0.0, kept)
+
+
+def drop_clicks_on(events, contains):
+    """Forget the clicks ending the capture which landed on an area, like the stop button.
+
+    The moves on the area recorded after these clicks, like the one the
+    mouse decimator held back until the end, are forgotten with them.
+
+    Keyword arguments:
+    events -- EventBuffer holding the capture
+    contains -- function telling if the point (x, y) is on the area
+    """
+    moves = []
+    last = events.last()
+    while last is not None and last[1] in (MOVE, MOUSE_DOWN, MOUSE_UP) and contains(last[2], last[3]):
+        events.truncate(len(events) - 1)
+        if last[1] == MOVE:
+            moves.append(last)
+        else:
+            moves = []
+        last = events.last()
+    # The moves before the first click dropped are kept
+    for event in reversed(moves):
+        events.append(*event)
+
+
+def key_name(code, flags):
+    """Return the pyautogui name of a recorded key."""
+    return keycodes.name(code, flags)
+
+
+def serialize(events, header, engine="pyautogui"):
+    """Return the Python program replaying the events.
+
+    Keyword arguments:
+    events -- EventBuffer holding the capture
+    header -- the lines put at the top of the program
+    engine -- the replay library used (default pyautogui)
+    """
+    lines = [header]
+    if CHECKPOINT in events.column("kind"):
+        lines.append(CHECKPOINT_IMPORT)
+    last_time = events.start
+    held = set()
+    for time, kind, x, y, code, flags in events:
+        delay = time - last_time
+        last_time = time
+        if kind == CHECKPOINT:
+            # The checkpoint waits for the screen instead of the recorded delay
+            region, thumbnail = events.blobs[code]
+            lines.append(f"checkpoint.wait_for({tuple(region)}, {thumbnail!r})")
+            continue
+        if delay > 0.0:
+            lines.append(f"time.sleep({delay})")
+
+        if kind == MOVE:
+            lines.append(f"{engine}.moveTo({x}, {y})")
+        elif kind == MOUSE_DOWN:
+            lines.append(f"{engine}.mouseDown({x}, {y}, '{BUTTONS[code]}')")
+        elif kind == MOUSE_UP:
+            lines.append(f"{engine}.mouseUp({x}, {y}, '{BUTTONS[code]}')")
+        elif kind == SCROLL:
+            lines.append(f"{engine}.scroll({code})")
+        elif kind in (KEY_DOWN, KEY_UP) and flags & VIRTUAL_KEY:
+            # pyautogui has no name for the key and would ignore the call
+            action = "pressed" if kind == KEY_DOWN else "released"
+            lines.append(f"{UNSUPPORTED_KEY_NAME}: virtual key {code} {action}")
+        elif kind == KEY_DOWN:
+            key = key_name(code, flags)
+            # Successive keyDown without keyUp are auto repeats
+            if key in held:
+                lines.append(f"{engine}.press({key!r})")
+            else:
+                held.add(key)
+                lines.append(f"{engine}.keyDown({key!r})")
+        elif kind == KEY_UP:
+            key = key_name(code, flags)
+            held.discard(key)
+            lines.append(f"{engine}.keyUp({key!r})")
+    return "\n".join(lines)
+
+
+def parse_line(line):
+    """Return the function called by a line of a capture and its arguments.
+
+    Return None for the lines which aren't a call, like the imports.
+    """
+    match = CALL.match(line)
+    if match is None:
+        return None
+    module, function, arguments = match.groups()
+    try:
+        arguments = ast.literal_eval(f"({arguments},)") if arguments else ()
+    except (ValueError, SyntaxError):
+        arguments = (arguments,)
+    return f"{module}.{function}", arguments
+
+
+def parse_arguments(text):
+    """Return the arguments of a call, fast path for numbers and keys."""
+    arguments = []
+    for argument in text.split(", "):
+        if argument.lstrip("-").isdigit():
+            arguments.append(int(argument))
+        elif len(argument) > 2 and argument[0] == argument[-1] == "'" \
+                and "\\" not in argument and "'" not in argument[1:-1]:
+            arguments.append(argument[1:-1])
+        else:
+            return parse_line(f"_.f({text})")[1]
+    return tuple(arguments)
+
+
+def parse_delay(line):
+    """Return the seconds slept by a stripped time.sleep line, str or bytes.
+
+    Return None when they aren't a literal number, like time.sleep(delay).
+    """
+    text = line[len(SLEEP):-1]
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="replace")
+    arguments = parse_arguments(text)
+    if len(arguments) == 1 and isinstance(arguments[0], (int, float)) and not isinstance(arguments[0], bool):
+        return float(arguments[0])
+    return None
+
+
+# Kind of event produced by each function of a capture
+KINDS = {
+    "moveTo": MOVE,
+    "mouseDown": MOUSE_DOWN,
+    "mouseUp": MOUSE_UP,
+    "scroll": SCROLL,
+    "keyDown": KEY_DOWN,
+    "keyUp": KEY_UP,
+    "press": KEY_DOWN,
+    "wait_for": CHECKPOINT,
+}
+
+
+# Smallest and largest number of arguments load reads for each kind
+ARGUMENT_COUNTS = {
+    MOVE: (2, 3),
+    MOUSE_DOWN: (2, 3),
+    MOUSE_UP: (2, 3),
+    SCROLL: (1, 1),
+    KEY_DOWN: (1, 1),
+    KEY_UP: (1, 1),
+    CHECKPOINT: (2, 4),
+}
+
+
+def key_code(name):
+    """Return the (code, flags) stored for a pyautogui key name."""
+    return keycodes.code(name)
+
+
+def _repetitions(line):
+    """Return the count of a `for _ in range(n):` line, None for other lines."""
+    stripped = line.strip()
+    if not stripped.startswith(("for " if isinstance(line, str) else b"for ")):
+        return None
+    if isinstance(stripped, bytes):
+        stripped = stripped.decode("utf-8", errors="replace")
+    match = LOOP.match(stripped)
+    return int(match.group(1)) if match else None
+
+
+def unroll(items):
+    """Yield the (key, line) items of a capture in replay order.
+
+    The body of every loop is yielded as many times as it is repeated,
+    without its indentation and without the line of the loop itself. The
+    keys, line numbers or offsets for instance, are passed through.
+    """
+    items = iter(items)
+    item = next(items, None)
+    while item is not None:
+        count = _repetitions(item[1])
+        if count is None:
+            yield item
+            item = next(items, None)
+            continue
+        body = []
+        item = next(items, None)
+        while item is not None and item[1][:1].isspace():
+            body.append(item)
+            item = next(items, None)
+        if not body:
+            continue
+        first = body[0][1]
+        indent = len(first) - len(first.lstrip())
+        body = [(key, line[indent:]) for key, line in body]
+        for _ in range(count):
+            yield from unroll(body)
+
+
+def load(path):
+    """Read a capture file back into an EventBuffer.
+
+    The time of each event is the sum of the delays preceding it. Raise
+    ValueError, with the line number, on a call of an event whose
+    arguments can't be read, like keyword arguments or variables.
+    """
+    events = EventBuffer(0.0)
+    now = 0.0
+    with open(path, encoding="utf-8") as f:
+        for number, line in unroll(enumerate(f, 1)):
+            line = line.strip()
+            if line.startswith("time.sleep("):
+                delay = parse_delay(line)
+                if delay is None:
+                    raise ValueError(f"line {number}: expected a literal delay: {line}")
+                now += delay
+                continue
+            match = CALL.match(line)
+            if match is None:
+                continue
+            kind = KINDS.get(match.group(2))
+            if kind is None:
+                continue
+            arguments = parse_arguments(match.group(3))
+            low, high = ARGUMENT_COUNTS[kind]
+            if not low <= len(arguments) <= high:
+                raise ValueError(f"line {number}: expected {low} to {high} literal arguments: {line}")
+            try:
+                if kind in (MOVE, MOUSE_DOWN, MOUSE_UP):
+                    code = BUTTONS.index(arguments[2]) if len(arguments) > 2 else 0
+                    events.append(now, kind, arguments[0], arguments[1], code)
+                elif kind == SCROLL:
+                    events.append(now, kind, code=arguments[0])
+                elif kind == CHECKPOINT:
+                    region, thumbnail = arguments[:2]
+                    events.append(now, kind, region[0], region[1], events.add_blob((region, thumbnail)))
+                else:
+                    code, flags = key_code(arguments[0])
+                    events.append(now, kind, code=code, flags=flags)
+                    if match.group(2) == "press":
+                        events.append(now, KEY_UP, code=code, flags=flags)
+            except (TypeError, ValueError, IndexError) as error:
+                raise ValueError(f"line {number}: {error}: {line}") from None
+    return events
+
+
+class CaptureIndex:
+    """Position and replay time of every event of a capture file.
+
+    Only the byte offset and the time of each event are kept in memory,
+    the lines are read from the file when they are requested so a capture
+    of millions of events can be browsed without loading it. The events of
+    a loop body have one row per repetition, all at the offset of the body.
+    The sleeps whose delay isn't a literal number add no time.
+
+    Keyword arguments:
+    path -- the capture file
+    """
+
+    def __init__(self, path):
+        """Scan the file once to build the index."""
+        self.path = path
+        self.offsets = array("q")
+        self.times = array("d")
+        self.duration = 0.0
+        self._file = open(path, "rb")
+        self._build()
+        self.row = functools.lru_cache(maxsize=ROW_CACHE_SIZE)(self._read_row)
+
+    def _build(self):
+        add_offset = self.offsets.append
+        add_time = self.times.append
+        now = 0.0
+        for offset, line in unroll(self._offsets()):
+            stripped = line.strip()
+            if stripped.startswith(SLEEP):
+                # A delay which isn't a literal, like time.sleep(delay), is unknown until replayed
+                now += parse_delay(stripped) or 0.0
+            elif BYTES_CALL.match(stripped):
+                add_offset(offset)
+                add_time(now)
+        self.duration = now
+
+    def _offsets(self):
+        offset = 0
+        for line in self._file:
+            yield offset, line
+            offset += len(line)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def _read_row(self, index):
+        self._file.seek(self.offsets[index])
+        line = self._file.readline().decode("utf-8", errors="replace")
+        function, arguments = parse_line(line) or (line.strip(), ())
+        return self.times[index], function, arguments
+
+    def find(self, time):
+        """Return the index of the last event replayed at or before time."""
+        return max(0, bisect_right(self.times, time) - 1)
+
+    def close(self):
+        """Release the capture file."""
+        self._file.close()
@@ -0,0 +1,102 @@
+"""Synchronize a replay with the screen instead of fixed delays."""
+
+# atbswp: Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# A checkpoint is a small thumbnail of the screen around the pointer taken
+# while recording. The replay polls the same region and moves on as soon
+# as it looks the same, so the capture doesn't need padded sleeps.
+import base64
+import time
+
+import numpy
+
+import pyautogui
+
+from PIL import ImageGrab
+
+
+SIZE = 64  # side of the region around the pointer, in pixels
+THUMBNAIL = 16  # side of the stored thumbnail
+TOLERANCE = 8.0  # mean absolute difference (0-255) still considered a match
+POLL_INTERVAL = 0.05
+TIMEOUT = 60.0
+
+
+def grab(region):
+    """Return the grayscale pixels of region (left, top, width, height)."""
+    left, top, width, height = region
+    image = ImageGrab.grab(bbox=(left, top, left + width, top + height),
+                           all_screens=True)
+    return numpy.asarray(image.convert("L"), dtype=numpy.uint8)
+
+
+def thumbnail(pixels, side=THUMBNAIL):
+    """Average blocks of pixels down to side x side."""
+    height, width = pixels.shape
+    block_height, block_width = height // side, width // side
+    blocks = pixels[:block_height * side, :block_width * side].reshape(
+        side, block_height, side, block_width)
+    return blocks.mean(axis=(1, 3)).astype(numpy.uint8)
+
+
+def region_around(x, y, size=SIZE):
+    """Return the region of `size` pixels centered on (x, y), inside the screen."""
+    screen_width, screen_height = pyautogui.size()
+    left = min(max(0, x - size // 2), max(0, screen_width - size))
+    top = min(max(0, y - size // 2), max(0, screen_height - size))
+    return (left, top, size, size)
+
+
+def encode(pixels):
+    """Return the thumbnail as text."""
+    return base64.b64encode(pixels.tobytes()).decode("ascii")
+
+
+def decode(text):
+    """Return the thumbnail stored as text."""
+    pixels = numpy.frombuffer(base64.b64decode(text), dtype=numpy.uint8)
+    return pixels.reshape(THUMBNAIL, THUMBNAIL)
+
+
+def take(x, y):
+    """Return the region around (x, y) and its thumbnail, as text."""
+    region = region_around(x, y)
+    return region, encode(thumbnail(grab(region)))
+
+
+def matches(region, reference, tolerance=TOLERANCE):
+    """Tell if the region currently looks like the reference thumbnail."""
+    current = thumbnail(grab(region)).astype(numpy.int16)
+    return numpy.abs(current - reference).mean() <= tolerance
+
+
+def wait_for(region, expected, timeout=TIMEOUT, tolerance=TOLERANCE, sleep=time.sleep):
+    """Block until the region matches the thumbnail.
+
+    Return False if it still doesn't after `timeout` seconds, the replay
+    then goes on like it would have after a fixed delay. The screen is
+    polled between calls to sleep, the replay passes its own to be
+    interrupted.
+    """
+    reference = decode(expected).astype(numpy.int16)
+    deadline = time.monotonic() + timeout
+    while not matches(region, reference, tolerance):
+        if time.monotonic() >= deadline:
+            return False
+        sleep(POLL_INTERVAL)
+    return True
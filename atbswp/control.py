@@ -16,24 +16,42 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import functools
 import os
 import py_compile
 import shutil
-import sys
 import tempfile
 import time
-from datetime import date
-from pathlib import Path
-from threading import Event
+from datetime import date, datetime
 from threading import Thread
 
 import pyautogui
 
 from pynput import keyboard, mouse
 
+import capture
+
+import checkpoint
+
+import engine
+
+import keycodes
+
+import listeners
+
+import playlist
+
+import replay
+
+import resources
+
+import rules
+
+import sampling
+
 import settings
 
-from custom_widgets import SliderDialog
+from custom_widgets import CaptureInspector, SliderDialog
 
 import wx
 import wx.adv
@@ -42,6 +60,8 @@ import wx.lib.newevent as NE
 
 TMP_PATH = os.path.join(tempfile.gettempdir(),
                         "atbswp-" + date.today().strftime("%Y%m%d"))
+# Items of the playlist replayed instead of the capture, None when a capture is loaded
+PLAYLIST = None
 HEADER = (
     f"#!/bin/env python3\n"
     f"# Created by atbswp v{settings.VERSION} "
@@ -52,7 +72,26 @@ HEADER = (
     f"pyautogui.FAILSAFE = False\n"
 )
 
-LOOKUP_SPECIAL_KEY = {}
+# (code, flags) stored in the capture for each key, every named key encoded ahead
+ENCODE_KEY = keycodes.Encoder(keyboard.Key)
+BUTTON_CODES = {mouse.Button.left: 0,
+                mouse.Button.right: 1,
+                mouse.Button.middle: 2}
+
+
+def function_key(keycode):
+    """Return the pynput key of a function key hotkey stored as a wx keycode."""
+    return getattr(keyboard.Key, f"f{keycode - wx.WXK_F1 + 1}", None)
+
+
+# Mouse and keyboard listeners living as long as the program
+LISTENERS = listeners.ListenerManager()
+
+
+def bind_hotkey(name):
+    """Keep the hotkey of the setting called name out of the captures."""
+    LISTENERS.bind(name, function_key(settings.CONFIG.get(name)))
+    settings.CONFIG.subscribe(name, lambda value: LISTENERS.bind(name, function_key(value)))
 
 
 class FileChooserCtrl:
@@ -74,11 +113,17 @@ class FileChooserCtrl:
         # TODO: Better input control
         if not path or not os.path.isfile(path):
             return None
-        with open(path, 'r') as f:
-            return f.read()
+        try:
+            with open(path, 'r', encoding="utf-8") as f:
+                return f.read()
+        except UnicodeDecodeError:
+            # Written by an older version, in the encoding of the locale
+            with open(path, 'r') as f:
+                return f.read()
 
     def load_file(self, event):
         """Load a capture manually chosen by the user."""
+        global PLAYLIST
         title = "Choose a capture file:"
         dlg = wx.FileDialog(self.parent,
                             message=title,
@@ -86,8 +131,10 @@ class FileChooserCtrl:
                             defaultFile="capture.py",
                             style=wx.DD_DEFAULT_STYLE)
         if dlg.ShowModal() == wx.ID_OK:
+            PLAYLIST = None
+            self.parent.pbc.show_playlist()
             self._capture = self.load_content(dlg.GetPath())
-            with open(TMP_PATH, 'w') as f:
+            with open(TMP_PATH, 'w', encoding="utf-8") as f:
                 f.write(self._capture)
         event.EventObject.Parent.panel.SetFocus()
         dlg.Destroy()
@@ -115,229 +162,164 @@ class RecordCtrl:
 
     Keyword arguments:
     capture -- current recording
-    mouse_sensibility -- granularity for mouse capture
+    decimator -- drops the redundant mouse moves
+    rules -- leaves out the events matching the recording rules
     """
 
     def __init__(self):
         """Initialize a new record."""
         self._header = HEADER
-        self._error = "### This key is not supported yet"
-
-        self._capture = [self._header]
-        self._lastx, self._lasty = pyautogui.position()
-        if getattr(sys, 'frozen', False):
-            self.path = sys._MEIPASS
-        else:
-            self.path = Path(__file__).parent.absolute()
-
-        LOOKUP_SPECIAL_KEY[keyboard.Key.alt] = 'alt'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.alt_l] = 'altleft'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.alt_r] = 'altright'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.alt_gr] = 'altright'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.backspace] = 'backspace'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.caps_lock] = 'capslock'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.cmd] = 'winleft'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.cmd_r] = 'winright'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.ctrl] = 'ctrlleft'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.ctrl_r] = 'ctrlright'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.delete] = 'delete'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.down] = 'down'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.end] = 'end'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.enter] = 'enter'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.esc] = 'esc'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f1] = 'f1'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f2] = 'f2'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f3] = 'f3'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f4] = 'f4'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f5] = 'f5'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f6] = 'f6'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f7] = 'f7'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f8] = 'f8'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f9] = 'f9'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f10] = 'f10'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f11] = 'f11'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.f12] = 'f12'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.home] = 'home'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.left] = 'left'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.page_down] = 'pagedown'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.page_up] = 'pageup'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.right] = 'right'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.shift] = 'shift_left'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.shift_r] = 'shiftright'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.space] = 'space'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.tab] = 'tab'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.up] = 'up'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.media_play_pause] = 'playpause'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.insert] = 'insert'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.num_lock] = 'num_lock'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.pause] = 'pause'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.print_screen] = 'print_screen'
-        LOOKUP_SPECIAL_KEY[keyboard.Key.scroll_lock] = 'scroll_lock'
-
-    def write_mouse_action(self, engine="pyautogui", move="", parameters=""):
-        """Append a new mouse move to capture.
-
-        Keyword arguments:
-        engine -- the replay library used (default pyautogui)
-        move -- the mouse movement (mouseDown, mouseUp, scroll, moveTo)
-        parameters -- the details of the movement
-        """
-        def isinteger(s):
-            try:
-                int(s)
-                return True
-            except:
-                return False
-
-        if move == "moveTo":
-            coordinates = [int(s)
-                           for s in parameters.split(", ") if isinteger(s)]
-            if abs(coordinates[0] - self._lastx) < self.mouse_sensibility \
-               and abs(coordinates[1] - self._lasty) < self.mouse_sensibility:
-                return
-            else:
-                self._lastx, self._lasty = coordinates
-        self._capture.append(engine + "." + move + '(' + parameters + ')')
-
-    def write_keyboard_action(self, engine="pyautogui", move="", key=""):
-        """Append keyboard actions to the class variable capture.
-
-        Keyword arguments:
-        - engine: the module which will be used for the replay
-        - move: keyDown | keyUp
-        - key: The key pressed
-        """
-        suffix = "(" + repr(key) + ")"
-        if move == "keyDown":
-            # Corner case: Multiple successive keyDown
-            if move + suffix in self._capture[-1]:
-                move = 'press'
-                self._capture[-1] = engine + "." + move + suffix
-        self._capture.append(engine + "." + move + suffix)
+        self._capture = capture.EventBuffer()
+        self.decimator = sampling.MouseDecimator()
+        self.rules = rules.Filter()
+        self.checkpoint_key = None
+        self.recording = False
+        self.engine = None
 
     def on_move(self, x, y):
         """Triggered by a mouse move."""
         if not self.recording:
-            return False
-        b = time.perf_counter()
-        timeout = float(b - self.last_time)
-        if timeout > 0.0:
-            self._capture.append(f"time.sleep({timeout})")
-        self.last_time = b
-        self.write_mouse_action(move="moveTo", parameters=f"{x}, {y}")
+            return
+        b = LISTENERS.now()
+        if self.rules.move(b, x, y):
+            return
+        if self.decimator.accept(b, x, y):
+            self._capture.append(b, capture.MOVE, x, y)
+
+    def flush_mouse(self):
+        """Record the last move dropped by the decimator, if any."""
+        pending = self.decimator.flush()
+        if pending is not None:
+            self._capture.append(pending[0], capture.MOVE, pending[1], pending[2])
 
     def on_click(self, x, y, button, pressed):
         """Triggered by a mouse click."""
         if not self.recording:
-            return False
-        if pressed:
-            if button == mouse.Button.left:
-                self.write_mouse_action(
-                    move="mouseDown", parameters=f"{x}, {y}, 'left'")
-            elif button == mouse.Button.right:
-                self.write_mouse_action(
-                    move="mouseDown", parameters=f"{x}, {y}, 'right'")
-            elif button == mouse.Button.middle:
-                self.write_mouse_action(
-                    move="mouseDown", parameters=f"{x}, {y}, 'middle'")
-            else:
-                wx.LogError("Mouse Button not recognized")
-        else:
-            if button == mouse.Button.left:
-                self.write_mouse_action(
-                    move="mouseUp", parameters=f"{x}, {y}, 'left'")
-            elif button == mouse.Button.right:
-                self.write_mouse_action(
-                    move="mouseUp", parameters=f"{x}, {y}, 'right'")
-            elif button == mouse.Button.middle:
-                self.write_mouse_action(
-                    move="mouseUp", parameters=f"{x}, {y}, 'middle'")
-            else:
-                wx.LogError("Mouse Button not recognized")
+            return
+        b = LISTENERS.now()
+        if self.rules.click(b, x, y, button, pressed):
+            return
+        code = BUTTON_CODES.get(button)
+        if code is None:
+            wx.LogError("Mouse Button not recognized")
+            return
+        kind = capture.MOUSE_DOWN if pressed else capture.MOUSE_UP
+        self.flush_mouse()
+        self._capture.append(b, kind, x, y, code)
 
     def on_scroll(self, x, y, dx, dy):
         """Triggered by a mouse wheel scroll."""
         if not self.recording:
-            return False
-        self.write_mouse_action(move="scroll", parameters=f"{y}")
+            return
+        b = LISTENERS.now()
+        if self.rules.scroll(b, x, y):
+            return
+        self.flush_mouse()
+        self._capture.append(b, capture.SCROLL, x, y, dy)
 
-    def on_press(self, key):
-        """Triggered by a key press."""
-        b = time.perf_counter()
-        timeout = float(b - self.last_time)
-        if timeout > 0.0:
-            self._capture.append(f"time.sleep({timeout})")
-        self.last_time = b
+    def write_keyboard_action(self, kind, key):
+        """Append a key event to the capture.
 
-        try:
-            # Ignore presses on Fn key
-            if key.char:
-                self.write_keyboard_action(move='keyDown', key=key.char)
+        Keyword arguments:
+        kind -- capture.KEY_DOWN or capture.KEY_UP
+        key -- the pynput key
+        """
+        b = LISTENERS.now()
+        if self.rules.key(b, key, kind == capture.KEY_DOWN):
+            return
+        encoded = ENCODE_KEY(key)
+        # Ignore the keys without character, name nor virtual key code, like Fn
+        if encoded is not None:
+            self.flush_mouse()
+            self._capture.append(b, kind, code=encoded[0], flags=encoded[1])
+
+    def add_checkpoint(self):
+        """Record what the screen looks like around the pointer."""
+        self.flush_mouse()
+        region, thumbnail = checkpoint.take(*pyautogui.position())
+        code = self._capture.add_blob((region, thumbnail))
+        self._capture.append(LISTENERS.now(), capture.CHECKPOINT,
+                             region[0], region[1], code)
 
-        except AttributeError:
-            self.write_keyboard_action(move="keyDown",
-                                       key=LOOKUP_SPECIAL_KEY.get(key,
-                                                                  self._error))
+    def on_press(self, key):
+        """Triggered by a key press."""
+        if not self.recording:
+            return
+        if key == self.checkpoint_key:
+            self.add_checkpoint()
+        else:
+            self.write_keyboard_action(capture.KEY_DOWN, key)
 
     def on_release(self, key):
         """Triggered by a key released."""
         if not self.recording:
-            return False
-        else:
-            if len(str(key)) <= 3:
-                self.write_keyboard_action(move='keyUp', key=key)
-            else:
-                self.write_keyboard_action(move="keyUp",
-                                           key=LOOKUP_SPECIAL_KEY.get(key,
-                                                                      self._error))
+            return
+        if key != self.checkpoint_key:
+            self.write_keyboard_action(capture.KEY_UP, key)
+
+    def drop_clicks_on(self, rect):
+        """Forget the clicks ending the capture which landed in rect, like the one on the stop button."""
+        capture.drop_clicks_on(self._capture, rect.Contains)
 
     def recording_timer(event):
         """Set the recording timer."""
-        # Workaround for user upgrading from a previous version
-        try:
-            current_value = settings.CONFIG.getint(
-                'DEFAULT', 'Recording Timer')
-        except:
-            current_value = 0
-
+        current_value = settings.CONFIG.recording_timer
         dialog = wx.NumberEntryDialog(None, message="Choose an amount of time (seconds)",
                                       prompt="", caption="Recording Timer", value=current_value, min=0, max=999)
         dialog.ShowModal()
         new_value = dialog.Value
         dialog.Destroy()
-        settings.CONFIG['DEFAULT']['Recording Timer'] = str(new_value)
+        settings.CONFIG.recording_timer = new_value
+
+    def mouse_sampling(event):
+        """Set how densely the mouse moves are recorded."""
+        dialog = wx.NumberEntryDialog(None, message="Maximum mouse moves recorded per second (0 for no limit)",
+                                      prompt="", caption="Mouse Sampling", value=settings.CONFIG.mouse_max_rate,
+                                      min=0, max=1000)
+        if dialog.ShowModal() == wx.ID_OK:
+            settings.CONFIG.mouse_max_rate = dialog.Value
+        dialog.Destroy()
+        dialog = wx.NumberEntryDialog(None, message="Minimum distance between two recorded moves (pixels)",
+                                      prompt="", caption="Mouse Sampling", value=settings.CONFIG.mouse_min_distance,
+                                      min=0, max=999)
+        if dialog.ShowModal() == wx.ID_OK:
+            settings.CONFIG.mouse_min_distance = dialog.Value
+        dialog.Destroy()
 
-    def mouse_speed(event):
-        """Set the mouse speed."""
-        # Workaround for user upgrading from a previous version
+    def recording_rules(event):
+        """Choose the rules leaving events out of the recordings."""
+        with wx.FileDialog(None, "Choose the recording rules:", wildcard="Rules (*.json)|*.json",
+                           style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as dialog:
+            if dialog.ShowModal() == wx.ID_OK:
+                try:
+                    rules.load(dialog.GetPath())
+                except (OSError, ValueError) as error:
+                    wx.LogError(f"The recording rules are not valid: {error}")
+                    return
+                settings.CONFIG.recording_rules = dialog.GetPath()
+            elif settings.CONFIG.recording_rules and \
+                    wx.MessageBox("Record every event again?", "Recording Rules", wx.YES_NO) == wx.YES:
+                settings.CONFIG.recording_rules = ""
+
+    def load_rules(self):
+        """Return the filter of the recording rules, leaving nothing out when there are none."""
+        path = settings.CONFIG.recording_rules
+        if not path:
+            return rules.Filter()
         try:
-            current_value = settings.CONFIG.getint(
-                'DEFAULT', 'Mouse Speed')
-        except:
-            current_value = 21
-
-        dialog = wx.NumberEntryDialog(None, message="Choose an amount of time (seconds)",
-                                      prompt="", caption="Recording Timer", value=current_value, min=0, max=9999)
-        dialog.ShowModal()
-        new_value = dialog.Value
-        dialog.Destroy()
-        settings.CONFIG['DEFAULT']['Mouse Speed'] = str(new_value)
+            return rules.Filter(rules.load(path))
+        except (OSError, ValueError) as error:
+            wx.LogError(f"The recording rules are not valid, recording every event: {error}")
+            return rules.Filter()
 
     def action(self, event):
         """Triggered when the recording button is clicked on the GUI."""
-        self.mouse_sensibility = settings.CONFIG.getint("DEFAULT", "Mouse Speed")
-        listener_mouse = mouse.Listener(
-            on_move=self.on_move,
-            on_click=self.on_click,
-            on_scroll=self.on_scroll)
-        listener_keyboard = keyboard.Listener(
-            on_press=self.on_press,
-            on_release=self.on_release)
+        global PLAYLIST
+        self.decimator = sampling.MouseDecimator(settings.CONFIG.mouse_max_rate,
+                                                 settings.CONFIG.mouse_min_distance)
+        self.checkpoint_key = function_key(settings.CONFIG.checkpoint_hotkey)
 
-        try:
-            self.timer = settings.CONFIG.getint("DEFAULT", "Recording Timer")
-        except:
-            self.timer = 0
+        self.timer = settings.CONFIG.recording_timer
 
         if event.EventObject.Value:
             if self.timer > 0:
@@ -351,25 +333,64 @@ class RecordCtrl:
                 self.wx_timer.Start(1000)
                 self.countdown_dialog.ShowModal()
 
-            listener_keyboard.start()
-            listener_mouse.start()
-            self.last_time = time.perf_counter()
+            self._capture.clear(time.perf_counter())
+            self.decimator.reset()
+            self.rules = self.load_rules()
+            self.rules.reset(self._capture.start)
             self.recording = True
-            recording_state = wx.Icon(os.path.join(
-                self.path, "img", "icon-recording.png"))
+            if settings.CONFIG.capture_process:
+                self.start_engine()
+            if self.engine is None:
+                LISTENERS.arm(self)
+            recording_state = resources.icon("icon-recording.png")
+            tooltip = "atbswp: recording"
         else:
             self.recording = False
-            with open(TMP_PATH, 'w') as f:
-                # Remove the recording trigger event
-                self._capture.pop()
-                self._capture.pop()
-                f.seek(0)
-                f.write("\n".join(self._capture))
-                f.truncate()
-            self._capture = [self._header]
-            recording_state = wx.Icon(
-                os.path.join(self.path, "img", "icon.png"))
-        event.GetEventObject().GetParent().taskbar.SetIcon(recording_state)
+            if self.engine is not None:
+                kept, dropped, filtered = self.stop_engine()
+            else:
+                LISTENERS.disarm(self)
+                self.flush_mouse()
+                kept, dropped, filtered = self.decimator.kept, self.decimator.dropped, self.rules.total
+            self.drop_clicks_on(event.GetEventObject().GetTopLevelParent().GetScreenRect())
+            with open(TMP_PATH, 'w', encoding="utf-8") as f:
+                f.write(capture.serialize(self._capture, self._header))
+            self._capture.clear()
+            PLAYLIST = None
+            event.GetEventObject().GetParent().pbc.show_playlist()
+            recording_state = resources.icon("icon.png")
+            tooltip = f"atbswp: {kept} mouse moves recorded, {dropped} dropped, {filtered} events filtered"
+        event.GetEventObject().GetParent().taskbar.SetIcon(recording_state, tooltip)
+
+    def start_engine(self):
+        """Record in a separate process, fall back to the listeners of the GUI if it fails."""
+        ignored = [function_key(settings.CONFIG.get(name))
+                   for name in ("recording_hotkey", "playback_hotkey", "flight_recorder_hotkey")]
+        options = {"max_rate": settings.CONFIG.mouse_max_rate,
+                   "min_distance": settings.CONFIG.mouse_min_distance,
+                   "ignored_keys": [key.name for key in ignored if key is not None],
+                   "checkpoint_key": self.checkpoint_key.name if self.checkpoint_key is not None else None,
+                   "rules": self.rules.rules}
+        self.engine = engine.CaptureProcess(options)
+        try:
+            self.engine.start(self._capture.start)
+        except (RuntimeError, OSError) as error:
+            wx.LogError(f"Cannot start the capture process, recording in atbswp instead: {error}")
+            self.engine = None
+
+    def stop_engine(self):
+        """Stop the capture process, take its events, return its moves kept and dropped and its events filtered."""
+        events = self.engine.stop()
+        if events is None:
+            wx.LogError("The capture process stopped unexpectedly, the capture may be incomplete")
+            events = self.engine.events
+        if self.engine.overflow:
+            wx.LogError(f"{self.engine.overflow} events were lost by the capture process")
+        self._capture = events
+        kept, dropped = self.engine.counters
+        filtered = self.engine.filtered
+        self.engine = None
+        return kept, dropped, filtered
 
     def update_timer(self, event):
         """Check if it's the time to start to record"""
@@ -383,65 +404,221 @@ class RecordCtrl:
                 self.timer, f"The recording will start in {self.timer} second(s)")
 
 
+class FlightRecorderCtrl(RecordCtrl):
+    """Control class for the flight recorder.
+
+    While enabled it records in the background into a RingBuffer, so only
+    the last events are kept in a fixed amount of memory. The dump hotkey
+    writes them to a new capture file without stopping the recording.
+
+    The recording rules apply like to the other recordings. As the flight
+    recorder never stops, their after and before count the seconds since
+    it was enabled, not since the start of the events dumped.
+
+    Keyword arguments:
+    parent -- the main frame
+    """
+
+    def __init__(self, parent):
+        """Initialize a stopped flight recorder."""
+        super().__init__()
+        self.parent = parent
+        self.started = 0.0
+        settings.CONFIG.subscribe("flight_recorder_hotkey", self.on_hotkey_change)
+        settings.CONFIG.subscribe("flight_recorder_events", self.on_size_change)
+        settings.CONFIG.subscribe("recording_rules", self.on_rules_change)
+
+    def start(self):
+        """Start recording in the background."""
+        self._capture = capture.RingBuffer(settings.CONFIG.flight_recorder_events)
+        self.decimator = sampling.MouseDecimator(settings.CONFIG.mouse_max_rate,
+                                                 settings.CONFIG.mouse_min_distance)
+        self.started = time.perf_counter()
+        self.rules = self.load_rules()
+        self.rules.reset(self.started)
+        self.checkpoint_key = function_key(settings.CONFIG.checkpoint_hotkey)
+        self.recording = True
+        self.on_hotkey_change(settings.CONFIG.flight_recorder_hotkey)
+        LISTENERS.arm(self)
+
+    def stop(self):
+        """Stop recording and forget the events."""
+        LISTENERS.disarm(self)
+        LISTENERS.unbind("flight_recorder_hotkey")
+        self.recording = False
+        self._capture.clear()
+
+    def on_hotkey_change(self, value):
+        """Follow the dump hotkey setting."""
+        if self.recording:
+            LISTENERS.bind("flight_recorder_hotkey", function_key(value), self.dump)
+
+    def on_rules_change(self, value):
+        """Follow the recording rules setting, still counting the time since the start."""
+        if self.recording:
+            event_filter = self.load_rules()
+            event_filter.reset(self.started)
+            self.rules = event_filter
+
+    def on_size_change(self, value):
+        """Allocate a buffer of the new size."""
+        if self.recording:
+            self.stop()
+            self.start()
+
+    def dump(self):
+        """Write the last events to a new capture file, in the background."""
+        self.flush_mouse()
+        events = self._capture.snapshot(settings.CONFIG.flight_recorder_minutes * 60)
+        Thread(target=self.write, args=(events,), daemon=True).start()
+
+    def write(self, events):
+        """Save a snapshot of the flight recorder."""
+        directory = settings.CONFIG.flight_recorder_directory or tempfile.gettempdir()
+        path = os.path.join(directory, f"atbswp-flight-{datetime.now():%Y%m%d-%H%M%S-%f}.py")
+        try:
+            settings.atomic_write(path, capture.serialize(events, self._header))
+        except OSError as error:
+            wx.CallAfter(wx.LogError, f"Cannot save the flight recorder in {path}: {error}")
+            return
+        wx.CallAfter(self.parent.taskbar.SetIcon, resources.icon("icon.png"),
+                     f"atbswp: last {len(events)} events saved in {path}")
+
+    def action(self, event):
+        """Toggle the flight recorder."""
+        settings.CONFIG.flight_recorder = not settings.CONFIG.flight_recorder
+        if settings.CONFIG.flight_recorder:
+            self.start()
+        else:
+            self.stop()
+
+    @staticmethod
+    def limits(event):
+        """Set how much the flight recorder keeps."""
+        dialog = wx.NumberEntryDialog(None, message="Minutes of activity saved by the flight recorder",
+                                      prompt="", caption="Flight Recorder",
+                                      value=settings.CONFIG.flight_recorder_minutes, min=1, max=1440)
+        if dialog.ShowModal() == wx.ID_OK:
+            settings.CONFIG.flight_recorder_minutes = dialog.Value
+        dialog.Destroy()
+        dialog = wx.NumberEntryDialog(None, message="Maximum number of events kept in memory",
+                                      prompt="", caption="Flight Recorder",
+                                      value=settings.CONFIG.flight_recorder_events, min=1000, max=10000000)
+        if dialog.ShowModal() == wx.ID_OK:
+            settings.CONFIG.flight_recorder_events = dialog.Value
+        dialog.Destroy()
+
+
 class PlayCtrl:
-    """Control class for the play button."""
+    """Control class for the play button.
+
+    Keyword arguments:
+    parent -- the main frame
+    """
 
     global TMP_PATH
 
-    def __init__(self):
-        self.count = settings.CONFIG.getint('DEFAULT', 'Repeat Count')
-        self.infinite = settings.CONFIG.getboolean(
-            'DEFAULT', 'Infinite Playback')
+    def __init__(self, parent):
+        self.parent = parent
+        self.count = settings.CONFIG.repeat_count
+        self.infinite = settings.CONFIG.infinite_playback
         self.count_was_updated = False
+        self.cache = replay.ProgramCache()
+        # Compiled capture of each item of the playlist
+        self.item_caches = {}
+        self.player = replay.Player()
         self.ThreadEndEvent, self.EVT_THREAD_END = NE.NewEvent()
 
-    def play(self, capture, toggle_button):
-        """Play the loaded capture."""
-        toggle_value = True
-        for line in capture:
-            if self.play_thread.ended():
+    def load(self, path):
+        """Return the compiled capture, only compiled again when the file or the mouse rate changed."""
+        return self.cache.load(path, settings.CONFIG.replay_mouse_rate)
+
+    def load_item(self, path):
+        """Return the compiled capture of a playlist item, called ahead of its replay by the player."""
+        cache = self.item_caches.setdefault(path, replay.ProgramCache())
+        return cache.load(path, settings.CONFIG.replay_mouse_rate)
+
+    def load_playlist(self, event):
+        """Replay a playlist chosen by the user instead of the capture."""
+        global PLAYLIST
+        with wx.FileDialog(None, "Choose a playlist:", wildcard="Playlists (*.json)|*.json",
+                           style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST) as dialog:
+            if dialog.ShowModal() == wx.ID_CANCEL:
+                return
+            path = dialog.GetPath()
+            try:
+                PLAYLIST = playlist.load(path)
+            except (OSError, ValueError) as error:
+                wx.LogError(f"The playlist is not valid: {error}")
                 return
-            exec(line)
+        self.item_caches = {}
+        self.show_playlist(os.path.basename(path))
 
-        if self.count <= 0 and not self.infinite:
-            toggle_value = False
-        event = self.ThreadEndEvent(
-            count=self.count, toggle_value=toggle_value)
-        wx.PostEvent(toggle_button.Parent, event)
+    def show_playlist(self, name=None):
+        """Tell on the play button and the tray icon whether Play replays the playlist or the capture."""
+        tooltip = self.parent.app_text[3]
+        if PLAYLIST is not None:
+            tooltip = f"{tooltip}: {name} ({len(PLAYLIST)} captures)"
+            self.parent.taskbar.SetIcon(resources.icon("icon.png"), f"atbswp: playing the playlist {name}")
+        self.parent.play_button.SetToolTip(tooltip)
 
-        btn_event = wx.CommandEvent(wx.wxEVT_TOGGLEBUTTON)
-        btn_event.EventObject = toggle_button
-        self.action(btn_event)
+    @staticmethod
+    def mouse_rate(event):
+        """Set the fixed rate of the replayed mouse moves."""
+        rates = "/".join(map(str, sampling.REPLAY_RATES))
+        dialog = wx.NumberEntryDialog(None, message=f"Mouse moves replayed per second ({rates}), 0 for as recorded",
+                                      prompt="", caption="Mouse Replay Rate", value=settings.CONFIG.replay_mouse_rate,
+                                      min=0, max=1000)
+        if dialog.ShowModal() == wx.ID_OK:
+            settings.CONFIG.replay_mouse_rate = dialog.Value
+        dialog.Destroy()
+
+    def report(self, toggle_button, remaining, playing, error):
+        """Triggered by the player after each replay."""
+        self.count = remaining
+        if not playing:
+            self.count_was_updated = False
+        if error is not None:
+            wx.CallAfter(wx.LogError, f"The replay failed: {error}")
+        event = self.ThreadEndEvent(count=remaining, toggle_value=playing)
+        wx.PostEvent(toggle_button.Parent, event)
 
     def action(self, event):
         """Replay a `count` number of time."""
         toggle_button = event.GetEventObject()
         toggle_button.Parent.panel.SetFocus()
-        self.infinite = settings.CONFIG.getboolean(
-            'DEFAULT', 'Infinite Playback')
+        self.infinite = settings.CONFIG.infinite_playback
         if toggle_button.Value:
             if not self.count_was_updated:
-                self.count = settings.CONFIG.getint('DEFAULT', 'Repeat Count')
+                self.count = settings.CONFIG.repeat_count
                 self.count_was_updated = True
+            if PLAYLIST is not None:
+                if self.count > 0 or self.infinite:
+                    # The captures are loaded as they come, an invalid one ends the replay with an error
+                    self.player.start_playlist(PLAYLIST, self.load_item, self.count, self.infinite,
+                                               functools.partial(self.report, toggle_button))
+                return
             if TMP_PATH is None or not os.path.isfile(TMP_PATH):
                 wx.LogError("No capture loaded")
                 event = self.ThreadEndEvent(
                     count=self.count, toggle_value=False)
                 wx.PostEvent(toggle_button.Parent, event)
                 return
-            with open(TMP_PATH, 'r') as f:
-                capture = f.readlines()
+            try:
+                self.load(TMP_PATH)
+            except (SyntaxError, ValueError, OSError) as error:
+                wx.LogError(f"The capture is not valid: {error}")
+                event = self.ThreadEndEvent(
+                    count=self.count, toggle_value=False)
+                wx.PostEvent(toggle_button.Parent, event)
+                return
             if self.count > 0 or self.infinite:
-                self.count = self.count - 1 if not self.infinite else self.count
-                self.play_thread = PlayThread()
-                self.play_thread.daemon = True
-                self.play_thread = PlayThread(target=self.play,
-                                              args=(capture, toggle_button,))
-                self.play_thread.start()
+                # The file is checked before each replay, a new capture is picked up
+                self.player.start(lambda: self.load(TMP_PATH), self.count, self.infinite,
+                                  functools.partial(self.report, toggle_button))
         else:
-            self.play_thread.end()
+            self.player.end()
             self.count_was_updated = False
-            settings.save_config()
 
 
 class CompileCtrl:
@@ -492,67 +669,104 @@ class SettingsCtrl:
     @staticmethod
     def infinite_playback(event):
         """Toggle infinite playback."""
-        current_value = settings.CONFIG.getboolean(
-            'DEFAULT', 'Infinite Playback')
-        settings.CONFIG['DEFAULT']['Infinite Playback'] = str(
-            not current_value)
+        settings.CONFIG.infinite_playback = not settings.CONFIG.infinite_playback
+
+    @staticmethod
+    def capture_process(event):
+        """Toggle recording in a separate process."""
+        settings.CONFIG.capture_process = not settings.CONFIG.capture_process
 
     def repeat_count(self, event):
         """Set the repeat count."""
-        current_value = settings.CONFIG.getint('DEFAULT', 'Repeat Count')
+        current_value = settings.CONFIG.repeat_count
         dialog = wx.NumberEntryDialog(None, message="Choose a repeat count",
                                       prompt="", caption="Repeat Count", value=current_value, min=1, max=999)
         dialog.ShowModal()
-        new_value = str(dialog.Value)
+        new_value = dialog.Value
         dialog.Destroy()
-        settings.CONFIG['DEFAULT']['Repeat Count'] = new_value
-        self.main_dialog.remaining_plays.Label = new_value
+        settings.CONFIG.repeat_count = new_value
 
     @staticmethod
     def recording_hotkey(event):
         """Set the recording hotkey."""
-        current_value = settings.CONFIG.getint('DEFAULT', 'Recording Hotkey')
+        current_value = settings.CONFIG.recording_hotkey
         dialog = SliderDialog(None, title="Choose a function key: F2-12", size=(500, 50),
                               default_value=current_value-339, min_value=2, max_value=12)
         dialog.ShowModal()
         new_value = dialog.value + 339
-        if new_value == settings.CONFIG.getint('DEFAULT', 'Playback Hotkey'):
+        if new_value == settings.CONFIG.playback_hotkey:
             dlg = wx.MessageDialog(
                 None, "Recording hotkey should be different from Playback one", "Error", wx.OK | wx.ICON_ERROR)
             dlg.ShowModal()
             dlg.Destroy()
         dialog.Destroy()
-        settings.CONFIG['DEFAULT']['Recording Hotkey'] = str(new_value)
+        settings.CONFIG.recording_hotkey = new_value
 
     @staticmethod
     def playback_hotkey(event):
         """Set the playback hotkey."""
-        current_value = settings.CONFIG.getint('DEFAULT', 'Playback Hotkey')
+        current_value = settings.CONFIG.playback_hotkey
         dialog = SliderDialog(None, title="Choose a function key: F2-12", size=(500, 50),
                               default_value=current_value-339, min_value=2, max_value=12)
         dialog.ShowModal()
         new_value = dialog.value + 339
-        if new_value == settings.CONFIG.getint('DEFAULT', 'Recording Hotkey'):
+        if new_value == settings.CONFIG.recording_hotkey:
             dlg = wx.MessageDialog(
                 None, "Playback hotkey should be different from Recording one", "Error", wx.OK | wx.ICON_ERROR)
             dlg.ShowModal()
             dlg.Destroy()
         dialog.Destroy()
-        settings.CONFIG['DEFAULT']['Playback Hotkey'] = str(new_value)
+        settings.CONFIG.playback_hotkey = new_value
+
+    @staticmethod
+    def checkpoint_hotkey(event):
+        """Set the hotkey recording a checkpoint of the screen."""
+        current_value = settings.CONFIG.checkpoint_hotkey
+        dialog = SliderDialog(None, title="Choose a function key: F2-12", size=(500, 50),
+                              default_value=current_value-339, min_value=2, max_value=12)
+        dialog.ShowModal()
+        new_value = dialog.value + 339
+        dialog.Destroy()
+        if new_value in (settings.CONFIG.recording_hotkey, settings.CONFIG.playback_hotkey,
+                         settings.CONFIG.flight_recorder_hotkey):
+            dlg = wx.MessageDialog(
+                None, "Checkpoint hotkey should be different from the other ones", "Error",
+                wx.OK | wx.ICON_ERROR)
+            dlg.ShowModal()
+            dlg.Destroy()
+            return
+        settings.CONFIG.checkpoint_hotkey = new_value
+
+    @staticmethod
+    def flight_recorder_hotkey(event):
+        """Set the hotkey saving the flight recorder."""
+        current_value = settings.CONFIG.flight_recorder_hotkey
+        dialog = SliderDialog(None, title="Choose a function key: F2-12", size=(500, 50),
+                              default_value=current_value-339, min_value=2, max_value=12)
+        dialog.ShowModal()
+        new_value = dialog.value + 339
+        dialog.Destroy()
+        if new_value in (settings.CONFIG.recording_hotkey, settings.CONFIG.playback_hotkey,
+                         settings.CONFIG.checkpoint_hotkey):
+            dlg = wx.MessageDialog(
+                None, "Flight recorder hotkey should be different from the other ones", "Error",
+                wx.OK | wx.ICON_ERROR)
+            dlg.ShowModal()
+            dlg.Destroy()
+            return
+        settings.CONFIG.flight_recorder_hotkey = new_value
 
     def always_on_top(self, event):
         """Toggle the always on top setting."""
-        current_value = settings.CONFIG['DEFAULT']['Always On Top']
         style = self.main_dialog.GetWindowStyle()
         self.main_dialog.SetWindowStyle(style ^ wx.STAY_ON_TOP)
-        settings.CONFIG['DEFAULT']['Always On Top'] = str(not current_value)
+        settings.CONFIG.always_on_top = not settings.CONFIG.always_on_top
 
     def language(self, event):
         """Manage the language among the one available."""
         menu = event.EventObject
         item = menu.FindItemById(event.Id)
-        settings.CONFIG['DEFAULT']['Language'] = item.GetItemLabelText()
-        settings.save_config()
+        settings.CONFIG.language = item.GetItemLabelText()
         dialog = wx.MessageDialog(None,
                                   message="Restart the program to apply modifications",
                                   pos=wx.DefaultPosition)
@@ -569,15 +783,18 @@ class HelpCtrl:
         wx.LaunchDefaultBrowser(url, flags=0)
 
 
-class PlayThread(Thread):
-    """Thread with an end method triggered by a click on the Toggle button."""
-
-    def __init__(self, *args, **kwargs):
-        super(PlayThread, self).__init__(*args, **kwargs)
-        self._end = Event()
+class InspectCtrl:
+    """Control class for the capture inspector."""
 
-    def end(self):
-        self._end.set()
+    def __init__(self, parent):
+        """Set the parent frame."""
+        self.parent = parent
 
-    def ended(self):
-        return self._end.isSet()
+    def action(self, event):
+        """Open the capture currently loaded in the inspector."""
+        if not os.path.isfile(TMP_PATH):
+            wx.LogError("No capture loaded")
+            return
+        with wx.BusyCursor():
+            index = capture.CaptureIndex(TMP_PATH)
+        CaptureInspector(self.parent, index).Show()
@@ -66,3 +66,83 @@ class SliderDialog(wx.Dialog):
     def value(self, value):
         """Setter."""
         self._value = value
+
+
+class EventList(wx.ListCtrl):
+    """Virtual list showing the rows of a capture index on demand."""
+
+    columns = (("#", 80), ("Time (s)", 100), ("Event", 160), ("X", 60), ("Y", 60), ("Details", 200))
+
+    def __init__(self, parent, index):
+        """Display the events of index, a capture.CaptureIndex."""
+        super(EventList, self).__init__(parent, style=wx.LC_REPORT | wx.LC_VIRTUAL | wx.LC_SINGLE_SEL)
+        self.index = index
+        for position, (title, width) in enumerate(self.columns):
+            self.InsertColumn(position, title, width=width)
+        self.SetItemCount(len(index))
+
+    def OnGetItemText(self, item, column):
+        """Format the cell asked by the list."""
+        if column == 0:
+            return str(item)
+        time, function, arguments = self.index.row(item)
+        name = function.rpartition(".")[2]
+        if column == 1:
+            return f"{time:.3f}"
+        if column == 2:
+            return name
+        return self.split_arguments(name, arguments)[column - 3]
+
+    @staticmethod
+    def split_arguments(name, arguments):
+        """Return the x, y and remaining arguments of a call as text."""
+        if name == "wait_for" and arguments and isinstance(arguments[0], tuple) and len(arguments[0]) == 4:
+            left, top, width, height = arguments[0]
+            return str(left), str(top), f"{width}x{height} region"
+        if name in ("moveTo", "mouseDown", "mouseUp") and len(arguments) >= 2:
+            return str(arguments[0]), str(arguments[1]), ", ".join(map(str, arguments[2:]))
+        return "", "", ", ".join(map(str, arguments))
+
+
+class CaptureInspector(wx.Frame):
+    """Window browsing the events of a capture without loading it."""
+
+    def __init__(self, parent, index):
+        """Build the window around index, a capture.CaptureIndex."""
+        super(CaptureInspector, self).__init__(parent, title=f"Capture: {index.path}", size=(720, 520))
+        self.index = index
+        panel = wx.Panel(self)
+        self.summary = wx.StaticText(panel, label=f"{len(index)} events, {index.duration:.1f} seconds")
+        self.time_entry = wx.TextCtrl(panel, style=wx.TE_PROCESS_ENTER)
+        self.time_entry.SetHint("Go to time (s)")
+        self.list = EventList(panel, index)
+
+        toolbar = wx.BoxSizer(wx.HORIZONTAL)
+        toolbar.Add(self.summary, 1, wx.ALIGN_CENTER_VERTICAL | wx.ALL, 5)
+        toolbar.Add(self.time_entry, 0, wx.ALL, 5)
+        sizer = wx.BoxSizer(wx.VERTICAL)
+        sizer.Add(toolbar, 0, wx.EXPAND)
+        sizer.Add(self.list, 1, wx.EXPAND)
+        panel.SetSizer(sizer)
+
+        self.time_entry.Bind(wx.EVT_TEXT_ENTER, self.on_go_to_time)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+    def on_go_to_time(self, event):
+        """Select the event replayed at the time typed by the user."""
+        try:
+            time = float(self.time_entry.Value)
+        except ValueError:
+            wx.Bell()
+            return
+        if not len(self.index):
+            return
+        item = self.index.find(time)
+        self.list.Select(item)
+        self.list.Focus(item)
+        self.list.EnsureVisible(item)
+
+    def on_close(self, event):
+        """Release the capture file."""
+        self.index.close()
+        self.Destroy()
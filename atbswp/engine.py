@@ -0,0 +1,402 @@
+"""Capture engine running in its own process."""
+
+# atbswp: Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# The listeners of the engine process stamp and decimate the events and
+# write them into a ring in shared memory, the GUI process never holds
+# the GIL of the process stamping them. A thread of the GUI process, not
+# the wx main loop, moves the events from the ring to an EventBuffer.
+#
+# Stopping is a handshake: the GUI sets the stop event, the engine stops
+# its listeners, writes the move held back by the decimator and sets the
+# STOPPED state, then the GUI drains what is left and writes the file.
+import multiprocessing
+import queue
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy
+
+import capture
+import keycodes
+import listeners
+import rules
+import sampling
+
+
+# States of the engine, stored in the shared memory
+STARTING, RECORDING, STOPPED, FAILED = range(4)
+# Events the ring holds before the engine has to drop them
+CAPACITY = 1 << 16
+# Seconds between two drains of the ring by the GUI process
+DRAIN_INTERVAL = 0.05
+# Seconds given to the engine to start or to stop before giving up on it
+TIMEOUT = 10.0
+
+# written, read, overflow, kept, dropped, filtered, state
+_HEADER = struct.Struct("<QQQQQQI")
+_WRITTEN, _READ, _OVERFLOW, _KEPT, _DROPPED, _FILTERED, _STATE = (0, 8, 16, 24, 32, 40, 48)
+# time, kind, x, y, code, flags, like the columns of capture.EventBuffer
+_RECORD = struct.Struct("<dBiiiH")
+RECORD = numpy.dtype([("time", "<f8"), ("kind", "u1"), ("x", "<i4"), ("y", "<i4"),
+                      ("code", "<i4"), ("flags", "<u2")])
+
+
+class SharedEventRing:
+    """Events in shared memory, written by one process and read by another.
+
+    The writer only moves the written counter forward after the event is
+    in place and the reader only moves the read counter, so no lock is
+    shared between the processes. When the reader falls behind by the
+    whole capacity, new events are dropped and counted in overflow.
+
+    Keyword arguments:
+    name -- the shared memory to attach to, None to create a new one
+    capacity -- number of events held, when creating it
+    """
+
+    def __init__(self, name=None, capacity=CAPACITY):
+        if name is None:
+            size = _HEADER.size + capacity * _RECORD.size
+            self._memory = shared_memory.SharedMemory(create=True, size=size)
+            self._memory.buf[:_HEADER.size] = bytes(_HEADER.size)
+            self.owner = True
+        else:
+            try:
+                # The creator alone removes the memory, not the tracker of this process
+                self._memory = shared_memory.SharedMemory(name=name, track=False)
+            except TypeError:  # Python < 3.13
+                self._memory = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.name = self._memory.name
+        self.capacity = (self._memory.size - _HEADER.size) // _RECORD.size
+        self._buffer = self._memory.buf
+        self._records = numpy.ndarray((self.capacity,), RECORD, self._buffer, _HEADER.size)
+
+    def _get(self, offset):
+        return struct.unpack_from("<Q", self._buffer, offset)[0]
+
+    def _set(self, offset, value):
+        struct.pack_into("<Q", self._buffer, offset, value)
+
+    @property
+    def written(self):
+        """Number of events written since the creation."""
+        return self._get(_WRITTEN)
+
+    @property
+    def overflow(self):
+        """Number of events dropped because the ring was full."""
+        return self._get(_OVERFLOW)
+
+    @property
+    def state(self):
+        return struct.unpack_from("<I", self._buffer, _STATE)[0]
+
+    @state.setter
+    def state(self, value):
+        struct.pack_into("<I", self._buffer, _STATE, value)
+
+    def counters(self):
+        """Return the moves kept and dropped by the decimator of the engine."""
+        return self._get(_KEPT), self._get(_DROPPED)
+
+    def set_counters(self, kept, dropped):
+        self._set(_KEPT, kept)
+        self._set(_DROPPED, dropped)
+
+    @property
+    def filtered(self):
+        """Number of events left out by the recording rules of the engine."""
+        return self._get(_FILTERED)
+
+    @filtered.setter
+    def filtered(self, value):
+        self._set(_FILTERED, value)
+
+    def append(self, time, kind, x=0, y=0, code=0, flags=0):
+        """Write one event, return False if the ring was full."""
+        written = self._get(_WRITTEN)
+        if written - self._get(_READ) >= self.capacity:
+            self._set(_OVERFLOW, self._get(_OVERFLOW) + 1)
+            return False
+        _RECORD.pack_into(self._buffer, _HEADER.size + (written % self.capacity) * _RECORD.size,
+                          time, kind, x, y, code, flags)
+        self._set(_WRITTEN, written + 1)
+        return True
+
+    def read(self):
+        """Return a copy of the events not read yet, as a NumPy record array."""
+        written, read = self._get(_WRITTEN), self._get(_READ)
+        start, end = read % self.capacity, written % self.capacity
+        if written == read:
+            events = self._records[:0].copy()
+        elif start < end:
+            events = self._records[start:end].copy()
+        else:
+            events = numpy.concatenate((self._records[start:], self._records[:end]))
+        self._set(_READ, written)
+        return events
+
+    def close(self):
+        """Detach from the memory, and remove it if this process created it."""
+        self._records = None
+        self._buffer.release()
+        self._memory.close()
+        if self.owner:
+            self._memory.unlink()
+
+
+class RingRecorder:
+    """Sink of the listeners of the engine, writing to the shared ring.
+
+    It records like RecordCtrl: the moves go through the decimator, whose
+    held back move is written before any other event.
+
+    Keyword arguments:
+    ring -- the SharedEventRing written
+    decimator -- the MouseDecimator of the recording
+    blobs -- queue receiving the (index, data) of the checkpoints
+    clock -- returns the time of the event being recorded (default: time.perf_counter)
+    event_filter -- the rules.Filter of the recording (default: leave nothing out)
+    """
+
+    def __init__(self, ring, decimator, blobs, clock=time.perf_counter, event_filter=None):
+        self.ring = ring
+        self.clock = clock
+        self.rules = event_filter if event_filter is not None else rules.Filter()
+        self.decimator = decimator
+        self.blobs = blobs
+        self.encode_key = keycodes.Encoder()
+        self._checkpoints = 0
+
+    def on_move(self, x, y):
+        b = self.clock()
+        if self.rules.move(b, x, y):
+            return
+        if self.decimator.accept(b, x, y):
+            self.ring.append(b, capture.MOVE, x, y)
+
+    def flush_mouse(self):
+        pending = self.decimator.flush()
+        if pending is not None:
+            self.ring.append(pending[0], capture.MOVE, pending[1], pending[2])
+
+    def on_click(self, x, y, button, pressed):
+        b = self.clock()
+        name = getattr(button, "name", None)
+        if name not in capture.BUTTONS or self.rules.click(b, x, y, button, pressed):
+            return
+        self.flush_mouse()
+        self.ring.append(b, capture.MOUSE_DOWN if pressed else capture.MOUSE_UP, x, y,
+                         capture.BUTTONS.index(name))
+
+    def on_scroll(self, x, y, dx, dy):
+        b = self.clock()
+        if self.rules.scroll(b, x, y):
+            return
+        self.flush_mouse()
+        self.ring.append(b, capture.SCROLL, x, y, dy)
+
+    def _key(self, kind, key):
+        b = self.clock()
+        if self.rules.key(b, key, kind == capture.KEY_DOWN):
+            return
+        encoded = self.encode_key(key)
+        if encoded is None:
+            # Keys without character, name nor virtual key code, like Fn
+            return
+        self.flush_mouse()
+        self.ring.append(b, kind, code=encoded[0], flags=encoded[1])
+
+    def on_press(self, key):
+        self._key(capture.KEY_DOWN, key)
+
+    def on_release(self, key):
+        self._key(capture.KEY_UP, key)
+
+    def add_checkpoint(self):
+        """Record what the screen looks like around the pointer."""
+        # Only the engine process needs a display for this
+        import checkpoint
+        import pyautogui
+
+        self.flush_mouse()
+        region, thumbnail = checkpoint.take(*pyautogui.position())
+        self.blobs.put((self._checkpoints, (region, thumbnail)))
+        self.ring.append(self.clock(), capture.CHECKPOINT, region[0], region[1], self._checkpoints)
+        self._checkpoints += 1
+
+
+def serve(name, stop, blobs, options, mouse_listener=None, keyboard_listener=None):
+    """Record into the ring called name until stop is set, in the engine process.
+
+    Keyword arguments:
+    name -- the name of the SharedEventRing
+    stop -- multiprocessing.Event ending the recording
+    blobs -- multiprocessing.Queue receiving the checkpoints
+    options -- dictionary with the max_rate and min_distance of the
+               decimator, the names of the pynput keys to leave out of the
+               capture as ignored_keys, the checkpoint_key name, the
+               recording rules and the start time of the recording
+    mouse_listener -- class of the mouse listener (default pynput.mouse.Listener)
+    keyboard_listener -- class of the keyboard listener (default pynput.keyboard.Listener)
+    """
+    ring = SharedEventRing(name)
+    manager = listeners.ListenerManager(mouse_listener, keyboard_listener)
+    recorder = RingRecorder(ring, sampling.MouseDecimator(options.get("max_rate", 60),
+                                                          options.get("min_distance", 3)),
+                             blobs, manager.now, rules.Filter(options.get("rules", ())))
+    recorder.rules.reset(options.get("start", 0.0))
+    try:
+        keys = set(options.get("ignored_keys", ()))
+        if keys or options.get("checkpoint_key"):
+            from pynput import keyboard
+            for key in keys:
+                manager.bind(key, keyboard.Key[key])
+            if options.get("checkpoint_key"):
+                manager.bind("checkpoint", keyboard.Key[options["checkpoint_key"]], recorder.add_checkpoint)
+        manager.arm(recorder)
+        ring.state = RECORDING
+        stop.wait()
+        manager.stop()
+        recorder.flush_mouse()
+        ring.set_counters(recorder.decimator.kept, recorder.decimator.dropped)
+        ring.filtered = recorder.rules.total
+        ring.state = STOPPED
+    except BaseException:
+        ring.state = FAILED
+        raise
+    finally:
+        ring.close()
+
+
+class CaptureProcess:
+    """Record in a separate engine process, from the GUI process.
+
+    Keyword arguments:
+    options -- the options given to serve
+    capacity -- number of events the shared ring holds
+    mouse_listener -- class of the mouse listener used by the engine
+    keyboard_listener -- class of the keyboard listener used by the engine
+    """
+
+    def __init__(self, options, capacity=CAPACITY, mouse_listener=None, keyboard_listener=None):
+        self.options = options
+        self.capacity = capacity
+        self._classes = (mouse_listener, keyboard_listener)
+        self.events = None
+        self.ring = None
+        self.process = None
+        self._thread = None
+        self.counters = (0, 0)
+        self.filtered = 0
+        self.overflow = 0
+        # A checkpoint was lost
+        self.failed = False
+
+    @property
+    def state(self):
+        """The state of the engine, STOPPED when it isn't running."""
+        return self.ring.state if self.ring is not None else STOPPED
+
+    @property
+    def recorded(self):
+        """Number of events recorded so far."""
+        return self.ring.written if self.ring is not None else 0
+
+    def start(self, start=None):
+        """Start the engine, return once its listeners are installed.
+
+        Raise RuntimeError if the engine doesn't start.
+
+        Keyword arguments:
+        start -- reference time of the recording (default: now)
+        """
+        context = multiprocessing.get_context()
+        self.events = capture.EventBuffer(time.perf_counter() if start is None else start)
+        self.ring = SharedEventRing(capacity=self.capacity)
+        self._stop = context.Event()
+        self._blobs = context.Queue()
+        self._checkpoints = {}
+        self.failed = False
+        self.process = context.Process(target=serve, name="atbswp-engine", daemon=True,
+                                       args=(self.ring.name, self._stop, self._blobs,
+                                             dict(self.options, start=self.events.start))
+                                       + self._classes)
+        self.process.start()
+        deadline = time.monotonic() + TIMEOUT
+        while self.ring.state == STARTING and self.process.is_alive() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        if self.ring.state != RECORDING:
+            self._shutdown()
+            raise RuntimeError("the capture engine didn't start")
+        self._drained = threading.Event()
+        self._thread = threading.Thread(target=self._drain_loop, name="atbswp-drain", daemon=True)
+        self._thread.start()
+
+    def _drain(self):
+        """Move the events of the ring to `events`.
+
+        A checkpoint whose thumbnail never arrives is left out and sets
+        `failed`, the events after it are still kept.
+        """
+        for time_, kind, x, y, code, flags in self.ring.read().tolist():
+            if kind == capture.CHECKPOINT:
+                try:
+                    while code not in self._checkpoints:
+                        # Once a thumbnail was lost, don't wait for every following one
+                        index, blob = self._blobs.get(timeout=0 if self.failed else TIMEOUT)
+                        self._checkpoints[index] = blob
+                except queue.Empty:
+                    self.failed = True
+                    continue
+                code = self.events.add_blob(self._checkpoints.pop(code))
+            self.events.append(time_, kind, x, y, code, flags)
+
+    def _drain_loop(self):
+        while not self._drained.wait(DRAIN_INTERVAL):
+            self._drain()
+
+    def stop(self):
+        """Stop the engine and return the EventBuffer of the recording.
+
+        Return None if the engine failed or lost a checkpoint, the events
+        recorded until then stay in `events`.
+        """
+        self._stop.set()
+        self.process.join(TIMEOUT)
+        self._drained.set()
+        self._thread.join()
+        self._drain()
+        stopped = self.ring.state == STOPPED and not self.failed
+        self.counters = self.ring.counters()
+        self.filtered = self.ring.filtered
+        self.overflow = self.ring.overflow
+        self._shutdown()
+        return self.events if stopped else None
+
+    def _shutdown(self):
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self._blobs.close()
+        self.ring.close()
+        self.ring = None
@@ -20,12 +20,10 @@ This module contains all the classes needed to
 create the GUI and handle non functionnal event
 """
 
-import os
-import sys
-from pathlib import Path
-
 import control
 
+import resources
+
 import settings
 
 import wx
@@ -42,7 +40,6 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
 
     def on_settings_click(self, event):
         """Triggered when the popup menu is clicked."""
-        self.settings_popup()
         event.GetEventObject().PopupMenu(self.settings_popup())
         event.EventObject.Parent.panel.SetFocus()
         event.Skip()
@@ -59,8 +56,7 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
 
         #  Infinite Playback
         cp = menu.AppendCheckItem(wx.ID_ANY, self.settings_text[1])
-        status = settings.CONFIG.getboolean('DEFAULT', 'Infinite Playback')
-        cp.Check(status)
+        cp.Check(settings.CONFIG.infinite_playback)
         self.Bind(wx.EVT_MENU,
                   control.SettingsCtrl.infinite_playback,
                   cp)
@@ -79,26 +75,24 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
         self.Bind(wx.EVT_MENU,
                   control.SettingsCtrl.playback_hotkey,
                   menu.Append(wx.ID_ANY, self.settings_text[4]))
+
+        # Checkpoint hotkey
+        self.Bind(wx.EVT_MENU,
+                  control.SettingsCtrl.checkpoint_hotkey,
+                  menu.Append(wx.ID_ANY, self.settings_text[10]))
         menu.AppendSeparator()
 
         # Always on top
         aot = menu.AppendCheckItem(wx.ID_ANY, self.settings_text[5])
-        status = settings.CONFIG.getboolean('DEFAULT', 'Always On Top')
-        aot.Check(status)
+        aot.Check(settings.CONFIG.always_on_top)
         self.Bind(wx.EVT_MENU,
                   self.sc.always_on_top,
                   aot)
 
         # Language
         submenu = wx.Menu()
-        # Workaround for users of the previous version
-        current_lang = "en"
-        try:
-            current_lang = settings.CONFIG.get('DEFAULT', 'Language')
-        except:
-            pass
-
-        for language in os.listdir(os.path.join(self.path, "lang")):
+        current_lang = settings.CONFIG.language
+        for language in resources.languages():
             lang_item = submenu.AppendRadioItem(wx.ID_ANY, language)
             self.Bind(wx.EVT_MENU,
                       self.sc.language,
@@ -107,6 +101,11 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
                 lang_item.Check(True)
         menu.AppendSubMenu(submenu, self.settings_text[6])
 
+        # Inspect capture
+        self.Bind(wx.EVT_MENU,
+                  self.ic.action,
+                  menu.Append(wx.ID_ANY, self.settings_text[11]))
+
         # About
         self.Bind(wx.EVT_MENU,
                   self.on_about,
@@ -117,25 +116,57 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
                   control.RecordCtrl.recording_timer,
                   menu.Append(wx.ID_ANY, self.settings_text[8]))
 
-        # Mouse speed
+        # Mouse sampling
         self.Bind(wx.EVT_MENU,
-                  control.RecordCtrl.mouse_speed,
+                  control.RecordCtrl.mouse_sampling,
                   menu.Append(wx.ID_ANY, self.settings_text[9]))
+
+        # Recording rules
+        self.Bind(wx.EVT_MENU,
+                  control.RecordCtrl.recording_rules,
+                  menu.Append(wx.ID_ANY, self.settings_text[18]))
+
+        # Capture process
+        cpr = menu.AppendCheckItem(wx.ID_ANY, self.settings_text[16])
+        cpr.Check(settings.CONFIG.capture_process)
+        self.Bind(wx.EVT_MENU,
+                  control.SettingsCtrl.capture_process,
+                  cpr)
+
+        # Mouse replay rate
+        self.Bind(wx.EVT_MENU,
+                  control.PlayCtrl.mouse_rate,
+                  menu.Append(wx.ID_ANY, self.settings_text[15]))
+
+        # Playlist
+        self.Bind(wx.EVT_MENU,
+                  self.pbc.load_playlist,
+                  menu.Append(wx.ID_ANY, self.settings_text[17]))
+        menu.AppendSeparator()
+
+        # Flight recorder
+        fr = menu.AppendCheckItem(wx.ID_ANY, self.settings_text[12])
+        fr.Check(settings.CONFIG.flight_recorder)
+        self.Bind(wx.EVT_MENU,
+                  self.frc.action,
+                  fr)
+        self.Bind(wx.EVT_MENU,
+                  control.SettingsCtrl.flight_recorder_hotkey,
+                  menu.Append(wx.ID_ANY, self.settings_text[13]))
+        self.Bind(wx.EVT_MENU,
+                  control.FlightRecorderCtrl.limits,
+                  menu.Append(wx.ID_ANY, self.settings_text[14]))
         return menu
 
     def __init__(self, *args, **kwds):
         """Build the interface."""
-        if getattr(sys, 'frozen', False):
-            self.path = sys._MEIPASS
-        else:
-            self.path = Path(__file__).parent.absolute()
         on_top = wx.DEFAULT_DIALOG_STYLE
-        on_top = on_top if not settings.CONFIG.getboolean('DEFAULT', 'Always On Top') \
+        on_top = on_top if not settings.CONFIG.always_on_top \
             else on_top | wx.STAY_ON_TOP
         kwds["style"] = kwds.get("style", 0) | on_top
         wx.Dialog.__init__(self, *args, **kwds)
         self.panel = wx.Panel(self)
-        self.icon = wx.Icon(os.path.join(self.path, "img", "icon.png"))
+        self.icon = resources.icon("icon.png")
         self.SetIcon(self.icon)
         self.taskbar = TaskBarIcon(self)
         self.taskbar.SetIcon(self.icon, "atbswp")
@@ -144,41 +175,35 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
         self.app_text, self.settings_text = locale[:7], locale[7:]
         self.file_open_button = wx.BitmapButton(self,
                                                 wx.ID_ANY,
-                                                wx.Bitmap(os.path.join(self.path, "img", "file-upload.png"),
-                                                          wx.BITMAP_TYPE_ANY))
+                                                resources.bitmap("file-upload.png"))
         self.file_open_button.SetToolTip(self.app_text[0])
         self.save_button = wx.BitmapButton(self,
                                            wx.ID_ANY,
-                                           wx.Bitmap(os.path.join(self.path, "img", "save.png"),
-                                                     wx.BITMAP_TYPE_ANY))
+                                           resources.bitmap("save.png"))
         self.save_button.SetToolTip(self.app_text[1])
         self.record_button = wx.BitmapToggleButton(self,
                                                    wx.ID_ANY,
-                                                   wx.Bitmap(os.path.join(self.path, "img", "video.png"),
-                                                             wx.BITMAP_TYPE_ANY))
+                                                   resources.bitmap("video.png"))
         self.record_button.SetToolTip(self.app_text[2])
         self.play_button = wx.BitmapToggleButton(self,
                                                  wx.ID_ANY,
-                                                 wx.Bitmap(os.path.join(self.path, "img", "play-circle.png"),
-                                                           wx.BITMAP_TYPE_ANY))
-        self.remaining_plays = wx.StaticText(self, label=settings.CONFIG.get("DEFAULT", "Repeat Count"),
+                                                 resources.bitmap("play-circle.png"))
+        self.remaining_plays = wx.StaticText(self, label=str(settings.CONFIG.repeat_count),
                                              style=wx.ALIGN_CENTRE_HORIZONTAL)
         self.play_button.SetToolTip(self.app_text[3])
+        settings.CONFIG.subscribe("repeat_count", self.on_repeat_count_change)
         self.compile_button = wx.BitmapButton(self,
                                               wx.ID_ANY,
-                                              wx.Bitmap(os.path.join(self.path, "img", "download.png"),
-                                                        wx.BITMAP_TYPE_ANY))
+                                              resources.bitmap("download.png"))
         self.compile_button.SetToolTip(self.app_text[4])
         self.settings_button = wx.BitmapButton(self,
                                                wx.ID_ANY,
-                                               wx.Bitmap(os.path.join(self.path, "img", "cog.png"),
-                                                         wx.BITMAP_TYPE_ANY))
+                                               resources.bitmap("cog.png"))
         self.settings_button.SetToolTip(self.app_text[5])
 
         self.help_button = wx.BitmapButton(self,
                                            wx.ID_ANY,
-                                           wx.Bitmap(os.path.join(self.path, "img", "question-circle.png"),
-                                                     wx.BITMAP_TYPE_ANY))
+                                           resources.bitmap("question-circle.png"))
         self.help_button.SetToolTip(self.app_text[6])
 
         self.__add_bindings()
@@ -187,14 +212,7 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
 
     def __load_locale(self):
         """Load the interface in user-defined language (default english)."""
-        try:
-            lang = settings.CONFIG.get('DEFAULT', 'Language')
-            locale = open(os.path.join(self.path, "lang", lang)
-                          ).read().splitlines()
-        except:
-            return self.app_text + self.settings_text
-
-        return locale
+        return resources.locale(settings.CONFIG.language)
 
     def __add_bindings(self):
         # file_save_ctrl
@@ -206,8 +224,19 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
         self.rbc = control.RecordCtrl()
         self.Bind(wx.EVT_TOGGLEBUTTON, self.rbc.action, self.record_button)
 
+        # Listen to the mouse and the keyboard once for all, without ever
+        # recording the keys controlling atbswp
+        control.bind_hotkey("recording_hotkey")
+        control.bind_hotkey("playback_hotkey")
+        control.LISTENERS.start()
+
+        # flight_recorder_ctrl
+        self.frc = control.FlightRecorderCtrl(self)
+        if settings.CONFIG.flight_recorder:
+            self.frc.start()
+
         # play_button_ctrl
-        self.pbc = control.PlayCtrl()
+        self.pbc = control.PlayCtrl(self)
         self.Bind(wx.EVT_TOGGLEBUTTON, self.pbc.action, self.play_button)
 
         # Handle the event returned after a playback has completed
@@ -217,6 +246,9 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
         self.Bind(wx.EVT_BUTTON, control.CompileCtrl.compile,
                   self.compile_button)
 
+        # inspect_ctrl
+        self.ic = control.InspectCtrl(self)
+
         # help_button_ctrl
         self.Bind(wx.EVT_BUTTON, control.HelpCtrl.action, self.help_button)
 
@@ -265,7 +297,7 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
         if keycode == wx.WXK_F1:
             control.HelpCtrl.action(wx.PyCommandEvent(wx.wxEVT_BUTTON))
 
-        elif keycode == settings.CONFIG.getint('DEFAULT', 'Recording Hotkey'):
+        elif keycode == settings.CONFIG.recording_hotkey:
             btn_event = wx.CommandEvent(wx.wxEVT_TOGGLEBUTTON)
             btn_event.EventObject = self.record_button
             if not self.record_button.Value:
@@ -275,7 +307,7 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
                 self.record_button.Value = False
                 self.rbc.action(btn_event)
 
-        elif keycode == settings.CONFIG.getint('DEFAULT', 'Playback Hotkey'):
+        elif keycode == settings.CONFIG.playback_hotkey:
             if not self.play_button.Value:
                 self.play_button.Value = True
                 btn_event = wx.CommandEvent(wx.wxEVT_TOGGLEBUTTON)
@@ -298,17 +330,27 @@ class MainDialog(wx.Dialog, wx.MiniFrame):
             btn_event.EventObject = self.save_button
             self.fsc.save_file(btn_event)
 
+        elif keycode == ord("I") and event.CmdDown():
+            self.ic.action(wx.CommandEvent(wx.wxEVT_MENU))
+
         event.Skip()
 
     def on_thread_end(self, event):
         self.play_button.Value = event.toggle_value
         self.remaining_plays.Label = str(event.count) if event.count > 0 else \
-            str(settings.CONFIG.getint('DEFAULT', 'Repeat Count'))
+            str(settings.CONFIG.repeat_count)
         self.remaining_plays.Update()
 
+    def on_repeat_count_change(self, value):
+        """Keep the remaining plays in sync with the setting."""
+        self.remaining_plays.Label = str(value)
+
     def on_exit_app(self, event):
         """Clean exit saving the settings."""
         settings.save_config()
+        self.frc.stop()
+        self.pbc.player.close()
+        control.LISTENERS.stop()
         self.Destroy()
         self.taskbar.Destroy()
 
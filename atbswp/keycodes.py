@@ -0,0 +1,212 @@
+"""Integer codes of the recorded keys.
+
+A key is recorded as a (code, flags) pair: the code point of its
+character, the index of its name in NAMES with SPECIAL_KEY, or the
+virtual key code of the platform with VIRTUAL_KEY for the keys known to
+neither pynput nor pyautogui, which can't be replayed and are only
+written as comments in the captures. The tables are built once at import, the
+listener encodes a key with one dictionary lookup and the names of the
+replay are only looked up when the capture is written.
+"""
+
+# atbswp: Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import re
+import sys
+
+
+# Flags of the key events
+SPECIAL_KEY = 1  # code is an index in NAMES instead of a code point
+VIRTUAL_KEY = 2  # code is a virtual key code of the platform
+
+UNSUPPORTED = -1
+UNSUPPORTED_NAME = "### This key is not supported yet"
+
+# Names understood by pyautogui for the keys without a character, the
+# codes of the first ones are those of the older captures
+NAMES = (
+    "alt", "altleft", "altright", "backspace", "capslock", "winleft",
+    "winright", "ctrlleft", "ctrlright", "delete", "down", "end", "enter",
+    "esc", "f1", "f2", "f3", "f4", "f5", "f6", "f7", "f8", "f9", "f10", "f11",
+    "f12", "home", "left", "pagedown", "pageup", "right", "shiftleft",
+    "shiftright", "space", "tab", "up", "playpause", "insert", "numlock",
+    "pause", "printscreen", "scrolllock",
+    "f13", "f14", "f15", "f16", "f17", "f18", "f19", "f20", "f21", "f22",
+    "f23", "f24", "apps", "volumemute", "volumedown", "volumeup", "prevtrack",
+    "nexttrack", "stop", "num0", "num1", "num2", "num3", "num4", "num5",
+    "num6", "num7", "num8", "num9", "add", "subtract", "multiply", "divide",
+    "decimal", "separator", "clear", "browserback", "browserforward",
+    "browserrefresh", "browserstop", "browsersearch", "browserfavorites",
+    "browserhome", "launchmail", "launchmediaselect", "launchapp1",
+    "launchapp2", "select", "execute", "help", "sleep", "kana", "junja",
+    "final", "hanja", "convert", "nonconvert", "accept", "modechange",
+)
+CODES = {name: code for code, name in enumerate(NAMES)}
+# Names written by the older versions, unknown to pyautogui
+ALIASES = {"num_lock": "numlock", "print_screen": "printscreen", "scroll_lock": "scrolllock"}
+
+# Name of the pynput keys without a character, by pynput name
+_PYNPUT_NAMES = {
+    "alt": "alt", "alt_l": "altleft", "alt_r": "altright", "alt_gr": "altright",
+    "backspace": "backspace", "caps_lock": "capslock", "cmd": "winleft",
+    "cmd_l": "winleft", "cmd_r": "winright", "ctrl": "ctrlleft",
+    "ctrl_l": "ctrlleft", "ctrl_r": "ctrlright", "delete": "delete",
+    "down": "down", "end": "end", "enter": "enter", "esc": "esc",
+    "home": "home", "left": "left", "page_down": "pagedown",
+    "page_up": "pageup", "right": "right", "shift": "shiftleft",
+    "shift_l": "shiftleft", "shift_r": "shiftright", "space": "space",
+    "tab": "tab", "up": "up", "insert": "insert", "menu": "apps",
+    "num_lock": "numlock", "pause": "pause", "print_screen": "printscreen",
+    "scroll_lock": "scrolllock", "media_play_pause": "playpause",
+    "media_stop": "stop", "media_volume_mute": "volumemute",
+    "media_volume_down": "volumedown", "media_volume_up": "volumeup",
+    "media_previous": "prevtrack", "media_next": "nexttrack",
+}
+_PYNPUT_NAMES.update((f"f{i}", f"f{i}") for i in range(1, 25))
+# Code of the pynput keys without a character, by pynput name
+PYNPUT = {key: CODES[name] for key, name in _PYNPUT_NAMES.items()}
+
+# Name of the keys pynput only gives a virtual key code for, by platform
+_WIN32_NAMES = {
+    0x0C: "clear", 0x15: "kana", 0x17: "junja", 0x18: "final", 0x19: "hanja",
+    0x1C: "convert", 0x1D: "nonconvert", 0x1E: "accept", 0x1F: "modechange",
+    0x29: "select", 0x2B: "execute", 0x2F: "help", 0x5D: "apps", 0x5F: "sleep",
+    0x6A: "multiply", 0x6B: "add", 0x6C: "separator", 0x6D: "subtract",
+    0x6E: "decimal", 0x6F: "divide", 0xA6: "browserback",
+    0xA7: "browserforward", 0xA8: "browserrefresh", 0xA9: "browserstop",
+    0xAA: "browsersearch", 0xAB: "browserfavorites", 0xAC: "browserhome",
+    0xAD: "volumemute", 0xAE: "volumedown", 0xAF: "volumeup",
+    0xB0: "nexttrack", 0xB1: "prevtrack", 0xB2: "stop", 0xB3: "playpause",
+    0xB4: "launchmail", 0xB5: "launchmediaselect", 0xB6: "launchapp1",
+    0xB7: "launchapp2",
+}
+_WIN32_NAMES.update((0x60 + i, f"num{i}") for i in range(10))
+_WIN32_NAMES.update((0x70 + i, f"f{i + 1}") for i in range(24))
+# Key codes of the Carbon framework, only the keypad has no character
+_DARWIN_NAMES = {
+    0x41: "decimal", 0x43: "multiply", 0x45: "add", 0x47: "clear",
+    0x48: "volumeup", 0x49: "volumedown", 0x4A: "volumemute", 0x4B: "divide",
+    0x4C: "enter", 0x4E: "subtract", 0x52: "num0", 0x53: "num1", 0x54: "num2",
+    0x55: "num3", 0x56: "num4", 0x57: "num5", 0x58: "num6", 0x59: "num7",
+    0x5B: "num8", 0x5C: "num9", 0x69: "f13", 0x6B: "f14", 0x71: "f15",
+    0x6A: "f16", 0x40: "f17", 0x4F: "f18", 0x50: "f19", 0x5A: "f20",
+    0x72: "help",
+}
+# X keysyms, the keypad when Num Lock is off and the XF86 media keys
+_XORG_NAMES = {
+    0xFF0B: "clear", 0xFF60: "select", 0xFF62: "execute", 0xFF67: "apps",
+    0xFF6A: "help", 0xFF8D: "enter", 0xFF95: "home", 0xFF96: "left",
+    0xFF97: "up", 0xFF98: "right", 0xFF99: "down", 0xFF9A: "pageup",
+    0xFF9B: "pagedown", 0xFF9C: "end", 0xFF9E: "insert", 0xFF9F: "delete",
+    0xFFAA: "multiply", 0xFFAB: "add", 0xFFAC: "separator",
+    0xFFAD: "subtract", 0xFFAE: "decimal", 0xFFAF: "divide",
+    0x1008FF11: "volumedown", 0x1008FF12: "volumemute",
+    0x1008FF13: "volumeup", 0x1008FF14: "playpause", 0x1008FF15: "stop",
+    0x1008FF16: "prevtrack", 0x1008FF17: "nexttrack", 0x1008FF18: "browserhome",
+    0x1008FF19: "launchmail", 0x1008FF1B: "browsersearch",
+    0x1008FF26: "browserback", 0x1008FF27: "browserforward",
+    0x1008FF28: "browserstop", 0x1008FF29: "browserrefresh",
+    0x1008FF2F: "sleep", 0x1008FF30: "browserfavorites",
+    0x1008FF32: "launchmediaselect",
+}
+_XORG_NAMES.update((0xFFB0 + i, f"num{i}") for i in range(10))
+_XORG_NAMES.update((0xFFBE + i, f"f{i + 1}") for i in range(24))
+
+
+def _platform_names(platform=sys.platform):
+    if platform == "win32":
+        return _WIN32_NAMES
+    if platform == "darwin":
+        return _DARWIN_NAMES
+    return _XORG_NAMES
+
+
+# Code of the keys pynput only gives a virtual key code for, on this platform
+VIRTUAL = {vk: CODES[name] for vk, name in _platform_names().items()}
+
+VIRTUAL_NAME = re.compile(r"^vk(\d+)$")
+
+
+def name(code, flags):
+    """Return the pyautogui name of a recorded key."""
+    if flags & SPECIAL_KEY:
+        return NAMES[code] if code != UNSUPPORTED else UNSUPPORTED_NAME
+    if flags & VIRTUAL_KEY:
+        # Unknown to pyautogui, capture.serialize writes these keys as comments
+        return f"vk{code}"
+    return chr(code)
+
+
+def code(key_name):
+    """Return the (code, flags) of a pyautogui key name."""
+    if len(key_name) == 1:
+        return ord(key_name), 0
+    special = CODES.get(ALIASES.get(key_name, key_name))
+    if special is not None:
+        return special, SPECIAL_KEY
+    match = VIRTUAL_NAME.match(key_name)
+    if match is not None:
+        return int(match.group(1)), VIRTUAL_KEY
+    return UNSUPPORTED, SPECIAL_KEY
+
+
+class Encoder:
+    """Turn the keys of the listener into their (code, flags).
+
+    The pairs are kept by key, a key is encoded once and then costs a
+    dictionary lookup. Return None for the keys without character, name
+    nor virtual key code, like some Fn keys.
+
+    Keyword arguments:
+    keys -- keys encoded ahead, like the members of pynput.keyboard.Key
+    """
+
+    def __init__(self, keys=()):
+        self._table = {key: self.encode(key) for key in keys}
+
+    def __call__(self, key):
+        try:
+            return self._table[key]
+        except KeyError:
+            encoded = self._table[key] = self.encode(key)
+            return encoded
+        except TypeError:
+            # Not hashable
+            return self.encode(key)
+
+    @staticmethod
+    def encode(key):
+        """Return the (code, flags) of a pynput key, without the table."""
+        char = getattr(key, "char", None)
+        if isinstance(char, str) and len(char) == 1:
+            return ord(char), 0
+        key_name = getattr(key, "name", None)
+        if isinstance(key_name, str):
+            special = PYNPUT.get(key_name)
+            if special is not None:
+                return special, SPECIAL_KEY
+            # A member of pynput.keyboard.Key, its value is a KeyCode
+            key = getattr(key, "value", None)
+        vk = getattr(key, "vk", None)
+        if isinstance(vk, int):
+            special = VIRTUAL.get(vk)
+            if special is not None:
+                return special, SPECIAL_KEY
+            return vk, VIRTUAL_KEY
+        if isinstance(key_name, str):
+            return UNSUPPORTED, SPECIAL_KEY
+        return None
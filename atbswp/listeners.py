@@ -0,0 +1,286 @@
+"""Long-lived input listeners shared by the recorders."""
+
+# atbswp: Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import collections
+import ctypes
+import math
+import threading
+import time
+
+
+# Seconds after which the offset of a source clock is measured again, to follow its drift
+WINDOW = 60.0
+# A source timestamp older than this, in seconds, is ignored as bogus
+MAX_LAG = 1.0
+
+
+class SourceClock:
+    """Convert the timestamps the OS puts on the input events to time.perf_counter.
+
+    The event is always delivered after it happened, so the smallest
+    difference seen between the callback time and the source timestamp
+    is the offset between the two clocks, up to the quickest delivery.
+    The smallest difference is taken over the last two windows, which
+    follows a slow drift between the clocks.
+
+    Keyword arguments:
+    resolution -- seconds per tick of the source clock
+    wrap -- number of ticks after which the source clock restarts from 0, None if never
+    window -- seconds after which the offset is measured again
+    """
+
+    def __init__(self, resolution, wrap=None, window=WINDOW):
+        self.resolution = resolution
+        self.wrap = wrap
+        self.window = window
+        self._lock = threading.Lock()
+        self._last = None
+        self._epoch = 0
+        self._started = -math.inf
+        self._current = self._previous = math.inf
+
+    def convert(self, ticks, now=None):
+        """Return the perf_counter time of an event stamped ticks by the source.
+
+        Keyword arguments:
+        ticks -- the timestamp of the source
+        now -- the perf_counter time of the callback (default: now)
+        """
+        if now is None:
+            now = time.perf_counter()
+        with self._lock:
+            if self._last is not None and self.wrap and self._last - ticks > self.wrap // 2:
+                self._epoch += 1
+                self._last = ticks
+            elif self._last is None or ticks > self._last:
+                # The mouse and the keyboard events may come slightly out of order
+                self._last = ticks
+            source = (ticks + self._epoch * (self.wrap or 0)) * self.resolution
+            offset = now - source
+            if now - self._started > self.window:
+                self._previous, self._current, self._started = self._current, offset, now
+            elif offset < self._current:
+                self._current = offset
+            stamp = source + min(self._current, self._previous)
+        if now - stamp > MAX_LAG:
+            return now
+        return min(stamp, now)
+
+
+def _stamping_method(listener, method, manager, timestamp):
+    """Return a subclass of listener whose method stamps the events it dispatches."""
+    def handle(self, *arguments):
+        manager.stamp(timestamp(self, *arguments))
+        try:
+            return getattr(super(subclass, self), method)(*arguments)
+        finally:
+            manager.stamp(None)
+
+    subclass = type(listener.__name__, (listener,), {method: handle})
+    return subclass
+
+
+def _win32_keyboard(listener, manager):
+    """Return a subclass of the win32 keyboard listener stamping its events.
+
+    The hook converts the event and posts it to the message loop, which
+    dispatches it later, the stamps wait in the same order in a queue.
+    """
+    pending = collections.deque()
+
+    class Stamped(listener):
+        def _convert(self, code, msg, lpdata):
+            converted = super()._convert(code, msg, lpdata)
+            if converted is not None:
+                pending.append(ctypes.cast(lpdata, self._LPKBDLLHOOKSTRUCT).contents.time)
+            return converted
+
+        def _process(self, wparam, lparam):
+            manager.stamp(pending.popleft() if pending else None)
+            try:
+                return super()._process(wparam, lparam)
+            finally:
+                manager.stamp(None)
+
+    return Stamped
+
+
+def _win32_mouse_time(self, code, msg, lpdata, *rest):
+    # HC_ACTION, the data of the other codes isn't an event
+    if code != 0:
+        return None
+    return ctypes.cast(lpdata, self._LPMSLLHOOKSTRUCT).contents.time
+
+
+def stamped(listener, manager):
+    """Return a subclass of a pynput listener stamping its events at the source.
+
+    The X server and Windows give the time of each event in milliseconds,
+    the listeners of the other backends are returned as they are and the
+    events are stamped when the callback runs.
+
+    Keyword arguments:
+    listener -- the pynput mouse or keyboard Listener class
+    manager -- the ListenerManager receiving the stamps
+    """
+    backend = listener.__module__.rsplit(".", 1)[-1]
+    # pynput 1.8 renamed _handle to _handle_message
+    method = "_handle_message" if hasattr(listener, "_handle_message") else "_handle"
+    if backend == "_xorg":
+        return _stamping_method(listener, method, manager, lambda self, display, event, *rest: event.time)
+    if backend == "_win32" and hasattr(listener, "_LPKBDLLHOOKSTRUCT"):
+        return _win32_keyboard(listener, manager)
+    if backend == "_win32" and hasattr(listener, "_LPMSLLHOOKSTRUCT"):
+        return _stamping_method(listener, method, manager, _win32_mouse_time)
+    return listener
+
+
+class ListenerManager:
+    """Own one mouse and one keyboard listener for the whole program.
+
+    The OS hooks and the listener threads are installed once. Recording
+    only arms or disarms a sink, any object with the on_move, on_click,
+    on_scroll, on_press and on_release methods of the pynput callbacks,
+    which costs a tuple swap instead of starting and stopping threads.
+
+    The keys bound as hotkeys are consumed before reaching the sinks, so
+    the keys controlling atbswp never end up in a capture.
+
+    The sinks get the time of the event they are called for with now,
+    taken from the OS event itself when the platform gives it.
+
+    Keyword arguments:
+    mouse_listener -- class of the mouse listener (default pynput.mouse.Listener)
+    keyboard_listener -- class of the keyboard listener (default pynput.keyboard.Listener)
+    """
+
+    def __init__(self, mouse_listener=None, keyboard_listener=None):
+        """Prepare the listeners without starting them."""
+        self._classes = (mouse_listener, keyboard_listener)
+        self._listeners = ()
+        self._bindings = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # X server and Windows event times, milliseconds on 32 bits
+        self.clock = SourceClock(0.001, 1 << 32)
+        self.sinks = ()
+        self.hotkeys = {}
+
+    @property
+    def running(self):
+        """Tell if the listeners are installed."""
+        return bool(self._listeners)
+
+    def start(self):
+        """Install the listeners, nothing happens if they already are."""
+        with self._lock:
+            if self._listeners:
+                return
+            mouse_listener, keyboard_listener = self._classes
+            if mouse_listener is None or keyboard_listener is None:
+                from pynput import keyboard, mouse
+                mouse_listener = mouse_listener or stamped(mouse.Listener, self)
+                keyboard_listener = keyboard_listener or stamped(keyboard.Listener, self)
+            self._listeners = (
+                mouse_listener(on_move=self.on_move, on_click=self.on_click, on_scroll=self.on_scroll),
+                keyboard_listener(on_press=self.on_press, on_release=self.on_release))
+            for listener in self._listeners:
+                listener.start()
+            for listener in self._listeners:
+                listener.wait()
+
+    def stop(self):
+        """Remove the listeners and disarm every sink."""
+        with self._lock:
+            listeners, self._listeners = self._listeners, ()
+            self.sinks = ()
+        for listener in listeners:
+            listener.stop()
+        for listener in listeners:
+            listener.join()
+
+    def stamp(self, ticks):
+        """Set the source timestamp of the event the current thread dispatches, None once done."""
+        self._local.time = self.clock.convert(ticks) if ticks is not None else None
+
+    def now(self):
+        """Return the time of the event being dispatched, in time.perf_counter seconds.
+
+        It is the source timestamp of the event when there is one, the
+        current time otherwise.
+        """
+        stamp = getattr(self._local, "time", None)
+        return stamp if stamp is not None else time.perf_counter()
+
+    def arm(self, sink):
+        """Start sending the events to sink, from the first one if the listeners weren't running."""
+        with self._lock:
+            if sink not in self.sinks:
+                self.sinks = self.sinks + (sink,)
+        self.start()
+
+    def disarm(self, sink):
+        """Stop sending the events to sink."""
+        with self._lock:
+            self.sinks = tuple(armed for armed in self.sinks if armed is not sink)
+
+    def bind(self, name, key, callback=None):
+        """Consume a key before the sinks get it.
+
+        Keyword arguments:
+        name -- identifies the binding, binding the same name again replaces it
+        key -- the pynput key, None to only remove the former binding
+        callback -- called without argument when the key is pressed
+        """
+        with self._lock:
+            bindings = dict(self._bindings)
+            bindings[name] = (key, callback)
+            self._bindings = bindings
+            self.hotkeys = {key: callback for key, callback in bindings.values() if key is not None}
+
+    def unbind(self, name):
+        """Let the key bound under name reach the sinks again."""
+        self.bind(name, None)
+
+    def on_move(self, x, y):
+        for sink in self.sinks:
+            sink.on_move(x, y)
+
+    def on_click(self, x, y, button, pressed):
+        for sink in self.sinks:
+            sink.on_click(x, y, button, pressed)
+
+    def on_scroll(self, x, y, dx, dy):
+        for sink in self.sinks:
+            sink.on_scroll(x, y, dx, dy)
+
+    def on_press(self, key):
+        hotkeys = self.hotkeys
+        if key in hotkeys:
+            callback = hotkeys[key]
+            if callback is not None:
+                callback()
+            return
+        for sink in self.sinks:
+            sink.on_press(key)
+
+    def on_release(self, key):
+        if key in self.hotkeys:
+            return
+        for sink in self.sinks:
+            sink.on_release(key)
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Fold the repeated parts of a capture into loops.
+
+Usage: python loops.py [-o OUT] [--time-tolerance S] [--position-tolerance PX] CAPTURE
+
+Every call of the capture, with the sleeps preceding it, becomes a token,
+the coordinates being rounded to the position tolerance. Comparing the
+tokens with themselves shifted by a period, one vectorized pass per
+period, gives the places where a block is directly followed by copies of
+itself. These runs are kept as long as replaying the first repetition in
+a loop keeps every event within the time tolerance of when it was
+recorded, and the most profitable ones are rewritten as
+`for _ in range(n):` whose body is the first repetition with the delays
+averaged over all of them.
+"""
+
+import argparse
+import sys
+from bisect import bisect_left
+
+import numpy
+
+import capture
+
+
+# Maximum shift, in seconds, of an event replayed from a loop
+TIME_TOLERANCE = 0.01
+# Coordinates closer than this, in pixels, are considered the same
+POSITION_TOLERANCE = 0
+# Longest block, in statements, searched for repetitions
+MAX_PERIOD = 2000
+# Minimum number of lines a loop must save to be written
+MIN_SAVING = 8
+INDENT = "    "
+
+
+def statements(lines):
+    """Group the lines of a capture by top level statement.
+
+    The sleeps are grouped with the statement following them, return the
+    groups and the time slept before each one.
+    """
+    groups = []
+    delays = []
+    sleeping = []
+    delay = 0.0
+    for line in lines:
+        slept = capture.parse_delay(line.strip()) if line.startswith("time.sleep(") else None
+        if groups and line[:1] in (" ", "\t"):
+            groups[-1].append(line)
+        elif slept is not None:
+            sleeping.append(line)
+            delay += slept
+        else:
+            groups.append(sleeping + [line])
+            delays.append(delay)
+            sleeping = []
+            delay = 0.0
+    if sleeping:
+        groups.append(sleeping)
+        delays.append(delay)
+    return groups, numpy.array(delays, dtype=numpy.float64)
+
+
+def _rounded(value, step):
+    if step and isinstance(value, int):
+        return round(value / step)
+    return value
+
+
+def tokenize(groups, position_tolerance=POSITION_TOLERANCE):
+    """Return a NumPy array with the token of every group of statements.
+
+    Calls get the same token when their coordinates only differ by less
+    than the tolerance, whatever the sleeps before them. The lines which
+    aren't calls are only equal to themselves.
+    """
+    ids = {}
+    tokens = numpy.empty(len(groups), dtype=numpy.int64)
+    for index, group in enumerate(groups):
+        statement = [line for line in group if not line.startswith("time.sleep(")]
+        line = statement[0].strip() if statement else ""
+        if len(statement) > 1:
+            key = "".join(statement)
+        else:
+            match = capture.CALL.match(line)
+            if match is None or line.startswith("#"):
+                # Comments, imports, blank lines and trailing sleeps never repeat
+                key = ("line", index)
+            else:
+                arguments = capture.parse_arguments(match.group(3)) if match.group(3) else ()
+                key = (match.group(1), match.group(2),
+                       tuple(_rounded(argument, position_tolerance) for argument in arguments))
+        tokens[index] = ids.setdefault(key, len(ids))
+    return tokens
+
+
+def periods(tokens, max_period=MAX_PERIOD):
+    """Return the distances worth checking for repetitions.
+
+    In a block repeated several times, the last occurrence of every token
+    of the block is followed by the same token one period later, so the
+    periods are among the distances from each token to its next occurrence.
+    """
+    order = numpy.argsort(tokens, kind="stable")
+    same = tokens[order][1:] == tokens[order][:-1]
+    gaps = numpy.diff(order)[same]
+    return numpy.unique(gaps[gaps <= max_period]).tolist()
+
+
+def body_delays(delays, start, period, repetitions):
+    """Return the delays of a loop body, averaged over the repetitions.
+
+    The loop then lasts exactly as long as the repetitions it replaces.
+    """
+    recorded = delays[start:start + period * repetitions].reshape(repetitions, period)
+    body = recorded.mean(axis=0)
+    same = (recorded == recorded[0]).all(axis=0)
+    body[same] = recorded[0][same]
+    return body
+
+
+def in_time(times, delays, start, period, repetitions, tolerance):
+    """Tell if replaying the repetitions as a loop keeps every event within tolerance."""
+    body = body_delays(delays, start, period, repetitions)
+    base = times[start] - delays[start]
+    replayed = base + numpy.arange(repetitions)[:, None] * body.sum() + numpy.cumsum(body)
+    recorded = times[start:start + period * repetitions].reshape(repetitions, period)
+    return numpy.abs(replayed - recorded).max() <= tolerance
+
+
+def _longest(fits, low, high):
+    """Return the largest count in [low, high] accepted by fits, fits(low) being true."""
+    step = 1
+    while low + step <= high and fits(low + step):
+        low += step
+        step *= 2
+    step //= 2
+    while step:
+        if low + step <= high and fits(low + step):
+            low += step
+        step //= 2
+    return low
+
+
+def find_runs(tokens, delays, max_period=MAX_PERIOD, time_tolerance=TIME_TOLERANCE):
+    """Return the tandem repeats of tokens as (start, period, repetitions).
+
+    For each period, the tokens equal to the token `period` places further
+    form stretches, a stretch at least `period` long is a block repeated
+    at least twice. The stretch is cut into runs that replayed as a loop
+    keep the events within time_tolerance of when they were recorded.
+    """
+    times = numpy.cumsum(delays)
+    # The sums of the delays of the file don't add up exactly the same way
+    tolerance = max(time_tolerance, 1e-6)
+    runs = []
+    for period in periods(tokens, max_period):
+        equal = numpy.concatenate(([0], tokens[period:] == tokens[:-period], [0])).astype(numpy.int8)
+        edges = numpy.diff(equal)
+        starts = numpy.flatnonzero(edges == 1)
+        lengths = numpy.flatnonzero(edges == -1) - starts
+        for start, length in zip(starts[lengths >= period].tolist(), lengths[lengths >= period].tolist()):
+            available = (length + period) // period
+            while available > 1:
+                repetitions = _longest(
+                    lambda count: in_time(times, delays, start, period, count, tolerance), 1, available)
+                if repetitions > 1:
+                    runs.append((start, period, repetitions))
+                start += period * repetitions
+                available -= repetitions
+    return runs
+
+
+def select(runs, min_saving=MIN_SAVING):
+    """Keep the runs saving the most statements without overlapping."""
+    chosen_starts, chosen_ends, chosen = [], [], []
+    for start, period, repetitions in sorted(runs, key=lambda run: (run[1] - run[1] * run[2], run[0])):
+        if period * (repetitions - 1) - 1 < min_saving:
+            continue
+        end = start + period * repetitions
+        i = bisect_left(chosen_starts, start)
+        if i < len(chosen_starts) and chosen_starts[i] < end:
+            continue
+        if i > 0 and chosen_ends[i - 1] > start:
+            continue
+        chosen_starts.insert(i, start)
+        chosen_ends.insert(i, end)
+        chosen.insert(i, (start, period, repetitions))
+    return chosen
+
+
+def fold(lines, time_tolerance=TIME_TOLERANCE, position_tolerance=POSITION_TOLERANCE,
+         max_period=MAX_PERIOD, min_saving=MIN_SAVING):
+    """Return the lines of the capture with its repeated blocks as loops.
+
+    The body of a loop is the first repetition with the delays averaged
+    over the repetitions, so every event stays within the tolerances. The
+    loops written are also returned, as (first statement, statements in
+    the body, repetitions).
+
+    Keyword arguments:
+    lines -- the lines of the capture, with their line ends
+    time_tolerance -- maximum shift of a replayed event, in seconds
+    position_tolerance -- coordinates closer than this, in pixels, are the same
+    max_period -- longest block searched for repetitions, in statements
+    min_saving -- minimum number of lines a loop must save
+    """
+    groups, delays = statements(lines)
+    tokens = tokenize(groups, position_tolerance)
+    loops = select(find_runs(tokens, delays, max_period, time_tolerance), min_saving)
+    folded = []
+    position = 0
+    for start, period, repetitions in loops:
+        for group in groups[position:start]:
+            folded.extend(group)
+        folded.append(f"for _ in range({repetitions}):\n")
+        body = body_delays(delays, start, period, repetitions)
+        for group, delay in zip(groups[start:start + period], body.tolist()):
+            if delay > 0:
+                folded.append(f"{INDENT}time.sleep({delay})\n")
+            folded.extend(INDENT + line if line.strip() else line for line in group
+                          if not line.startswith("time.sleep("))
+        position = start + period * repetitions
+    for group in groups[position:]:
+        folded.extend(group)
+    return folded, loops
+
+
+def main(argv=None):
+    """Fold the capture given on the command line."""
+    parser = argparse.ArgumentParser(description="Fold the repeated parts of a capture into loops.")
+    parser.add_argument("path", metavar="CAPTURE", help="the capture to fold")
+    parser.add_argument("-o", "--output", help="where to write the folded capture (default: in place)")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE, metavar="S",
+                        help=f"maximum shift of a replayed event (default {TIME_TOLERANCE})")
+    parser.add_argument("--position-tolerance", type=int, default=POSITION_TOLERANCE, metavar="PX",
+                        help=f"coordinates closer than this are the same (default {POSITION_TOLERANCE})")
+    args = parser.parse_args(argv)
+
+    with open(args.path, encoding="utf-8") as f:
+        lines = f.readlines()
+    folded, loops = fold(lines, args.time_tolerance, args.position_tolerance)
+    with open(args.output or args.path, "w", encoding="utf-8") as f:
+        f.writelines(folded)
+    before, after = ("".join(text).encode("utf-8") for text in (lines, folded))
+    print(f"{len(loops)} loops, {len(lines)} -> {len(folded)} lines, "
+          f"{len(before)} -> {len(after)} bytes", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,8 @@
 
 """Entry point of the program."""
 
+import multiprocessing
+
 import wx
 
 import gui
@@ -35,5 +37,7 @@ class Atbswp(wx.App):
 
 
 if __name__ == "__main__":
+    # In a frozen build the capture process re-runs this program, it must serve instead of opening the GUI
+    multiprocessing.freeze_support()
     app = Atbswp(0)
     app.MainLoop()
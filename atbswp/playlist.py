@@ -0,0 +1,66 @@
+"""Playlists chaining several captures.
+
+A playlist is a JSON file listing captures, each replayed a number of
+times at a given speed before the next one starts:
+
+    {"items": [{"path": "login.py"},
+               {"path": "workflow.py", "repeat": 3, "speed": 2.0},
+               "logout.py"]}
+
+A bare string is an item replayed once at the recorded speed. Relative
+paths are relative to the playlist.
+"""
+
+# atbswp: Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import os
+from collections import namedtuple
+
+
+Item = namedtuple("Item", "path repeat speed", defaults=(1, 1.0))
+
+
+def _item(entry, directory):
+    """Return the Item described by an entry of the JSON file."""
+    if isinstance(entry, str):
+        entry = {"path": entry}
+    if not isinstance(entry, dict) or not isinstance(entry.get("path"), str):
+        raise ValueError(f"an item needs a path: {entry!r}")
+    repeat = entry.get("repeat", 1)
+    speed = entry.get("speed", 1.0)
+    if isinstance(repeat, bool) or not isinstance(repeat, int) or repeat < 1:
+        raise ValueError(f"the repeat count of {entry['path']} must be a positive integer")
+    if isinstance(speed, bool) or not isinstance(speed, (int, float)) or speed <= 0:
+        raise ValueError(f"the speed of {entry['path']} must be a positive number")
+    return Item(os.path.join(directory, os.path.expanduser(entry["path"])), repeat, float(speed))
+
+
+def load(path):
+    """Return the list of Item of the playlist at path.
+
+    Raise ValueError when the file isn't a valid playlist, OSError when
+    it can't be read. The captures themselves are only read when played.
+    """
+    with open(path, encoding="utf-8") as f:
+        content = json.load(f)
+    entries = content.get("items") if isinstance(content, dict) else None
+    if not isinstance(entries, list) or not entries:
+        raise ValueError("a playlist is an object with a non empty list of items")
+    directory = os.path.dirname(os.path.abspath(path))
+    return [_item(entry, directory) for entry in entries]
+
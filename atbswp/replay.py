@@ -0,0 +1,457 @@
+"""Execution of the captures, on the screen or against a virtual clock.
+
+Usage: python replay.py [--json] [--mouse-rate HZ] CAPTURE
+
+Replays CAPTURE without touching the mouse or the keyboard and prints
+every call it would have made, with the time it would have been made.
+"""
+
+# atbswp: Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# A capture is a Python program importing pyautogui, time and sometimes
+# checkpoint. It runs in a namespace whose __import__ hands out stand-ins
+# for these modules, so the same program either drives the screen with an
+# interruptible sleep or fills a timeline while a virtual clock advances.
+import argparse
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import sampling
+
+
+# Number of lines compiled at once, compiling a whole capture of millions
+# of lines in one go is much slower than compiling it in blocks
+BLOCK_SIZE = 256
+# Delay added by pyautogui after each call it makes (pyautogui.PAUSE)
+PAUSE = 0.1
+# Screen reported by the virtual backend
+SCREEN_SIZE = (1920, 1080)
+
+Step = namedtuple("Step", "time function arguments")
+
+
+class Stopped(Exception):
+    """Raised inside a capture to interrupt it."""
+
+
+class InterruptibleTime:
+    """The time module, with a sleep returning early when stop is set.
+
+    Keyword arguments:
+    stop -- threading.Event ending the replay
+    speed -- the sleeps are divided by it (default 1.0)
+    """
+
+    def __init__(self, stop, speed=1.0):
+        self.stop = stop
+        self.speed = speed
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+    def sleep(self, seconds):
+        """Wait for seconds, raise Stopped if the replay is ended meanwhile."""
+        if self.stop.wait(seconds / self.speed):
+            raise Stopped
+
+
+class VirtualClock:
+    """Stand-in for the time module where sleeping takes no time."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def sleep(self, seconds):
+        """Advance the simulated time."""
+        if seconds > 0:
+            self.now += seconds
+
+    def time(self):
+        """Return the simulated time."""
+        return self.now
+
+    monotonic = perf_counter = time
+
+
+class RecordingBackend:
+    """Stand-in for pyautogui which records the calls instead of making them.
+
+    Each call is appended to `timeline` as a Step at the current time of the
+    clock, which then advances by PAUSE like pyautogui would sleep unless
+    the call is made with _pause=False.
+
+    Keyword arguments:
+    clock -- the VirtualClock of the replay
+    screen_size -- the (width, height) returned by size()
+    """
+
+    FAILSAFE = True
+    PAUSE = PAUSE
+
+    def __init__(self, clock, screen_size=SCREEN_SIZE):
+        self.clock = clock
+        self.screen_size = screen_size
+        self.timeline = []
+        self._position = (0, 0)
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        function = f"pyautogui.{name}"
+
+        def call(*arguments, _pause=True, **keywords):
+            if keywords:
+                arguments += tuple(keywords.items())
+            self.timeline.append(Step(self.clock.now, function, arguments))
+            if len(arguments) >= 2 and isinstance(arguments[0], int):
+                self._position = arguments[:2]
+            if _pause:
+                self.clock.sleep(self.PAUSE)
+
+        # Cache the recorder, the next calls don't go through __getattr__
+        setattr(self, name, call)
+        return call
+
+    def position(self, *arguments):
+        """Return where the pointer would be."""
+        return self._position
+
+    def size(self, *arguments):
+        """Return the size of the virtual screen."""
+        return self.screen_size
+
+    def onScreen(self, x, y=None):
+        """Tell if the point is on the virtual screen."""
+        if y is None:
+            x, y = x
+        return 0 <= x < self.screen_size[0] and 0 <= y < self.screen_size[1]
+
+
+class VirtualCheckpoint:
+    """Stand-in for the checkpoint module, the screen always matches."""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def wait_for(self, region, expected, *arguments, **keywords):
+        """Record the checkpoint and go on right away."""
+        backend = self.backend
+        backend.timeline.append(Step(backend.clock.now, "checkpoint.wait_for", (tuple(region),)))
+        return True
+
+
+def compile_capture(lines, filename="<capture>", block_size=BLOCK_SIZE):
+    """Compile the lines of a capture into a list of code objects.
+
+    A block only ends before an unindented line so the statements spanning
+    several lines stay in one piece.
+
+    Keyword arguments:
+    lines -- iterable of the lines of the capture, with their line ends
+    filename -- name shown in the tracebacks
+    block_size -- minimum number of lines compiled at once
+    """
+    program = []
+    block = []
+    for line in lines:
+        if len(block) >= block_size and line[:1] not in (" ", "\t"):
+            program.append(compile("".join(block), filename, "exec"))
+            block = []
+        block.append(line)
+    if block:
+        program.append(compile("".join(block), filename, "exec"))
+    return program
+
+
+class InterruptibleCheckpoint:
+    """The checkpoint module, polling the screen with the sleep of the replay.
+
+    Keyword arguments:
+    checkpoint -- the checkpoint module
+    clock -- the InterruptibleTime of the replay
+    """
+
+    def __init__(self, checkpoint, clock):
+        self.checkpoint = checkpoint
+        self.clock = clock
+
+    def __getattr__(self, name):
+        return getattr(self.checkpoint, name)
+
+    def wait_for(self, region, expected, *arguments, **keywords):
+        """Wait for the screen, raise Stopped if the replay is ended meanwhile."""
+        return self.checkpoint.wait_for(region, expected, *arguments, sleep=self.clock.sleep, **keywords)
+
+
+def run(program, modules, stop=None):
+    """Execute a compiled capture.
+
+    Keyword arguments:
+    program -- the list returned by compile_capture
+    modules -- the objects imported instead of the modules of these names
+    stop -- threading.Event raising Stopped between two blocks when set
+    """
+    def import_module(name, globals=None, locals=None, fromlist=(), level=0):
+        if name in modules:
+            return modules[name]
+        return builtins.__import__(name, globals, locals, fromlist, level)
+
+    namespace = {"__builtins__": dict(vars(builtins), __import__=import_module),
+                 "__name__": "__capture__"}
+    namespace.update(modules)
+    for code in program:
+        # A capture without sleeps never goes through InterruptibleTime
+        if stop is not None and stop.is_set():
+            raise Stopped
+        exec(code, namespace)
+
+
+def play(program, stop, speed=1.0):
+    """Replay a compiled capture on the screen.
+
+    Return False if it was interrupted by setting stop.
+
+    Keyword arguments:
+    program -- the list returned by compile_capture
+    stop -- threading.Event ending the replay at the next sleep, checkpoint or block
+    speed -- how many times faster than recorded the pauses are (default 1.0)
+    """
+    # Only the real replay needs a display
+    import checkpoint
+    import pyautogui
+
+    clock = InterruptibleTime(stop, speed)
+    try:
+        run(program, {"pyautogui": pyautogui, "time": clock,
+                      "checkpoint": InterruptibleCheckpoint(checkpoint, clock)}, stop)
+    except Stopped:
+        return False
+    return True
+
+
+class ProgramCache:
+    """Compiled capture of a file, compiled again only when it changes.
+
+    A replay looping on the same file only costs a stat of the file per
+    iteration instead of reading and compiling it again.
+    """
+
+    def __init__(self):
+        self.program = None
+        self.key = None
+
+    def load(self, path, mouse_rate=0):
+        """Return the compiled capture at path.
+
+        Keyword arguments:
+        path -- the capture file
+        mouse_rate -- replay the mouse paths at this rate, 0 to keep them as recorded
+        """
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size, mouse_rate)
+        if key != self.key:
+            with open(path, encoding="utf-8") as f:
+                lines = f.readlines()
+            if mouse_rate > 0:
+                lines = sampling.resample(lines, mouse_rate)
+            self.program = compile_capture(lines, path)
+            self.key = key
+        return self.program
+
+
+class Player:
+    """Replay captures over and over on one long-lived thread.
+
+    The worker thread is started by the first replay and then waits for
+    the next request between two runs, looping doesn't create threads.
+    The captures of a playlist are loaded one item ahead by a second
+    thread, the next item starts as soon as the current one ends.
+
+    Keyword arguments:
+    play -- makes one replay, called with the program and the stop event,
+            and the speed keyword for the items of a playlist, returns
+            False when interrupted (default play)
+    """
+
+    def __init__(self, play=play):
+        self._play = play
+        self._condition = threading.Condition()
+        self._request = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._preloader = None
+        self._closed = False
+
+    def start(self, load, count, infinite, report):
+        """Replay count times, or until end is called when infinite.
+
+        A run in progress is interrupted first.
+
+        Keyword arguments:
+        load -- called before each replay, returns the compiled capture
+        count -- number of replays
+        infinite -- ignore count and replay until end is called
+        report -- called by the worker after each replay with the remaining
+                  count, whether the run goes on and the exception raised
+                  by load or the replay, if any
+        """
+        self._submit(self._run, load, count, infinite, report)
+
+    def start_playlist(self, items, load, count, infinite, report):
+        """Replay the items of a playlist in order, count times or until end is called when infinite.
+
+        A run in progress is interrupted first. The capture of the next
+        item is loaded while the current one plays.
+
+        Keyword arguments:
+        items -- the list of playlist.Item
+        load -- called with the path of an item, returns the compiled capture
+        count -- number of replays of the whole playlist
+        infinite -- ignore count and replay until end is called
+        report -- called by the worker after each replay of the playlist,
+                  like for start
+        """
+        with self._condition:
+            if self._preloader is None:
+                self._preloader = ThreadPoolExecutor(1, thread_name_prefix="atbswp-preload")
+        self._submit(self._run_playlist, items, load, count, infinite, report)
+
+    def _submit(self, run, *arguments):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("the player is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._work, name="atbswp-player", daemon=True)
+                self._thread.start()
+            self._stop.set()
+            self._stop = threading.Event()
+            self._request = (run, arguments + (self._stop,))
+            self._condition.notify()
+
+    def end(self):
+        """Interrupt the current run at its next sleep."""
+        self._stop.set()
+
+    def close(self):
+        """Interrupt the current run and stop the worker thread."""
+        with self._condition:
+            self._closed = True
+            self._stop.set()
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        if self._preloader is not None:
+            self._preloader.shutdown()
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while self._request is None and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                (run, arguments), self._request = self._request, None
+            run(*arguments)
+
+    def _run(self, load, count, infinite, report, stop):
+        remaining = count
+        while not stop.is_set() and (infinite or remaining > 0):
+            try:
+                completed = self._play(load(), stop)
+            except Exception as error:
+                report(remaining, False, error)
+                return
+            if not completed or stop.is_set():
+                return
+            if not infinite:
+                remaining -= 1
+            report(remaining, infinite or remaining > 0, None)
+
+    def _run_playlist(self, items, load, count, infinite, report, stop):
+        steps = [item for item in items for _ in range(item.repeat)]
+        if not steps:
+            return
+        remaining = count
+        index = 0
+        preload = self._preloader.submit(load, steps[0].path)
+        while not stop.is_set() and (infinite or remaining > 0):
+            item = steps[index]
+            index = (index + 1) % len(steps)
+            last = index == 0
+            try:
+                program = preload.result()
+                if not last or infinite or remaining > 1:
+                    preload = self._preloader.submit(load, steps[index].path)
+                completed = self._play(program, stop, speed=item.speed)
+            except Exception as error:
+                report(remaining, False, error)
+                return
+            if not completed or stop.is_set():
+                return
+            if last:
+                if not infinite:
+                    remaining -= 1
+                report(remaining, infinite or remaining > 0, None)
+
+
+def dry_run(program, screen_size=SCREEN_SIZE):
+    """Replay a compiled capture against a virtual clock.
+
+    Return the list of Step which would have been made and the simulated
+    duration of the replay.
+    """
+    clock = VirtualClock()
+    backend = RecordingBackend(clock, screen_size)
+    run(program, {"pyautogui": backend, "time": clock, "checkpoint": VirtualCheckpoint(backend)})
+    return backend.timeline, clock.now
+
+
+def main(argv=None):
+    """Print the timeline of the capture given on the command line."""
+    parser = argparse.ArgumentParser(description="Replay a capture against a virtual clock.")
+    parser.add_argument("path", metavar="CAPTURE", help="the capture to replay")
+    parser.add_argument("--json", action="store_true", help="print the timeline as JSON")
+    parser.add_argument("--mouse-rate", type=int, default=0, metavar="HZ",
+                        help="replay the mouse paths at this fixed rate (default: as recorded)")
+    args = parser.parse_args(argv)
+
+    with open(args.path, encoding="utf-8") as f:
+        lines = f.readlines()
+    if args.mouse_rate > 0:
+        lines = sampling.resample(lines, args.mouse_rate)
+    program = compile_capture(lines, args.path)
+    timeline, duration = dry_run(program)
+
+    if args.json:
+        json.dump({"duration": duration, "timeline": [step._asdict() for step in timeline]}, sys.stdout)
+        print()
+        return
+    for step in timeline:
+        print(f"{step.time:12.3f}  {step.function}({', '.join(map(repr, step.arguments))})")
+    print(f"{len(timeline)} calls, {duration:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Icons and translations of the interface, loaded once and cached."""
+
+# atbswp: Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+# The content of img/ and lang/ is packed into resources_data.py, run
+# `python resources.py` after modifying one of those directories.
+import base64
+import io
+import os
+import sys
+from pathlib import Path
+
+import wx
+
+
+DEFAULT_LANGUAGE = "en"
+DATA_MODULE = "resources_data.py"
+
+_images = None
+_locales = None
+_bitmaps = {}
+_icons = {}
+
+
+def _source_dir():
+    """Return the directory containing img/ and lang/."""
+    if getattr(sys, 'frozen', False):
+        return Path(sys._MEIPASS)
+    return Path(__file__).parent.absolute()
+
+
+def _read_sources():
+    """Read the raw resources from img/ and lang/."""
+    root = _source_dir()
+    images = {name: (root / "img" / name).read_bytes()
+              for name in sorted(os.listdir(root / "img"))
+              if name.endswith(".png")}
+    locales = {name: (root / "lang" / name).read_text(encoding="utf-8")
+               for name in sorted(os.listdir(root / "lang"))}
+    return images, locales
+
+
+def _load():
+    """Unpack the bundle, or read the directories if it wasn't built."""
+    global _images, _locales
+    if _images is not None:
+        return
+    try:
+        import resources_data
+    except ImportError:
+        _images, _locales = _read_sources()
+        return
+    _images = {name: base64.b64decode(data)
+               for name, data in resources_data.IMAGES.items()}
+    _locales = dict(resources_data.LOCALES)
+
+
+def bitmap(name):
+    """Return the decoded bitmap of img/name."""
+    try:
+        return _bitmaps[name]
+    except KeyError:
+        pass
+    _load()
+    image = wx.Image(io.BytesIO(_images[name]), wx.BITMAP_TYPE_ANY)
+    _bitmaps[name] = wx.Bitmap(image)
+    return _bitmaps[name]
+
+
+def icon(name):
+    """Return img/name as an icon."""
+    try:
+        return _icons[name]
+    except KeyError:
+        pass
+    _icons[name] = wx.Icon()
+    _icons[name].CopyFromBitmap(bitmap(name))
+    return _icons[name]
+
+
+def languages():
+    """Return the available languages."""
+    _load()
+    return sorted(_locales)
+
+
+def locale(language):
+    """Return the strings of the interface in the given language.
+
+    Strings missing from a translation are taken from the default language.
+    """
+    _load()
+    default = _locales[DEFAULT_LANGUAGE].splitlines()
+    strings = _locales.get(language, "").splitlines()
+    return strings + default[len(strings):]
+
+
+def build(path=None):
+    """Write the bundle module from the content of img/ and lang/."""
+    images, locales = _read_sources()
+    lines = ["# Generated by resources.py from img/ and lang/, do not edit.",
+             "IMAGES = {"]
+    for name, data in images.items():
+        encoded = base64.b64encode(data).decode("ascii")
+        lines.append(f"    {name!r}: (")
+        for start in range(0, len(encoded), 76):
+            lines.append(f"        b'{encoded[start:start + 76]}'")
+        lines[-1] += "),"
+    lines.append("}")
+    lines.append("LOCALES = {")
+    for name, text in locales.items():
+        lines.append(f"    {name!r}: {text!r},")
+    lines.append("}")
+    path = path or Path(__file__).parent / DATA_MODULE
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,589 @@
+# Generated by resources.py from img/ and lang/, do not edit.
+IMAGES = {
+    'cog.png': (
+        b'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAC6XpUWHRSYXcgcHJvZmlsZSB0eXBl'
+        b'IGV4aWYAAHja7ZddstwoDIXfWUWWgCSExHIwP1XZwSw/B2z37b65M0lq5mmqTRmwwEI+n4y7w/jr'
+        b'+wzfcFDJHJKa55JzxJFKKlzR8XgeZdcU0673ka4hXL/Yw2OAYRK0cl5aveZX2PXjhnsNOl7twa8R'
+        b'9svRNXA7lLUyo9Ofg4SdTztdkYQyzk4ubs+hHny27Q7ZP85p2/XDyboOz4ZkUKkrZgnzEJK463RG'
+        b'IOdZcQpqFgS1Rnffw27uSCDIy+PdbYzPAr2IfPfCZ/UfvU/ic73s8knLfGmEzpcDpF+LvyV+Wlge'
+        b'EfHrgMnt6guRZ/c5x/l0NWUomq+MiuFWZ6s/+wHJZd+WUQynom+7FBSPNTbA6bHFA6VRIQaVGShR'
+        b'p0qTxm4bNYSYeLChZW4s2+ZiXLjJyQmFJpsU6eKA1XgEoEzCj1hor1v2eo0cK3fCVCY4I9zytyX8'
+        b'0+CflDBnWxJR9IdWiItX5iKMRW7VmAUgNC9uugW+y4U/PuUPUhUEdcvseMAaj9PFofSRW7I5C+Yp'
+        b'2vOtoGD9cgCJsLYiGBIQiJlEKVM0ZiOCjg5AFZHjReADBEiVO4LkJIL9yNh5rY17jPZcVs68zNib'
+        b'AEIli4FNkQpYKSnyx5Ijh6qKJlXNaupBi9YsOWXNOVtem1w1sWRq2czcilUXT66e3dy9eC1cBHug'
+        b'llyseCmlVg4VC1X4qphfYTn4kCMdeuTDDj/KURvSp6WmLTdr3kqrnbt0bBM9d+veS6+DwsBOMdLQ'
+        b'kYcNH2XUiVybMtPUmadNn2XWB7WL6k/lD6jRRY03qTXPHtRgDWa3C1rbiS5mIMaJQNwWASQ0L2bR'
+        b'KSVe5BazWLCziTKC1MUmdFrEgDANYp30YPdB7re4BfXf4sa/IhcWuv+CXAC6n7l9Qa2v71zbxM63'
+        b'cGkaBW8fxofXwF7XR63+2/bt6O3o7ejt6O3o7ejt6H/gaOLHA/7Ehh8ltZ3i0B46lAAAAYRpQ0NQ'
+        b'SUNDIHByb2ZpbGUAAHicfZE9SMNAHMVfW6UiLQ4WlOIQsDpZEBVx1CoUoUKoFVp1MLn0C5o0JCku'
+        b'joJrwcGPxaqDi7OuDq6CIPgB4uTopOgiJf4vKbSI8eC4H+/uPe7eAf5Ghalm1zigapaRTiaEbG5V'
+        b'CL4igAGEEcWwxEx9ThRT8Bxf9/Dx9S7Os7zP/TnCSt5kgE8gnmW6YRFvEE9vWjrnfeIIK0kK8Tnx'
+        b'mEEXJH7kuuzyG+eiw36eGTEy6XniCLFQ7GC5g1nJUImniGOKqlG+P+uywnmLs1qpsdY9+QtDeW1l'
+        b'mes0h5DEIpYgQoCMGsqowEKcVo0UE2naT3j4o45fJJdMrjIYORZQhQrJ8YP/we9uzcLkhJsUSgDd'
+        b'L7b9MQIEd4Fm3ba/j227eQIEnoErre2vNoCZT9LrbS12BPRtAxfXbU3eAy53gMEnXTIkRwrQ9BcK'
+        b'wPsZfVMO6L8Fetfc3lr7OH0AMtRV6gY4OARGi5S97vHuns7e/j3T6u8HY/1yoZclrCIAAAAGYktH'
+        b'RAD/AP8A/6C9p5MAAAAJcEhZcwAADtMAAA7TAY57uK4AAAAHdElNRQfkAxcNHBlBq4AMAAADvklE'
+        b'QVR42u3aS2hcVRgH8F+aGjFpm0ZbBFtR0eqiiOILn6hFiuJCQbAI4tKqG5euRZTE4kbpoj7ACj42'
+        b'1rr1sRO1grgywSoaNKmP2sRJW2PTFl3MNzCU6czcO/fcZur9w1ndO+f7f/9z55zvcahQoUKFChUq'
+        b'/F8xUKKtC/EQbsJmbMQYhrCEOcziW+zD+/jjbBL7dfybYewqg9SKEgW4LOP7l55tAixLVAJUAvSG'
+        b'czrMMYBRXI+LM859SZwYazucViuCR+m4HBN4Eue3eD6Mh7EHf2U8ARpjAXvxCEZa2LgAT+FFXFGm'
+        b'86P4EifxN77GfRhsEmcPajkdbyXEh9gU8w/ifnwT9k9G7DBahvMjeKcFyUW8ijsxWZDjp44p3I03'
+        b'8E+L5+9iVUrnV2J7rMjpSB5P5HxjnOjwpWwPnkmwIeHqFjUmg2eSvGHHMne+MXakyHM243CfCHA4'
+        b'+BaK3X3ifGPsLtL5KzFdMMHGEVprOsqKnH86eHfc1bvBbVhXkJjH8Bm+CJJHsDqyv5txO84twM66'
+        b'4L2/CAHWFBRu/oxn8AnmY9U1BTdj2IrxHKFzqzB9dZGR33OY6XAOtxszsSLd4I6oDuWNE2bwbCxc'
+        b'obgWr+BgRlJ/4q6MtrbgUEY7B/EyrkkZDQ5HdvdbBmLP54w7xjPY+DV4nVdWMXWuS2K/x+aWB7dm'
+        b'+Nrm8gQ/eesBa2LD6gY/4EBOO7P4vst3x/Jser0I0C1qOJrTztGoJaTg1TclsaS9i7wCLGQ8QvPm'
+        b'6KuiJJaCV88CzHf57iZc1EP63W2paz6SoOQCDOM69XZWN1iPB3J8ygN4MEMIvoQbg18y5A2EDuGe'
+        b'jLa2Zjhqm+3sjAUqvAjaayh8IEM0uCXezxsKz+KFjPtHWzwdWVyvKeoveDT+FitbJGbr8VgI3aut'
+        b'Y8G7kHS4FsXOoR6F3BgV3c+jrD4dZ/1IpMO3xBgqYNFO5NkU2+3kKQoii0FyMVFB5Koi94E3+6wk'
+        b'9laKouhCnzh/BFenCEkn+kSAl1KF0BvU7/AsZ+enJGqMNE6Nx53Z1li7+RfwhIStMXFkva11c/Q1'
+        b'9eZoqq9kMubfFfZOff6exM3R5ry7U3t8r+La4zV8EPM2Ksj3ht1GT+ErJbXHNTk5rv0FiW16uydQ'
+        b'i99vO02SMxaf/ISSL0g01947XZFZG8XKqYzO78cNXcTzZ+yKTFZ8lFGAT8sgVd0SqwSoBCgN0xnf'
+        b'/6kMUoMlCrAPP6r3CY+H+EPBYSnKbN/hY/XbZjvl7ydUqFChQoUKFSp0xH+Lbc1UZxXjBgAAAABJ'
+        b'RU5ErkJggg=='),
+    'download.png': (
+        b'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAGt3pUWHRSYXcgcHJvZmlsZSB0eXBl'
+        b'IGV4aWYAAHja7ZhpjuQ4DoX/6xRzBEvUehxtBPoGffz5KDuiMquqZ6rQjQEGyDDCdmihqPdIigy3'
+        b'//xD3b/4hJKDi6nU3HK++MQWW+i81Ov+tHP3Vzz384lPF78/tbt3R6BJeMr9s/RnfKc9fZvwWsOP'
+        b'z+2uPj2hPoKejpdAsZUDL+ujkrSHu90/mri275fcavmo6gj3c75Urt++Wo7otxD77T42xAJKKzFK'
+        b'Qtji5Tr3eGsgaCdNOnfPPUhi3HVaglTHI8r1aAIgn7b3el7XR4A+gfx6c9+j/377DvzQn3b5Dsv8'
+        b'YMTLTzt8+jn4B+IPC8tbo/C5o8mbmB9B1lVV9727HjOI5seiLvdC56CvawC5nGmZq/BNvJdzNa56'
+        b'9WtCzrrmNbimbz7Aijof/fLdq9/nOf1ExRh2KDxDmEFOW5USWpiHuWiX11BgbEmFsxm2E6E5vHXx'
+        b'Z9121pu+svLyDA0eYZ4pf3m5/9T5O5dTnQaRv+obK/QKZrmoYczZnVEQ4vXhLR2AX9dD//XBfsxU'
+        b'I8MM5soG+zVuESP5b7Ylh2dhXOJ5e4V3ZT0CgIi1E8rgAtFf2Uvy2V8lhOI9OFYI6mgeJIYBAz6l'
+        b'sFAyRBHiUQk12NrMKf6MDSnkYM3EJohIkqXADT4FWTEm7KfEig31JCmmlHIqqbrUUs+SY04555It'
+        b'yPUiJZZUcimlllZ6lRprqrmWWmurvYUmxMDUciutttZ6D66zUEdWZ3ynZYQhI4408iijjjb6xHxm'
+        b'nGnmWWadbfYVlizCxMqrrLra6tu7TaTYcaedd9l1t90VW1PRqEmzFq3atL9Ze1j94foN1vzDWjhM'
+        b'2bjyZo1WV8pLhLdwkowzGAvRw3gxBjDoYJxd1ccYjDnj7GoBp0gBJZNx45Y3xqAwbh+S+jd335j7'
+        b'Jd5cqr/EW/hvzDmj7p9gzkHdj7z9hLVl59w8jN1eaJhegvfRv2t3oXY71PrffX4J+hL0JehL0Jeg'
+        b'/52gttdeOnUtlbzWqHu1vmsq0xPdtZWtBPpZhXOgUcyUoBRWSaz1qlmdLt75sUkvdc8+pG8SIB2C'
+        b'XLXSC6lDlIRS94gXj5gyR83qR0hO2kQHgqTMiRrTD87YWUbT1Oe81VyzjSmDw+oW2ucuuls7S6fd'
+        b'7JSTopldONEVNOc5i84hDJTGYZYRNEMPozOpRrHpNtm+4dw121G9dQrHX+KAZEQZg8NZd2pbtC+r'
+        b'IpKPyWqmX3+6XxroFyeuBxQx5Ca1106G6EoaQ6lbSP1MzRrz2LAzqo7I4Sxz6pbVUJR5mc0OpoiW'
+        b'Sr60c4CWPA9OOXftoFySe7Dv1CuMZH8kH5uNXnkDWDbhEcC2p8+TgOkiiVUN+cwbvrOA+lhc7RiP'
+        b'NYWiJEpr5gNly9C3t45UeoKHYGrAm0JfQ9yZQZa41I8MD9mxoUu3ltvgWKyaFUBoUSu0lSwmY2pk'
+        b'YctsFWuUPQfWm9n2YkHBbrAYsyPTYMo2fJREiqRxiYETjqGmM33fAAzQJqtfyCs6ctnRzHXWrQ4b'
+        b'1D6B7CozkqAxZGBXmCuIi9AyWZR6z+pdDUMrCd6+BaH/8sYI2jgSKdvKxAY3XPlN5sWYWLhrQ58B'
+        b'LF2bEQvwtcQxBv3jGGgzMxiC7bnirWWQe+3u707xVnMuKKpVJs6UmQkC/cpzmZhNUogHTFMqLQCB'
+        b'C8DWQ4X9x4AOUAH5M6LbmW1bwIeOQRmWYZLPA/Ihwud+Asl1UUK8Xv7u8xYkwxJv+JqRLa52mz9f'
+        b'IB5x0YSJzEMenikY3vbm3yA0zNRooITo1+4PWVXX1NawESYHo6tZZtvNTYR6WRt4w5tsOZAc617V'
+        b'4py72h3jIInE+Q5x9O+xsl+bdB3TtVAz1okPTyQaBjEuw33htriMy+XxmeNYk9jHuqfNB0rvUc6q'
+        b'YRExm23Y/llqpZrb35Fq2wpNnPnxSGZCUKJm9mtbdIOZnqhByPi1Voqkwyr1Aobfh42PpaWzCDpr'
+        b'cYfXPc3HMWRrq9jgyGpx5dbLBpfZrNss6I4KGIqw4Wp1BmFGHB7eBDOZ+IKB1jNLJr0sFOP2OAu/'
+        b'Cc3Lgvttb/mEd7jd1MYJJjwGTzwCyp4sVI3jmHAU8kqQZFuhEqHPY4eBmH4CDo+3Xe9FxYZW+1g2'
+        b'q65++ArJglprwzYBxTghbp/L2thaW3c0BX4qH1a1EHVzKJrctS5Bl4PEsv9NnlU5BgqUWwClxoL2'
+        b'XuNtHE+QlUR5CBFqau3ojIUTm6FJA0g0YjvmeXxJf9dF/jFf+/8VdFIRouG/AbAmhL26U5eiAAAB'
+        b'hGlDQ1BJQ0MgcHJvZmlsZQAAeJx9kT1Iw1AUhU9TxaIVBzuoOGSoThZERRy1CkWoEGqFVh1MXvoH'
+        b'TRqSFBdHwbXg4M9i1cHFWVcHV0EQ/AFxcXVSdJES70sKLWJ8cHkf571zuO8+QKiXmWZ1jAOabpup'
+        b'RFzMZFfFrlf0YBAhqqDMLGNOkpLwXV/3CPD9Lsaz/O/9uXrVnMWAgEg8ywzTJt4gnt60Dc77xBFW'
+        b'lFXic+IxkxokfuS64vEb54LLAs+MmOnUPHGEWCy0sdLGrGhqxFPEUVXTKV/IeKxy3uKslaus2Sd/'
+        b'YTinryxznWoYCSxiCRJEKKiihDJsxGjXSbGQovO4j3/I9UvkUshVAiPHAirQILt+8D/4PVsrPznh'
+        b'JYXjQOeL43yMAF27QKPmON/HjtM4AYLPwJXe8lfqwMwn6bWWFj0C+raBi+uWpuwBlzvAwJMhm7Ir'
+        b'BamEfB54P6NvygL9t0D3mje35jlOH4A0zSp5AxwcAqMFyl73eXeofW7/3mnO7wccAHKE4l8pmwAA'
+        b'AAZiS0dEAP8A/wD/oL2nkwAAAAlwSFlzAAAO0wAADtMBjnu4rgAAAAd0SU1FB+MLGQgcKawTfgEA'
+        b'AAQ4SURBVHja7ZnNS2NXGIefJGZEJo5oLYSqKEGQDLdiLRZUpIIubLEWZjKZLtqN4KKggrQRREK7'
+        b'CbgQuiz2T3AnKCpUdLpQsJPpJgRBjMiIoon4USepGZPbhSfRBOPnNYnOeeAQc5Lje97f+b3n3nMD'
+        b'EolEIpFIJHdPHfAaiABqihYR3/niIQrgviDx5OZ+aMkbLln585xgSMfE9GkUQZ+N89LzgSMFkAJI'
+        b'AaQAUgApgBRACiAFkAJIAT5McjT6P7pLxMy5g7lFxdE5oxiBn4F/r3HW16odAD+JOWSMT4H1DCQf'
+        b'a28BJZN7QBA4zuACRMQcMsp3wE4GVn8HeJktm+kLYDWNya8Ctmy7mtjS5IQdESuHLOTlHYuQVbZP'
+        b'he2OysGXbbZPhQF4rrETYrY3cI+wayTCvbB9Kp4L6z6Y3T6d5bAjxhp4ALy4pgj32vapeHbFcrj3'
+        b'tr+oHJ5d4oSs3O3rOPm9/r04fFynvQN+AfKuUA7Jts8TY9/dIO57Mec6LQRwc7vL2L5I5NEFV4dk'
+        b'2xvFmP1bxn6t1ZHzttfyEPDbGREMwDdChFXg2zP39o/Ed0MaxI1oIYBWd3Ohc8ohmZjtQxrGzRoB'
+        b'YuXwK/D4nDiPxWf7GsfMKgFU4D9gBvharHge8BXwp/hMTacAuisKcC1KSkqora3FaDx9XhkIBFhf'
+        b'X8dqtTI1NUUkclKeLS0t+P1+gsEg1dXVpxtPJMLKygoej0eLJ9Z3/lg8gaamJgYHB9nc3Iz3eb1e'
+        b'xsbGGBgYoKamBpfLhd1up6+vj5GREQoKCuju7mZ1dRWAcDjM5OSkFgKQdgHy8/MpLS3F6XQmOGBx'
+        b'cZHZ2Vm6urpYW1ujv7+fpaUlZmZm6OzspKioCIfDEXeAz+eLDX8LzAHNQNmZUKn6MytADLPZHP97'
+        b'b2+PcDiM0+lEURSGhobY3NzEbrefelWni485Pj5mY2MjlmQtEAA+FvclZaL/c8APFAP/AKVZI4BO'
+        b'p6OjoyP+3mQyMTc3B8Dy8jKtra1MTEwkjMnNzY2POTo6IhwO43a7X4nkEcnOAT+IV3/MYOL991kj'
+        b'gKqq9PT0JDgAoLm5GZvNxvT0NG1tbbS3tzM+Pg5AKBSit7cXVVWJRqMEAgGAL8UKB4CPhN0Rr7H+'
+        b'4jP9mgsQ5YY/oDQ0NCTsAdvb2wwPD+PxeLDZbIyOjuJyufD7TxZSr9dTX19/EjQaxefzsbCwUAa8'
+        b'Af4SYsRsXiZs/yqpP3nul57QLqMD+OQ6iZeXl1NZWUllZSWKoqAoCsXFxZhMJsxmMw6HI74pNjY2'
+        b'EolE2N3dxWKxUFFRgaIoPH36FFVVmZ+fBygAqoEnSaGepOiP8Qb447b3AXXA78BnV3VCYWEhVVVV'
+        b'GAyn+h4eHhIMBjEajXi93ni/1WolGo1ycHCAxWJJKKGtrS1WVlZuYr6ocMePwN9IJBKJRCKRnMP/'
+        b'+Ko97WKFdlgAAAAASUVORK5CYII='),
+    'file-upload.png': (
+        b'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAC63pUWHRSYXcgcHJvZmlsZSB0eXBl'
+        b'IGV4aWYAAHja7ZdtktwoDIb/c4ocAUkIieNgPqpygz1+XrDd0z2Z3SS1+2uroQxYYCG/j0zPhPHX'
+        b'9xm+oVDJHJKa55JzREklFa4YeDxL2S3FtNtd0jWF+xd7eEwwTIJezlur1/oKu348cO9Bx6s9+DXD'
+        b'fjm6Jm6HsnZmDPpzkLDzaacrklDGOcjF7TnUg8++3SH7xzVtu344Wffh2ZAMKnXFKmEeQhJ3m84I'
+        b'5LwqLkHLgqDWLMYoAZ0KX5FAkJfXu/sYnwV6Efkehc/qP0afxOd62eWTlvnSCIMvJ0i/Fn9L/LSx'
+        b'PCLi1wmT29UXIs/uc47z7WrKUDRfGRXDrc5Wf/YDkst+LKMaLsXYdi2oHmtsgNNjiwdqo0IMKjNQ'
+        b'ok6VJo3dN2oIMfFgQ8/cWLbNxbhwk5MTKk02KdLFwa/xCCCXhB+x0N637P0aOXbuhKVMcEZ45G9r'
+        b'+KfJP6lhzrYkougPrRAXr8xCGIvcarEKQGhe3HQLfNcLf3zKH6QqCOqW2fGCNR6ni0PpI7dkcxas'
+        b'U/TnV0HB+uUAEmFvRTAkIBAziVKmaMxGBB0dgCoiZ0l8gACpckeQnERwHhk7r73xjNFey8qZlxln'
+        b'E0CoZDGwKVIBKyVF/lhy5FBV0aSqWU09aNGaJaesOWfL65CrJpZMLZuZW7Hq4snVs5u7F6+Fi+AM'
+        b'1JKLFS+l1MqhYqMKXxXrKywHH3KkQ4982OFHOWpD+rTUtOVmzVtptXOXjmOi527de+l1UBg4KUYa'
+        b'OvKw4aOMOpFrU2aaOvO06bPM+qB2Uf2p/gE1uqjxJrXW2YMarMHsdkHrONHFDMQ4EYjbIoCE5sUs'
+        b'OqXEi9xiFgtONlFGkLrYhE6LGBCmQayTHuw+yP0Wt6D+W9z4V+TCQvdfkAtA9zO3L6j19TvXNrHz'
+        b'K1yaRsHXh/nhNbDX9aNW/23/dvR29Hb0dvR29Hb0dvQ/cDTxxwP+iQ0/APtHnd8/I8TaAAABhGlD'
+        b'Q1BJQ0MgcHJvZmlsZQAAeJx9kT1Iw0AcxV9bpSItDhaU4hCwOlkQFXHUKhShQqgVWnUwufQLmjQk'
+        b'KS6OgmvBwY/FqoOLs64OroIg+AHi5Oik6CIl/i8ptIjx4Lgf7+497t4B/kaFqWbXOKBqlpFOJoRs'
+        b'blUIviKAAYQRxbDETH1OFFPwHF/38PH1Ls6zvM/9OcJK3mSATyCeZbphEW8QT29aOud94ggrSQrx'
+        b'OfGYQRckfuS67PIb56LDfp4ZMTLpeeIIsVDsYLmDWclQiaeIY4qqUb4/67LCeYuzWqmx1j35C0N5'
+        b'bWWZ6zSHkMQiliBCgIwayqjAQpxWjRQTadpPePijjl8kl0yuMhg5FlCFCsnxg//B727NwuSEmxRK'
+        b'AN0vtv0xAgR3gWbdtr+Pbbt5AgSegSut7a82gJlP0uttLXYE9G0DF9dtTd4DLneAwSddMiRHCtD0'
+        b'FwrA+xl9Uw7ovwV619zeWvs4fQAy1FXqBjg4BEaLlL3u8e6ezt7+PdPq7wdj/XKhlyWsIgAAAAZi'
+        b'S0dEAP8A/wD/oL2nkwAAAAlwSFlzAAAO0wAADtMBjnu4rgAAAAd0SU1FB+QDFw0hNRmbpFEAAAHU'
+        b'SURBVHja7Zq7TsMwFEBPGhCqOjbt1K0q7YDEgEp/AH4JfgqJigpaqQPMUIkJ/qI7SHmwOCJDCnk4'
+        b'iZPcI3mJkmvfI9uxnYAgCIIgCEI25sAO8IBAU7Ej8b+ANTAzVcBOY+JxAkKxb8DCRAFeSQIC4NNE'
+        b'CUGJAgLV487aLCCUsGizAKOGQ1UCjBkOVQow4u1QtYAA+AAu2ywg7AmzNgsIgMcsCVgaBOjmSCUe'
+        b'CugkfM4FjrNUZhqdiAC7jMpM47xOu8Ei5oBX4EL1TjtlacQckAerCUOg9AlHBIgAEWDEm6R1Ajxg'
+        b'C5yqso0sgFqxDlgD00isqbqWJ2ZtBKyBYUy8IfDUZAGu2rUN/og5UPe4TRSwAiYJ4k7UvY0SsAKc'
+        b'FLEd4KEJAlyViJMhfijBrbOAJTDOUccYuK+rgDugr6GevopVGwE+sNGUfFTCRreAolaCPvAM7DXG'
+        b'3AMvuleLRQmwgWtgpDHmCLhC8zlh0SdCh7qmC5wceOab+MNaK0F7U+dT9KnwoUbb//Se0jZpch4g'
+        b'AkSACBABFWAB3ZjrXQ2v5loI6AA3QI/fz1o94LbsNsmnMZkDREDuXZ8p+FUIeDdIQCVtKeJ3+bTF'
+        b'U22YIwiCIAiCkIIfNThZ8A9WYQgAAAAASUVORK5CYII='),
+    'icon-recording.png': (
+        b'iVBORw0KGgoAAAANSUhEUgAAAGAAAABgCAYAAADimHc4AAAT4npUWHRSYXcgcHJvZmlsZSB0eXBl'
+        b'IGV4aWYAAHja7ZpZdhw7c4TfsQovAfOwHAyJc/4dePn+EqjmJFJXuvajxUN1s6oaBWRGRkSi2sh/'
+        b'/2eb/+JfKraamErNLWfLv9hi85031d5/7fzvbDz/n3/5OcXfn46btxOeQ4HXcP8s/bm+czy9f+B1'
+        b'Dzc+Hzf1OePrM9Bz4jVg0Dt73qyPk+S4v8ddfAZq8ky51fJxqsPf1/lceKby/Nbi1jPYPcXf5uOB'
+        b'WIjSStwoeC/BBXv+j/eacH/7ee38Fq5zIfA+hWDuiWcmBOTT8l6v1n4M0Kcgv96Zr9F/e/cl+L4/'
+        b'x8OXWD7ZMrz59oRL3wf/hPjDjcPbjPznEy679Mtynt+9V91b7up6zEQ0P4iy5hUd/QwXDkIezscy'
+        b'P4XfxPtyfho/1XY7Sfmy0w5+pmvOk5VtXHTLdbednNfpJlOMXjw58d5PH86xSo6an0HzFPXHbV9C'
+        b'CytU8je9GNIXg3+bizv3bed+01XuvByXesdgjo/8+GN+d/JvfszeU0PkbH2LFfPyiiymoZnT/7mK'
+        b'hLj95C2dAL9+nvTbD/gBqmQwnTBXFtjtuEOM5N6xFU6eA9clXm8JOVPWMwAh4t6JybhABmx2IYEF'
+        b'W7wvzhHHSoI6M/ch+kEGXEp+MUkfQ8jeFF+93pvPFHeu9clnr4fhJhKRQg6F3LTQSVaMCfyUWMFQ'
+        b'TyHFlFJOJVWTWuo55JhTzrlkJbleQokllVxKqaWVXkONNdVcS6211d58C3BgarmVVltrvXvTuVFn'
+        b'rM71nSPDjzDiSCOPMupoo0/gM+NMM88y62yzL7/CgiZWXmXV1VYXZwSmkChJshSp0qRvsLbDjjvt'
+        b'vMuuu+3+lrUnq7/8/EXW3JM1fzKl15W3rHHUlPIawimdJM0ZGfPRkfGiGQDQXnNmq4vRa+Y0Z7Z5'
+        b'iiJ5Jpk0N2Y5zRgpjOJ82u4td++Z+6O8mVT/KG/+nzJnNHX/F5kzpO7XvH2TtaU6N0/GbhVqTG2g'
+        b'+jgvtRtfu4pa/9++/v9A/3qggRxYAUMONOF1yCyKMLKAE+h0ZLcpCbCBNtSQqH+TckuBjJe48s6y'
+        b'XR+9u+Jz9NHOHK1Mu/sqfSENDQgiVS7NUWvvwEZmAbZjNAOgt+2jdGAjtm4Jex8TUmDSvSuAWivD'
+        b'ExmcSR6DE2n7aUEzd4Ifd9GZmDxikLk4P6U0HSTnzmdBJgXhBHsSJMe6E2UzqWLOhgXcy5rZ6vXT'
+        b'j7qs0bcguiSn74asM6PaetjCEqgt/Tvs0FHrtXNTXllMTkLMOwhFUvaYwUgpKPqYczJSTUVVd889'
+        b'hZF2WZ1x0Nay731/vO0yawmXt8CyMp8t1W2Z1B1MpB9uyzE1/aj9dsZS250xRovJf5iya3bDh0KC'
+        b'vxu4/zSwuSOv/Br5+4E9nIMCsqKhIRiutHY/YbuMGPeGs9tuYGTLHvwtPtcTq9T9Eyv3Hqs0kk41'
+        b'uthAAg76fc6GSfsniUy7fB+PeF5TKf1eu2fuJ9z3DpB+MNAgHHtvAlI+3kQDE9u2W2lXEen32K7c'
+        b'ebcbEmkPPIxTFDKw/nkm3++4ybXuos875dkbSoBhijjgDlxCRg009GP5BxDYmhOd9CE6racTnSQn'
+        b'6uMshriP5WIZgSnAsjvNfhYehFu6E2zbd4hnRm2DTHIigHUTGqmpr0oVhpTs8n3WFHr2zDmGNnCH'
+        b'GovURuiW9Hf1Mkx/d9A1rPSSWcouXgRNEbSwTuxogDFGDTLSDLvWPUMdHYYoxeXtXTajZI+INjcI'
+        b'5cBd4tzqZJaxVqF+nMQC4ZzbbKv3kIYC2e19p2qafe5j3m5UgV1HbPse6FtxbflJ7cS95kBMByOu'
+        b'mBz9XcFlkIiUBwzBlMdcScxKCNuSCFtROt05OE8XAv1ZHX+NfK8Oi0an3YsbVkbNGRdbrm9cTC+i'
+        b'xJPixCC4nmVCPLY0bkymQCLMhEpuIpYtb6uTtMMalIEHUbAvLghlD2YQpFg6MZk5s6jF+VZDZKUq'
+        b'2KU0stsm0SOUUfAuJVtm19dsVGDWA0F2MmmtOdHuUCe92UzZ9sZygfCAfqKQ7m0Bz4DwO2TT4X/Q'
+        b'Rd5oFEZlQhNs1mxuzUD+SV+XbX0MKjrsWQ7gvBvQgYyltQDS+8pQIyYow7Zziu2r1VUmKuIytNhZ'
+        b'qNsrDhSgDAcwaxugcO7D+egSACmwSho7zFW4BkOByhBQn0cVg+NCfZZj9YHJIWdrb0p3ga9SxSNW'
+        b'dQdEi/KNIU8oOsXhpWO3IAjqDcNiWVobsecGh1RdR+M9f9GbqTlzKoe0OgoftIfLVUC1x2VYPaiH'
+        b'mh5J2vhhG7FwqA7H6fmyBMwi2rWCX1uA5exWglaipEQi2vYxzSp1YvyxfYw92zLNxap+bNReCVpC'
+        b'rzBvPuae3KLWKROhitHWqfW1e8qhgjEoWeZcZIGOWhqGfdH5LacxwvrZUiK3VFwxyVxuMn3vMxWi'
+        b'11ZosOhAqCWXpnJPrHYfaxmobI0BdVLraTZt+hTz4SmQcNHst08XzbBR0WoDzSeN9tx0CpLdoVRL'
+        b'l0iBoUAVbIAgXyUwbw8BrVS0TWXeRACnQFuJWRXFZhucwuByW1PBAlRo8Rbba2XQLJU0t9NK63Dy'
+        b'shURSAEtxkfApS5SkJgBaiDDpnoVACFrA+Vy6+BcQBLQJC4H4gCc9IAmoB1DOdqyyrg8XfHG1CCX'
+        b'7BC6GJAPh+OFcTQUPxPXT1mofAN8OF6qJ1YFXZiNvO1TUvBWgwLw0k4LKPRB0RLRSnLgW5/WRmZo'
+        b'zi8Ia4YXkw2KPq/7Jv6B7wPY5JPu+wDKSNbi0j9aHByAZn0jlut8LIYXfkm0XxluhlptwinROwRY'
+        b'vE0woDWJG9GmhfD5PNWYFQ9LWpoUvdWEPzRmrNoz6Tzr1vkQXZQuaQ7oHWiD6kS0jE0RHpJUa7I+'
+        b'ByV+Pq5VVtWaQYGIKu1Oofcg0dwKLggjgH3eUvmsgDLYBlyCTzWEjYpZtd3gaHumJdp0S8z9PncU'
+        b'Fv1akHDsCZ8gJTvJRFo7OeKGWxlrykB6hXILcNqGP22pTJrUpnAHnVCJudmNwDSNqTGh3WRkCrUd'
+        b'scYFUD25d5qqiftd0FI8c9aIR0RRs5abGS+eOYuwmtuu77zmNtdX8m7SnV0fOYdrnvx2Syt6OOsV'
+        b'GiKtLMY1sShK6DkFysmLQRlc0YNA9PIOoKAfAtn4a2X5N45fx+8oyxObgc94VOIbkUBbJmqbS8Ld'
+        b'mK2eQYYSv9TwRMl+E6WBs9BNL5Telztoz3dQFLAbQIKHxakk6Gp3D7S1tYFOYjyx6F85/GL/qYj6'
+        b'cLzT7ujG2Z/L1ovRWb3GiOh/1YNwr2heW5BwRgGEhhrTYCM62t/rYR8ZUbMrJ2UUPWBU3IT0AmN/'
+        b'ByM3kjhmMU4D3b8GmqKnTHZrq6CZa3WcDkGHL+0JFGawWih930ARJqVa5gI2qx2K1vCgdb1REdKE'
+        b'y2gwwIZhq+5ONF2whpFogRaFkqEdG0gNabPwVKUI0QBqvdEuOgJLGAIljvdp1+k3tVfHhk6P4YEK'
+        b'z19GSBDO46Q1P1hpD1YwJWg/LD5WadOr/6GpSKpDbkAfpBr/B73CqGYTsq2mFtYsBzeFOx06Tae7'
+        b'ymgir9uOdfsBdyJJJwodYyMdjSpURL+GX141VY8i08fIGURcwHIRtFKTaMN3NpLSadOetX1cGcsy'
+        b'o1rE+46KiPzrIc37mH8wZP55SJO/mea/GdK8j/l3Q27snMOVqBMeoVSzj52EArArfjcy6hBpyphM'
+        b'Y+y3awkH0HUz0NMpeFp9exohil22EgF8TmqNSvQBectY2brDi+Evv9+Cgqt0L2yibEEyijYhxwmv'
+        b'C1U54sDPGxiuHetHd4ERot3BZuSw9AGG1sIh27NzdinkcIlWfFxQKO4OBCJI4WwgJJEDRRWPog2b'
+        b'YD7K35Wz0VbQnpLw9goT1Iip2m/EmPbRldp8PDlL2x+MH+tLQWOeIkYLYkbAYEYtZHW1mJVqj0FV'
+        b'eWZcMnkoVYXqzI9quxScT5VopblhXtxynFE7zuip1XmMo2M2iJk6xxZxju60WhnHJ/etEi6v5vXm'
+        b'w2uBxG3UINKi3RjOuxjnl44t15XZyxX50ogKC9Gq7uS9ETLyfkgt0u/Boe3VkYSPHcmmd6CTR63S'
+        b'PLsPBq6xeBFIX+Mi6jKnXfiTtkgwMcrJPSbpmKj0yEQKl+sL3KcYMMc+xGMf5LEPIACXVOpZzsP5'
+        b'l/G/GsfjG9PxjYYMz12ZepbatK0BkJfO1TijEKCDDrcHDVd6b3mSr4tGS3s+9CYVgz8Iq1GyaPio'
+        b'Sw1c2bo7xN3gbtEVOIgwhykqno/e0VkKkSQhdh65MMDrotoOML01LG+LoiM73vYsioSRrYSl4AMV'
+        b'u4cyV7CtOxLBnn1IT7tAJ9/PLqT96VU32d6L/Sb+0X7qvZv3gi/7k6HL+K4n9RM3oanXwoFSOsGe'
+        b'1+VJdI/LMzdPPdSIV9+Vvl43nmj1ufGOt9gvKHzD1dIJuTMP6XPDWFj1hP6HaWZJYmmHQVbCX0WB'
+        b'HdRnIfkdJtGmezfaeO3QseKVpCzdp5i5VFosGbjbAU2aEOhPdbdHIFTav6l2A2ORepv26vEJlDJL'
+        b'3nepH7jlODKmjBs5MquFe0zZtWS/GjIVzjdHtnAS6HhMEumhiu4SBVPoBxY3p/sjcWPrLtzA4dCS'
+        b'N49sUYi7R/qVNNPoMU+Sjutv1j2bIk59gXQjavYpskxO1LYRD1zDmChBRy+mVBaOgHSh4XHXxbqd'
+        b'sGTMkFmINr/FFZOzf7O5sZTxGa9/Dlfze7z+OVzN7/H6gmv7tQP5AljzT4j9Atj2EbDz9AlIGabH'
+        b'IFpgleUV3NDS/Tloik4GKddtJVKO56f7HlR/0wepDGm9bkxMsU2EiyC37Al209UM4s894sRYw7p9'
+        b'rVhy9aHVoeY/Dim0QJlBGvFcEoR8ovREdCO4rRrwEnWfog+bmRqUxfza2dJr0Xt9zsetnWAbOAcb'
+        b'UUo4jenA5rITcWda3jejXFkW3FeK+KJ7AilyWreJiLXXjRRQoBuPflSHmZmAhHYUzdI9DC7V5bZi'
+        b'fI5aqmfvzGvrOfK9Ohfd8gj36vD2kEP3c4LXi7Er3c3eKaA6Et1RjLki6FW0u9qFCwZkYaFmfEjr'
+        b'ixzR+G5lZ7U85wl8KhHzPhynUeDg8Eeur/PMD5t7ah8e/7nKuzqB74scQD5F7j93rhNNjUHo2R2V'
+        b'2Cw9zFgz5tS1gy6sj3ZBRJABzx8WgcTce8wJfc15CFnzjNiLoK2DbzBBBM+4RSq7ZPKCKcjAcOoj'
+        b'7eJSpkOedmsvkrVrgNSk0EDrZsvRctxH1oIcy78+jukqQnSLlg0KrNDHXCxtFmlF1/Mx+uip7FKJ'
+        b'fqWtnUK3oNvyuoMkBUbWXc5zEyrJ6xbL0EHBzGZF9CLzPBpQ+xK37ikJF+a/K30q33wo/XdbiqUP'
+        b'eyQIFxflakMwWsNd7jFpffd3nyFGUMS6jylEe1F9vlK9bugvN/wC8E48yFxuVWbMioknFkO3v6GJ'
+        b'TOUxmjNLIqQK5kPmJlovuBOn2+NcR1OkW3WlwERqNDF5h2aO8QwAJEFMnuv7MimTLB8z8mSrjdm6'
+        b'0KYL6+zx7FD16tR2wtakgc2IHDlfCCItCiB9UKfVAiC1nnWTB6hu3d/RjUpwg8I2SoE6L/EJPI5k'
+        b'vgd4fyIY8zPDQDAZf59ZY7UzVimBgTmJ29OdRLweCQYyUGLoptHxwkgOj6VPtBiJHOyECtCiCCXb'
+        b'dKPu3eH/YvBDoASmN21itTZyz3Lg+sXJHjGQlB6t93m+jqL5bxb3tkgEe1fTb/8qLqu1o2Z3A4It'
+        b'Jd06ndeaIzRDMSOax6YOvP/iws3vbfifu3BzbXhBZLC+tJY4IkhtA5t492QCzEFIjoh98lza5HCK'
+        b'sOE+MVq6Q64NBE6onmViFAayRb8prB+mVqzDd91JTPdZDcAKX6Zufl7Dj2tbJRwa+EQC5mGBDUA4'
+        b'WfWxntOv63hscNCvS8A2qof6pTX9cow+zqIy0T/VVYy27ocRdfM8SdPHVxnTtxaeZbWDcBZTM+4u'
+        b'n01osL+1y66QImQMuaVyn0Nu3ZtgabX2dB9W4g/vU7x7zb2C0weZNBKEHxiwNi5iaK9Dn06Ojxrd'
+        b'M/86+qfB3W2jvg4edOww+ATlZTeNHzrQCoUrd1/P6ndEdG9A9LmP0Pzfx5zu7Lgou9yHjH2Q46GP'
+        b'8e+w5tO4esnQaQ91fOk8Jk9Dd650s173HOb5ulbSh8G+r8ExxtQ9Qp2R7jnodgOqL9NvWedJeyg6'
+        b'13zmenWlDw/R6VzP8u90ThiYulFl0ufWuN59o2Tvs2DWshDgku2nof34vk01f1AgWx/R0lemvGnC'
+        b'BPbUZ6EeHCHxmSbAIbinyy7HdlUiy0LQVehkZCCHKEB6ZdE3UOTZouhLclQ3jncdvlJstiIwOyRD'
+        b'y+dxIzQaECDeO3MxPNcu/3Te1j/69oj5zQW4myiq5RVXd52cG2F4d5xcxA14dP2Yqqw7Wo52IYWz'
+        b'q3Ts7jqNK8YFcqPTSlFVAC/GupdWGI4WDkNF6Z/i8+0IBBK9a8+u4rHGQuGeVxaLuDK14mqkdGDW'
+        b'rGHASUK/mDIcxOGD5KpNztyeHi90zQR92EWJUoQi+8OwxK17fWgRqHO3XMSpJZIMmpM3sIK27yyw'
+        b'KpJ0gV0fz78tz/3jDfTLWcVg/FA0det4u3C+yhCCQrlyay2Lhi60u9EZLlRRXtdRAhrUgXoOeiNi'
+        b'dL6UY4+ZP1/KUTOvm3M0jsxCrbaQLAhqYmTzIMq+xzXiIxd4Env2PIwG6Nn8+OGVteFqzP8AhZEN'
+        b'xnbd/VYAAAGEaUNDUElDQyBwcm9maWxlAAB4nH2RPUjDQBzFX1OlohUHO4g6ZKhOFkVFHLUKRagQ'
+        b'aoVWHUwu/RCaNCQpLo6Ca8HBj8Wqg4uzrg6ugiD4AeLk6KToIiX+Lym0iPHguB/v7j3u3gFCrcQ0'
+        b'q20M0HTbTCXiYia7IoZeIWAAYYyiS2aWMStJSfiOr3sE+HoX41n+5/4c3WrOYkBAJJ5hhmkTrxNP'
+        b'bdoG533iCCvKKvE58YhJFyR+5Lri8RvngssCz4yY6dQccYRYLLSw0sKsaGrEk8RRVdMpX8h4rHLe'
+        b'4qyVKqxxT/7CcE5fXuI6zUEksIBFSBChoIINlGAjRqtOioUU7cd9/P2uXyKXQq4NMHLMowwNsusH'
+        b'/4Pf3Vr5iXEvKRwH2l8c52MICO0C9arjfB87Tv0ECD4DV3rTX64B05+kV5ta9Ajo2QYurpuasgdc'
+        b'7gB9T4Zsyq4UpCnk88D7GX1TFui9BTpXvd4a+zh9ANLUVfIGODgEhguUvebz7o7W3v490+jvB2G2'
+        b'cqDK1JvnAAAABmJLR0QA/wD/AP+gvaeTAAAACXBIWXMAADsOAAA7DgHMtqGDAAAAB3RJTUUH5AIb'
+        b'DDUDjvsaogAAC1BJREFUeNrtXEtw28YZ/nYBUiRBUZIpxbIsW3assePQTm3n4cR5mG7sadNkMj25'
+        b'k9z6OqaT6am9pDr11kPHh5zaaTuTtNPpM20nD09aqUmVh2K7jsW4SSjLsSyJERU9+JBEEtjtQQQN'
+        b'wQAJgKBMM/hmNCMC+8D+3//Y/RdYwIMHDx48ePDgwYMHDx48ePDgwYMHDx48ePDgwYOHVgYxu5GO'
+        b'xeIA4uWfwz2JxHCrDV43xoaM06APAEBPIjFkSkC50hCA4wCw3Nf3yz+ePPkbQRA2lOOcG/6vv1bt'
+        b'nt36RuVOfvLJoe65uUNVJWFQL7S0dBiM8aLfPyplMvcQzhUAw24QoRF8nBNCM4FAQqY0IHBeiqyu'
+        b'xraOjz9sSIBe+ADwxcCA8vm2bQIIsTxAI0FZKmNQ/qZyut+98/MAgFR3t72+GMNn4fDaxVDo/Kl0'
+        b'+tyBq1eJtLx8sHx3yAkJWsEDIJlAIHGpuzv/ckfHKQAxzvn0j6enE0dGR58EALGW8AGAybJQzGaN'
+        b'NUkVUjVhmwiaWyhjpb9rPh+uhMM45/dbtjzOOQghEDkPtMnysTe3bj18tqfn1WevXn35zmTy2bIA'
+        b'hx0IfwgA8m1tF8ej0eVfd3YeJYQ8DkAAAELIzpzPl1friLo24gBIQZI+bMvn70nv2IHpSARXIxEk'
+        b'wmFTt2HFfdhxUdVcjpU65gZ1c51SqYRSqQRBEIKBQODplwYGxOfn5y+3Ly3F07FY3IoVaLWeEeI7'
+        b'39v72q+i0d2c8+9TQoK6vgknN1yJqG+kKEnv/+fIkUd7cjlcCQYxLkm3LEjaIdxJGe1vWZaRz+fF'
+        b'QCBw8tzAwN8fy2REylhVK9jg5wGaDoenLkaj/K/t7c8RQnqsKIfWAuKcEJLYt0++uGXLfavBYHU/'
+        b'bEFwTgRlpx8n2l+tLGMMxWIxdDYc3n2gs/Pj7oUFS+7mC0ma/DAaLf6hvf2rlNJBYuPZRS2TciDw'
+        b'7pt9fd+QCwXBjQHVEpAdLbVTx4myqJBlGQD2r7a1LQKYqKb1JUEIv9PXN/r7jo57CSEPUI1CW30W'
+        b'Uev7k7t2pQHEGGN1D6hRwq1H++/L57Envx7/JiQJY6GQYTuMsZDCud9M8DKlgVQkkj6/ZYvvrCR9'
+        b'mwBhp+OoMMZE8a2/7Nx5hMhyQ7V/swlScd/aCuLZOdBOAi4z7PgiC45ejKmudmNbVHW9+gCbikRS'
+        b'F6LR8GuSdD8h5A4CkHqUo2IBjNJRSukJRVEaqv1uBGMnhA+urkDoFXHxiZ2Qi0UcfuUaBvN5jAWD'
+        b'hnU450QbYOfD4WvnurtD/2hvP0gp3U04F+3GMKN7FQu43t+f1EbuRgrDbf9tqQ7lmD8QxeS2IAol'
+        b'oHevBFyo0u56m8eLonhhZPv2/70SidxFCLlbnVbWJSfNvXUWCRl5ac+efQJjQj1Tuc3QaMfuTgGi'
+        b'59LYsc0HZa2I3vEsptBh2v5HkYhCGPvnhc7OnuFw+EkKRNwM9hstgBDCGDtFCHHNXbit/bViSS1h'
+        b'JAMh9M9lceh3UwBjQI4geYdk2s8b4fDB1yUJhJDuaknLesdRcUGEkF1uzd3rCZb1rgnM6o4FQ8CW'
+        b'rZVZUPIOCe8HAtXWBD2cc1BKoVVMN7X/hgsCiCiKEXX66faC6FZqv/beWCiEsVDoxrUaiqMoCjjn'
+        b'EAQBhBDXx1EhYLmrazvnXGgm7W/UrMmqoNQ/VSm1qXg3rZgCQCYU2lMr576Zq10rhNeznrD7/Iqi'
+        b'QJblmmN08iwiABQEIeqGMOrVymbRfk1crPxWLUEfE+oFBQBZECKNCHxuC2qztd8oWaeNk24QTgFA'
+        b'IURy+nCNCEzNoP1mZRljULMFjsdx00JMEAL1CqrR2r+ZpNaqr50d1btKpwDACPE7EdRman+jXKPT'
+        b'/JXWEuoZB61kSm4j7W8k4fogXK0fRVGquiMr/VGzntwgpFFuohkIV8VmFhOstkfrHaxbQbQZCLfT'
+        b'jz49od/EsjUN1SebmslN2E26Ndr3m7kmvTuy2q6aDW3YFHSzAqzb2m/22ygnpFqEagW1YoctF9TK'
+        b'2u9E843qagVutFiz4oJsJ902I0i6UdetV2NqpR90m/owyiybZkPd2AZ88OhR7N27d/3eLZjRVMPl'
+        b'y5cxMjLiOuHV3JEamA2J06+EUcPUrTz0vr17cXj7dpSSSTQTfIODoJzjrZERMBctXSt8s7WDulil'
+        b'lJr2J2quEqcayDkH5RylZBIrzz3XVASEzpyB3+eDyDkKDub5tYRcr+XSG2XcSS03I/QCs/r81WKB'
+        b'kTuq5q7NUjdirSeySozsYo7cbXAAjHPA4baidgrqZHZUzXooABBFkd2aLzcnA7xuKzbamHdiRYbr'
+        b'AMJYwe3VYpP5oLrWKXamoHbjAwUAythKo97zbBoX5FCD7ViOk1hDAUBkLNey2l92QW7lhQghhu7I'
+        b'6T7xOgGyvFTPFLTp5e+S9tuJD1ZTIRQApGLxuptL/GZ0QdzFcZilpR1bQFcud4UxxlvaDcH9BJ2Z'
+        b'z7fTDwWAtmIxL8tywa723zbEbPIXOXaIW5+GAlAU5fNW1X7ukvZXC7h6eZmV0S/aKqmIUqmUaMU0'
+        b'hJYEm9r/QflPsbLqtbMyvnkhxvnxZ+bm3rXzcd5tRUSVQGk2jm/m88mfTU6Ons5kfsE5n+Scc1Jj'
+        b'59BJUK5syBxMpdoVRSm06lTUru8fzGa3SYXCD07MzNz9o9nZIcbYzznn81YWYtUSdWZbksNUUUqF'
+        b'QuHjVnZDDsYxQgBldybznRcnJlafn5t7gXP+NwCrVhditVxWxQIERXnkqXT6HbuvV7QKGQaul2P9'
+        b'mIIhAMMiY8f2Ly5+68Vk8tL3FhZ+yjkfV+OD1X2Dal9JDhMgfnR2Nvd6X9+q3+8PttKagHNeCcIW'
+        b'45usfvxbPqxjWP1eWGAsfn86jXvn5/98PRKZeruj48GRYLATug0tYiEBWLEAtRN/sXj0YU0wbhXt'
+        b'txIYdR+oLIiynNfe70kkhsunXA0BGKacs53Ly6Fnrl0b/+Hc3LnH1tYK6q5WtWmqmQWg3Gj8xOzs'
+        b'pbd7eh7w+/2SVe2/XYiweGAH/3oud3lbPr/V6L6qrMD6V/QEiO9bXIwPLi+fP9TZ2fPfcHjHvwMB'
+        b'P6p8QW8YA9SGgysrR742N/dbWZZL+JJAQwx/NJ9fOJlK9YmMraDGgU1aqxAYe+PAwsL06enpj06u'
+        b'riYB5NTlh6UgXIkFnCuPTk7GHkqnx2RZLra69ms+QWIPZ7OZp1KprFQqzcLGkWVaIvyKkjk9NTX7'
+        b'wszMm4+vrFwvE2G6LqQG5jUkMFZ8YmJCOJZOv1cqleYVRVG0G8vqOy/6a82cC+IGf+UXqBRZljPH'
+        b's9nPnk6l5tsLhWsAfuLkvDhVfgD+1Z/LdZ6emfnsdD7/JwDJ8tSVAygInBeMYkClkXQsNiQoytAT'
+        b'n34qfiWdfm85FIoxQWjbEOl1At/BeRi6Y1uaBduB/HdTqeyG5y5PNSlQDMny1EAu1+ZTlBU4PKxP'
+        b'78rTsViccj50amZm4CGf79XrkvTImiBs9TG2vCuXE0wJ0JJAOY/3Ly6if3Hxg1odR7q64nIqdbwZ'
+        b'Ceju6rp4KJ0+a6Goa+eGqjIEEA+XSrhraemVWrMg02hvycr37x9qVgJ8d945qh6UupmwIkMKD7cU'
+        b'Xw4CCOEeAR48AjwCPHgEeAR48AjwCPDgEeARsJlYPwXXI+CWyb9QCM3HYk1JguhmY77BQYTOnGmq'
+        b'AfoGB0F8vrXuRIK3OgHDvv5+woLBfpbLR4U2fxaCIAPg5VwML7+hxkGI6hM2XMONa+v3CanUJZQy'
+        b'QqkC/VuGNfI8hBAGQs42q3W6bpYTx44RXbsVAe0ZHXVFC+djsWpSJwYXeLNagAcPHjx48ODhFuH/'
+        b'ZOhS75YGjDoAAAAASUVORK5CYII='),
+    'icon.png': (
+        b'iVBORw0KGgoAAAANSUhEUgAAAGAAAABgCAYAAADimHc4AAAORXpUWHRSYXcgcHJvZmlsZSB0eXBl'
+        b'IGV4aWYAAHja3Zlrcuu6EYT/YxVZAt6P5QAYoCo7yPLzDUjKsuyb3FvJj1SsY1MiIRCYnunu4THr'
+        b'H3/f5m/8RBeyianU3HK2/MQWm++8qfb6aeevs/H8PT/5vsTnb+fN64LnVOAYro+l3+M759PXF557'
+        b'uPH9vKn3FV/vie4Lz4RB7+x5I++L5Ly/zrt4T9TWveRWy/tSh7+O8x54lnL/1uLknuy6xGfzfiIW'
+        b'oiSJGwXvV3DBnr/xGhOu336Ond/onzMxFHMutHslBOTb9p6jte8B+hbk5535jP7r3Ufwfb/Ph49Y'
+        b'3mgZ3vx6waXfg39C/Hbj8FqR/35he7t+bOf+3Vvq3uvaXY+ZiOY7o6x5onMm2TIIeThfy7wKv4n3'
+        b'5bwar2q7nUAudtrBa7rmPKhs46IT19126xynmywx+uULR++nD+dcDcU3PwEGFPXlti+hBQkV5KZf'
+        b'JgRO+9da3LlvO/ebrnJncQz1jskcX/nDl/lXF//Ky+w9NUTO1lesWJfXFGUZipz+ZRSAuH3jlk6A'
+        b'n9cNv33LH1IVBNMJc2WD3Y5ripHcV26Fg3NgXOJ4lZAzRe4JCBH3TizGBRCw2YXksrPF++IccawA'
+        b'1Fm51sYAAZeSFxbpYwjZm+Kr13vzneLOWJ989noabgKIFHIoYNNCB6wYE/lTYiWHegopppRyKqma'
+        b'1FLPIceccs4lK8n1EkosqeRSSi2t9BpqrKnmWmqtrfbmW4ADU8uttNpa692bzo06c3XGd84MP8KI'
+        b'I408yqijjT5JnxlnmnmWWWebXbwEgSYkS5EqTfpyZsEUK6608iqrrrb6Jtd22HGnnXfZdbfdX6jd'
+        b'qP54/QXU3I2aP0jpuPJCjbOmlGcKp3SSFDMQ89GBeFEESGivmNnqYvSKnGJmm6cokmeRSbEx4hQx'
+        b'IIzL+bTdC7sv5P4UbibVP4Wb/3fIGYXuv4GcAbqfuP2CmqjOzYPYVYUaUxuoPq6v2o2vXUWt/6fH'
+        b'/4OJZIor049CcKUPmanPkVdF+xf0DozVTRUKklry4O8MXjKiMYekWrbsWTahXR6XEOrofoy4d005'
+        b'dCl7mi256QDwcedYaw97uVTXSBv0Uj7nz2WOVVcG0JUFnXEtn3Hml4Fv1xXgM+DtNs88c59xawS9'
+        b'YsIOHwPD1/X74ud6qLwzD28deXxGmh9DW4/nmHLrZ/DcU15BWj5riERD5N/HmV8GnhAOvfrtkm7p'
+        b'axb3Mcp8H3bfQzqnflvJuuf4Ocp8X8fXNR38sZL1tZL9Y5y5B7YT4rF0oIb4IFFknLipaXOziEt6'
+        b'c7KxCgMocbhgrz10KYY5esFA5L6G5PdLZxlKcSNDTdtKWquOPHEOcw4c34CirEfT4orVeBjHrZaq'
+        b'QL7JxeR+PaYuPe9a1topjpBHqx6iQ0JjcM2uaaKby7o17e6SeljOMiPrh9SybmusNu60IAZljV63'
+        b'bcQJloWc5y7BD58GW8N1V0zNHjNDekhxna7Dc0OkJ7U4Lq4gRVPR9YwVEm6eS5gSfRR8NcVnu4HO'
+        b'O2HK+oH3I0LLsKB4REm/y7mmI3R0iKIjmm7W44B1ELc5182ZQgfrF/Ez+DynkzEH1q5EXF6flhLH'
+        b'LYzmcXapTnhh2wzRiy9tAJIV0yP7GsVOUWpeIQn3KjOyx7REFLmpmvDipQG8qFmZGb+ys7Q25hQx'
+        b'szQvk7RwGpWDuAhiJG0AT8t4lVwFybKsB5iJYHVS3U4dCiAnsZ+7+WKWjBB0faNu70adZfkhBbIi'
+        b'DNGuFrUdiDM/LLkS0O46uS1Zy0iSbtVoRkKCor4E37rtngtTBNetsdIBHvHuq0c5nY/OxTs81DsY'
+        b'I4oJNwSJ0HGaYe4BjmxUbKyiw3uVMx10Y6WKfNAOvdQxDZahIp2NlAlIdJU6g6tYkAQUW0Ppm2SP'
+        b'qZh9rUW6KTOjAToGHWhlj1XbNnx5YzNyYN8wlKduZx5MkLU9cBZEKaFFrlMWvm4Uo8CnOVhKVEIb'
+        b'sqT2EQ300PEcMJTMTR+GZCPv3mHnu2xKtBXejAvcVepOabHE0Zv4Bdrid1x5eIMZaT3QP84O2tgD'
+        b'ehbusZgf/IkFmcBXnPgulFslltiWQiaMZuPCXZVsmc5g/+5Asy76x3AVi55THMZyRTDI4kacLGpR'
+        b'hAHz0+qolL1n/71XYmdKhxep5ABBLK2kB8TczuSAdGA6iKVwCg3AfLuLlWFnHeb3hTQtPne/+SrZ'
+        b'Zya9ld6DfGHHeKoQTKNVZP+DzCXNdBwMcWWzfuALWsrnZrqwLL5Oq/cjai1/XTPpJOzQ214pqwl7'
+        b'rypduflGDm/00r8TkHkYCJMY0x0Mf0/lXhGgA7lLjfVXMqjQqCQ1ll01gu+YNOXUwVUcBMCNdqYu'
+        b'T1WdJf5bijNfHPfJkmxeV/kAdiazfJ/Y3OlilWjP3dwxWrqNq0bdExqNHHLXpE0JF2viMM5O5x30'
+        b'viPINXpUOuJO9a9npdeq72DpblGdlFcrgf6teBrNBI+NrfcRaptMqrIoCLdZihm9UJD4s6J1LRT9'
+        b'UMHS5whwZqUt9zN3EnungMvGoFFwUDFFsp0gUNweTstGgsuFftrVqiWLXi9Y3kPxmA7yf0YX6oSI'
+        b'Z0kZXmxY+ebOHZA2GA8ViBkVOTvR3kITX+shKBfevHVtVdnhYbpLagDmKZFTN6IlctqKk2M6vj/f'
+        b'1ROhJ3dy0bInqAFZxFiiRa7UNFJq2EKh/cA9RFO1ndD6oI5VInxbK4JCXh+Vqje+6jdB+4MKXwQO'
+        b'ElO3E5dBQ+LC8+yK1JewkTBKj3f0i9MFBCAcDwCnrqptV0alAIMwwlxOcdQND/hIc50OqyAh7BLP'
+        b'0boHogCnxg2jVqJsEw0bK0VeJvzT0DQMdG+zdm7qcm2065F0qQGvSjdb6YzQIezJjmo0rJI/XgaJ'
+        b'Rk81u5nDCzwtFQVPZIoiaqXQr4HTmnNnXC9LA76bDOg642UDnoI4aL306TvVGO/7B1Z3DR1wr0sh'
+        b'bHwE7Z3vBWsIiaOcRzcHa2nojFcziuLnyzPGtSZvMBwUUp2n9r+r5Kmc8qMYMIgGJ/EDS216JrbN'
+        b'xt3y5Pay0u7+zr6WpNPGvvTbO3R+GsRAQlDzTmRk1ewJ1hZtCzCool9GNTNNesJeIG19BnQE8ZE9'
+        b'WDgqqNWHY0P9aIBLGsoC6KI601aAlFlyQKqVARHIvmnQSclC/y2e5CYzUq3IBs1xX+ZeIE5Elv9h'
+        b'6N7ITpS12BmSjtyyjdZ3d3YOHKmsaLC2wcJfqCUyH1Lm7rTryK7Xkq+Njpr1+d0K8jt7gq5ZXlPd'
+        b'VidCUM8H01sM6DjtIPEYnaYf4+pgMVLZFhoBnFS7Be4h6XTVHBFPZSRX27LwEbdMfqJmCroac00E'
+        b'u+jcyEXsYqQYc+o2+zTJBW1gly0FRxj02TWyv0i8YJyPWh1w1Be7aDTy1lpGh0416wJPPYf+W75g'
+        b'A81vCfOIHDQKU762cmWOb7XelQEz2h7oWWhvjKV6iU4IGCO7LO6fVm7E017RVGBz4AyuBLhh7LB6'
+        b'EKiLEuFbp7OiMArdl9HnpImBflNLXCYrcj5tMX1tou3LQriETWsjGwjJ97aAhgvnW6dZSjV4HpgR'
+        b'xmHwhFPgplGx2mBWMvkfFkRL6RXvbtWjddNKof8P20cqwWTCGgqZsmKngLGYicynsNOhAlTMB9XH'
+        b'VEicJp1a7jlNlYhOQAJTky3OG+22NF2oiDXipjJKi9jMRpXDamrjUzk2vuj8BKX1l8nRTLoE2hmS'
+        b'MBO7UrDkZGWwsVh9EOWKzyB3u0QflMhP8+5R66YNrdVHGkOzYEO4ZuV1GoPT1IYskRxBbLq21/Yk'
+        b'J0J4+moLy/br6QTtEcPvDFvYtAb5X9kZVDHoRYYgWPhcq7F3dJpCHTr61EqzM3sYjcAj/RAjKKjA'
+        b'NKdobkMe6OLUfu30U4deKlSvxzMU0/FhPR+ei6VYbjEhf6/dEDGeiNBsWmsj6ny4j1jj1IqlRy+0'
+        b'v9r9QquIU58Zq4m9pwmmSPUxnzOWtY+AstKbCTR4HBBeBeXa3mI8+efRLBe0/eC0Y+v4kKDDPL1E'
+        b'meptmYiyF9pm9HC2HTNdgW4aeiBvYF3KfWLy1Q82RxrTO/PP63+n0OmfiDUhoU32BQPf++kimRA9'
+        b'dpN8jXgOahurQ0lVsEwcQSAfJMscpxpdiu1C1JTV3QVppvoXLPBAqh0sE0kM+lzCocDnCdNvk+mj'
+        b'MZ/kfNzvMz3z2CuTdEX5pCMpJkNTzHOBBPP6qCTphOZjCtfnUeAQtyq6X7S2SEwlzWviZ6Oq9SDu'
+        b'HISj4npVsXmV88dRLZk+5cDsDasuuUeSAfKrrdh4dWOzSL+oeeKzqZsrRv0tRixMPcFL/T+PgTKv'
+        b'Gip0EHdJs2160G47t0QdJe2rrc4XUaW6N0rKvAKTDYEWv4ScJNrvQt4rtiahTrbT/7eFUSqN/mKS'
+        b'QzsRVlH18xS2D0g+LH2lkdUnRppGKss0zZS4cfo8i3Duxf5xGWEUkn1TA26UvA4vo+dEl1IisQbq'
+        b'r0ZxlthVJyecQQMQjWzUlbYbtco0uUGRX8DFWqQvdlhiTHSv1VKu0y59hnUldC3gklakZfbQyGAb'
+        b'ExHH4S59UDSHxXZf2MWW/wjUH0fzZwfex6KF9BscBjwC3IVdqaQtaYiVEKLCapYqAKaysK2sPtyF'
+        b'5me/Y4xx04cRgc5m+pPZOevzgYVlwmstelYkCCYgEdPAwWeFfnogcbFXOEfixlXa6SAmJA9ARkQg'
+        b'MUo0N15tpcNEaIQ7TSS2ss4rwiiz/m/KGBYepQ9C/vNwxXXRh3CHvGLF+dMWKXud/5TVR4w0GPjA'
+        b'rs/BBhAW3dtgL3g0rUDaPwpnlyvHR6uwWb8e1f9hHfyl4//ERGp8m/knLZpwzDrDujUAAAGDaUND'
+        b'UElDQyBwcm9maWxlAAB4nH2RPUjDQBzFX1OlIhWHdhBxyFCdrIiKOGoVilAh1AqtOphc+gVNGpIU'
+        b'F0fBteDgx2LVwcVZVwdXQRD8AHFydFJ0kRL/lxRaxHhw3I939x537wChUWGa1TUOaLptppMJMZtb'
+        b'FUOvEDCACMYgyMwy5iQpBd/xdY8AX+/iPMv/3J+jT81bDAiIxLPMMG3iDeLpTdvgvE8cZSVZJT4n'
+        b'HjXpgsSPXFc8fuNcdFngmVEzk54njhKLxQ5WOpiVTI14ijimajrlC1mPVc5bnLVKjbXuyV8Yzusr'
+        b'y1ynOYQkFrEECSIU1FBGBTbitOqkWEjTfsLHP+j6JXIp5CqDkWMBVWiQXT/4H/zu1ipMTnhJ4QTQ'
+        b'/eI4H8NAaBdo1h3n+9hxmidA8Bm40tv+agOY+SS93tZiR0D/NnBx3daUPeByBxh4MmRTdqUgTaFQ'
+        b'AN7P6JtyQOQW6F3zemvt4/QByFBXqRvg4BAYKVL2us+7ezp7+/dMq78fUtBymhQExJYAAAAGYktH'
+        b'RAD/AP8A/6C9p5MAAAAJcEhZcwAAOw4AADsOAcy2oYMAAAAHdElNRQfkAhgTLwpCxRN+AAAKbklE'
+        b'QVR42u1cW2wc1Rn+zpkT73qJnbg0YBKgpZDYVRrUAMG5kTRRG4gqIoVLnAJtU0CGNECcSm2Qqhan'
+        b'IJWHgtTmhSaUlgCCJpVtKS+FFihVRWlLlCpR6lypwY5DEKnjtfc2c875+4B3tZnMzs7uzu567fkk'
+        b'y7s7Z87l/7/z3+YCBAgQIECAAAECBAgQIECAAAECBAgQIECAAAECBCgrmNvBzs7OBxsbG5+MRCKX'
+        b'CSF49jEigtv37N/cjhVzvpf+3M7L/l1rDcuyzGQyeWpsbOzJ559//tVyCbujoyMyPDy8hzG2DgCk'
+        b'lE/kVMD27dvfnjlz5tdGR0eRTCahtS5aSIW0KeSYl/nka8MYgxAC4XAYDQ0NSCQSx5VSi3bu3Bn1'
+        b'U/h33nnn04ZhbANQlzUP6aiAxx9//M1wOLw6Go1Ca10RQfhxrFSlA0BDQwNCoVDUNM2r/FBCe3v7'
+        b'd4joV4yxGU5jCvsJW7du3RYOh1ePjIzk3eLlgttYbooppo39t2g0ilAo1BiJRP4JoLUEwS8mopcY'
+        b'Y9d59gFdXV2CiGKjo6N1ROSriShl91TS5KX/NzY2wjTNb+3evfu1QgR/xx13XME5/4MQYqmX9Vyw'
+        b'A2Kx2G8ZY3VenF4hO6OQ3VMt9tsRjUYRiUR+DMCTAu6+++46xthvDMO4h4i41/VcENkIIe6yLKtm'
+        b'hOSXecx1vlJqrkfh/9QwjBHO+X3ZwvcyRmYHbNu2rUNrHfZbSNVgv1/nSynr3Oa7cePGu4jo15zz'
+        b'z3kNl+3HMgpgjHWYpllz7C/0/KbrwmheHIapUjjztyRiH+mcbbXWLAfjb2SMvcI5byl1PRkFGIYx'
+        b'X0pZNfZXSulXLp0OXWeBKYWmNo3YR7nHyA7BAWDdunWXh0KhF4UQaxhjrNQ5ZxTQ2dm5hDEW9kMQ'
+        b'1TIxXtsoraBJQpGE1BaAaXn76erqEn19fc9xzr/HGON+mkUDANra2p4lovnVsrWVNHmpqMK0yzVk'
+        b'SuLcuwQ1yl3Pb2lpkcPDw69zzhflY30x6xHjW20h57wsJmIisR8Aov0Wov3ptkbefjjnT3HOi3Kw'
+        b'np2wYRhX1Fp4WQmlERGUUmkfWZb1cABcCBEpZww+EQRZynqklBlF+L0e/sgjj9yqtWa1EF5WQ+np'
+        b'/0oppKNEP4nKtdar81UIq8HMiWTyGGMZc+RWKShmPpyIrql1E1FOxdoDH601pJS+7WbOGJtdiQy0'
+        b'lutJ9mNa64uStGLnyolo1mQqulVqPkqpi5RQzHq4YRgzarXoVol6kls/6eiolLlyxtj0ycL+cird'
+        b'bSekQ9Ri1sOJSEzlkrOXNk4ViOyxspVQ6Hx4dnGpFk1EuZWeDkHdwBiD1tpRCXkTMbjcG1SrJedy'
+        b'rydXmEpEGcfstR9hV8BkKDlXaj5Opim9C9LH8s2Vc85ZNcO5WmV/Lr/AGMsZojrNlfshpFpmfyml'
+        b'Cbcd4dUn8FrIQKttFu0M9zqWPWN2Govn2iq1xv5KZNS57LqbOcp2zI6ZMI33FpSci0O2Ocruxx4d'
+        b'5UrWMgqoBjNrpZ5kF6Yb8936dCr7888++2cizi9rh7qkqWaKbvna5HO4hZojpx2g/TQNH9TPxtmV'
+        b'mzDWegvIhSG1XE/KJ2Q3Zdl9AldKWX4KacxUODmm0H/1Tfh01f1IXXplTZWcvZQmSjVHF5ggrXXM'
+        b'10Rl/O/TpMJxNR2Dbe2I3nQ7aFq4JutJblfHivUdF0RBWuvhcpkIiwgDYxInZl6HodUPInbNwoqY'
+        b'iHKsxy58N3PkpYiXXY7+1PcM1PZ9zCKcTBr4YN5qnFvSDungpCdyRl1KCJpPoZyIBsvnIC9Uyrmk'
+        b'RF/oCvTfsgmjrSuAPHfjTYR6kpvD9Vqgcy1FWJb137JHD6CMQixNGEwQ/jPnJgytvB/JS6+akEW3'
+        b'UjNir3PlnPM/+xqFOLDfqU1cahyjBhy9cQPO3XA79LTwhK4nlVojyrkD9uzZ85ZSisrGtiz2O2HY'
+        b'1DgyYy5OrngAYy5OeiLXk3LZfE9OGICWUsb8XEA+9tsdtdSE0yqEw19ajaHF+Z20nwKtRF3LzYlz'
+        b'AJBSDlaD/dnHCISE0jhWPweHl2zC+daVGSc9ke4H8pIRF5I1cwCwLOvf1WK/k0KGJcOh2YtwYtkm'
+        b'pMaddBXrST8BkCw0zndrk60UDgBa62ftF5P9Yj+Qn/1OkEQYEE04sLAdZ776zYucdKUip+7u7qcW'
+        b'LFjQoJR6AYB2c7iFZM0ZZaQ/dHR0xOvq6upLfbHGX1ZsdTQ/5BIpOZkq+26ZIeO49sN3MaP/YF7h'
+        b'+vnU/N69ezMyWrNmzWWRSGQP53wNHO4myfcUjVPilsmEEonEId+2LUoPU+1KGzEiOHjt13H8hrsg'
+        b'L2mqSj3pjTfe+KS3t/c2y7LaiOiYH6WJjAJSqdSuQu5p8aYQDzbfg6NOd6AJGJx5Df5x8yacuXaZ'
+        b'YybtZz0p18Wq/fv3/6unp6dVa/1tIjpfSmkis4K9e/e+YFlWvORUvgzstyMJA31fWIqDbd/FWNOc'
+        b'skVFRJRyU1Zvb+/LPT09TQC6AKTcShM5b87N/hKLxV7zcpG+Gux3wv/qP4/3b7wHJ+bfBiVCvpcd'
+        b'pJTHvJzX3d29QwjRpLX+fdpR5wtTHRXQ0tLykGmaqfLkBN7Z736+7WEJYvio+Xq8t+QBfDz7K76x'
+        b'XykFzvkOr8rbt29fore3d6MQ4moAf893LcBRAV1dXTKRSGyzP4xWLPuLDVPJg0bspkprArM9v1Us'
+        b'+8ffI3eku7u7p1Afsm/fvtO9vb1LGWPLAfTnm89FD78ePnz4/dbW1jYhxFwv9zfaj/V/cXHBiVex'
+        b'7AcARhqzTx/E9Yd60DB6tmT2SykhpTzf3Nz85QMHDlgoEn19fQNHjx795bx58waIaBVjLOSYEefq'
+        b'4N577/1jfX39rYZheEq503h7PA9wUoA97ndSgBP76SJH/xkuiX6M1r7XMWPsbEnvqEvfwTZ+n/+R'
+        b'5ubmm3ft2hX3s+yzfv36n2utf4Csl1PkfGlfGhs2bLgvFAo9bRhGM+fc8LLId7/xo5zsz5V4kYv5'
+        b'cWI/s0xceeIdzOl/DyxHQuVVEUREjDFTa31UCLGjGLPjFWvXrm0UQrzMOV87PoefMb8HmfvyESob'
+        b'+4mgtXzdkIktAw8tO4VJAFGOTv22/QBASp6FKX84tHnRS5hEEJUYxIn9nkNQrbQ2E6/EIR4d3rxo'
+        b'BJMMolzsL7YKmrH9pEFm8oiKJ75/pnPlXzFJUbYdUFLZQZoJFY//YujyoR3o2KAwiSEqNZCnsoOU'
+        b'gBl/U6vUw0OPrjqJKQAxIdhPGjCTZ1Xc3H566/IXMYUgqs5+y9QwE6+O8tCW4a3LRzDFIKrGfqVA'
+        b'yViftuTmwcdWvIMpClF59msgEU9qmXpmYNbZJ7BhcjvZ6viAXOw3kyAz+ZYi66HBLVPDyVZ1B2QS'
+        b'LymBVPwTZdL2gceW/y4Qe6VMkCbAjGttma+x+ulbBh5eeD4QebmdcDqTNROAmThqWfTwVHayld8B'
+        b'ygRS8aSW+pkPZ52Z8k628jsgEfuTtNjmgcduORWIN0CAAAECBAgQIECACYn/A0Y+WyvDhGsJAAAA'
+        b'AElFTkSuQmCC'),
+    'play-circle.png': (
+        b'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAC7HpUWHRSYXcgcHJvZmlsZSB0eXBl'
+        b'IGV4aWYAAHja7ZddkuwmDIXfWUWWgCSExHIwP1XZQZafA7Z7umcmyb1171OqTRmwACGfT6Znwvjr'
+        b'zxn+wEUlc0hqnkvOEVcqqXBFx+N5lV1TTLveV7qG8PxiD48BhknQyvlo9ZpfYdePBfcedLzag18j'
+        b'7Jeja+B2KGtnRqc/Bwk7n3a6IgllnJ1c3J5DPfhs2x2yf9xlku2oLq/rOTwbkkGlrthImIeQxF2n'
+        b'MwI574pbULMgqDWKvgiFPcBXJBDk5fXuNsZngV5Evnvhs/qP3ifxuV52+aRlvjRC59sB0u/F3xI/'
+        b'bSyPiPh1wOR29VXkObvPOc63qylD0XxlVAy3OmsNJh6QXPayjGK4FX3bpaB4rLEBeY8tHiiNCjGo'
+        b'zECJOlWaNHbbqCHExIMNLXNj2TYX48JNTk4oNNmkSBcHv8YjAF0SfsRCe9+y92vk2LkTpjLBGWHJ'
+        b'P5bwb4M/U8KcbUlE0R9aIS5emYUwFrlVYxaA0Ly46Rb4Lhf++JQ/SFUQ1C2z4wVrPE4Xh9JHbsnm'
+        b'LJinaM9PiIL1ywEkwt6KYEhAIGYSpUzRmI0IOjoAVUTOkvgAAVLljiA5ieA8MnZee2ON0Z7LypmX'
+        b'GWcTQKhkMbApUgErJUX+WHLkUFXRpKpZTT1o0Zolp6w5Z8vrkKsmlkwtm5lbseriydWzm7sXr4WL'
+        b'4AzUkosVL6XUyqFiowpfFfMrLAcfcqRDj3zY4Uc5akP6tNS05WbNW2m1c5eOY6Lnbt176XVQGDgp'
+        b'Rho68rDho4w6kWtTZpo687Tps8z6oHZR/VJ+ghpd1HiTWvPsQQ3WYHa7oHWc6GIGYpwIxG0RQELz'
+        b'YhadUuJFbjGLBSebKCNIXWxCp0UMCNMg1kkPdh/kfohbUP8hbvxf5MJC9zvIBaD7yu0ban39zrVN'
+        b'7PwKl6ZR8PVhfHgN7HX9qNVfbd+O3o7ejt6O3o7ejt6O/geOJv54wH+X4W8Ph53ytAOLbgAAAYRp'
+        b'Q0NQSUNDIHByb2ZpbGUAAHicfZE9SMNAHMVfW6UiLQ4WlOIQsDpZEBVx1CoUoUKoFVp1MLn0C5o0'
+        b'JCkujoJrwcGPxaqDi7OuDq6CIPgB4uTopOgiJf4vKbSI8eC4H+/uPe7eAf5Ghalm1zigapaRTiaE'
+        b'bG5VCL4igAGEEcWwxEx9ThRT8Bxf9/Dx9S7Os7zP/TnCSt5kgE8gnmW6YRFvEE9vWjrnfeIIK0kK'
+        b'8TnxmEEXJH7kuuzyG+eiw36eGTEy6XniCLFQ7GC5g1nJUImniGOKqlG+P+uywnmLs1qpsdY9+QtD'
+        b'eW1lmes0h5DEIpYgQoCMGsqowEKcVo0UE2naT3j4o45fJJdMrjIYORZQhQrJ8YP/we9uzcLkhJsU'
+        b'SgDdL7b9MQIEd4Fm3ba/j227eQIEnoErre2vNoCZT9LrbS12BPRtAxfXbU3eAy53gMEnXTIkRwrQ'
+        b'9BcKwPsZfVMO6L8Fetfc3lr7OH0AMtRV6gY4OARGi5S97vHuns7e/j3T6u8HY/1yoZclrCIAAAAG'
+        b'YktHRAD/AP8A/6C9p5MAAAAJcEhZcwAAXnwAAF58AQDHfLQAAAAHdElNRQfkAxcNHwLg4xojAAAG'
+        b'KElEQVR42u2be2wUVRTGf7tsEUSgiIg1BRSNICFaVKrRVMWoUWKsDwzGB1FRidHEGCX+YaKo0WA0'
+        b'EXzEhIcmgK8EjRIDQRHTGEUrpkACipVHKIoPENoirdDu+sd8246XO9OZ3ZndLfZLbtrs7tw559w7'
+        b'5/HdM9CHPvQhIhwH1AJrgWaNNcDNwGAgcSwpmwRSrjEUmA+kgYwx2oAXgBEB58pnJMMqkgjxu1OA'
+        b'k4FyYAjQ33V9NfCwPrPhMPAQ8BbQYXw3QSNfZHSfFuAA8Afwmz7PC6OAacACYAPQalnlIGOjDGdi'
+        b'To7zeY1W3WuB5B6Vq+L9gBpgEbAvAsE6gLEFMIB77JP8NdInlPLXAXXAPxEKNLHABshI/jrpE9gI'
+        b'l+qiwxEK0gyMLIIBsr6hTnr9BymPZ34GcCFQZvn+ELDb5QsATgUqenCqK+WgTPwKrI/ACSYUbiuB'
+        b'443vyqTPDGAH0OQVBZLALcCrlrB1BHhTzmWPQl4WZwEfAid5CLcDuBX4zuKVBwEnRBieK4D7gXss'
+        b'C/inotFyQ/4uVEhB2zaa5RNnE8BkYLvlugbg8rBOKAJDzPLQY4H0tGKSBDYvWhTwxgOA6cDzwHMK'
+        b'QycWMWFb7LEgk7wuuELPqelFx/fSjHW8JYo1S8+ureL+f6gciRu75PR6I3ZLfjeGaCRtBrClsgei'
+        b'SCeLhIzkN9HfZgC/SXozMn41UCrGG6eA05X+/gJsVSgtKaRinPdK4FElJi3Ap8AbSnwKhbM9Qt4F'
+        b'wGrz8UgphJlho17JShiMAd5WAeT2vg3AfQqXceN8YIshg7tImisSJxYDnAN8Y5krrd2wFrgsRpZo'
+        b'gNLrtE990AZcm4xJgISHg83m61OAFcDr8hFRG2KqSJZED0Z6JFlE/zMEeABYpb+VEfqkqoBzVRfT'
+        b'AO5C6hWlrVNFvUVRCwRy1qVggCwBczWwDHhGqeqwPObbAnQG+N2GUjFAFoMVJRYDs4GLgYE5zPOF'
+        b'8g4/tOs+sUSBc3VdvlTW18DjKmrCltM3ATs95m5XhTssRemiP3ARME58wnLgI8XwIFihHOAuUWHD'
+        b'RY1tBT4AlgIHEkaIqlCWZBZDXwV8ptw7YKFIkijQCfyuHTEPWOfF6Fh8y2hRdoM0zz7tjGZbnZCN'
+        b'3+agCI+AF7n5M7kdpCRseUHSUjmlLaNUUAacAdyZY1WYyTVeHrNI+WyXUuQCjojhWZpnUtS1G1KG'
+        b'0kOB0+Qx+wF/q3zdFdIJRg3TCf4YIsG6BOdA1431ONR+xq38WOBJYBPdROJeHL6/NmSeHpUTTMtr'
+        b'rwRmamHCYJCHHNOz+mSVKgeeAG43auThwI2qrfvJGIXCYeB74GONxjh2YdYANwC3mQSBC6O1O9Zp'
+        b'68SNncC7wCciUdridoIzA7A041THvxOj4q3AexoNwP5CRYGqgA5lQoxO7nMRJPU4nR0FDYMdAROJ'
+        b'OCLBTzj9RSukeEcB/UyXAeqBqwKs0sYI792CQ5y+hHN6XJScI5skvKwS0W/1NyscBU070x6ft6pe'
+        b'vx54kO4T5aKXnnOx9wJ1iGE5L8R8Y8TuFJMWD5QHuFEOvGj5cZPygLCP1jU4hyE/AN8Cz6osLSQC'
+        b'J0IAB7G3quwJkXricqprgG38T4/GskZo1ChZBCmHe3uPb8LDGR9lgLTyb5tvSPRi5cs96oy0zQDN'
+        b'ClNmHVDZSw1QKfnN/KMlawDTB+yX46oyQuRjwL1FUmI4zkFJlVZ0Ew473B7g2tkc3fWy3a/GyLVN'
+        b'Li4HPQWnQduUZTsO45zw8W2B2uRsjZLTgNcI1yiZDw6KeTKf3cnA+2KobNgrrqLRkD9Uo6TNgqOA'
+        b'p4A7PPgBW6tsPlgoo7oxEOfdguk9pNt76O448WuVRSzXMuBpXK2yXqgh+mZprzHHcv+RdB9cRNks'
+        b'XRN0VeJqlw9qgIkUqF0+5VP6rtIqzMA5aCxky+shyZBvf/FfODzmEhxGuTNMKtwJfCl+brX4gmrg'
+        b'TKLr7sbHwW3G6TXKxaluUwH2mf425Zvm9vTSVD7YomEuzN2KRn4vYs1XtQcxvjTlFWfjftVtBM7r'
+        b'dm3Yzwvm4Rzk5PXaXKnn8YNxXrxco1Vtxmmxq/XZGX3oQx+C41+OVP8fJiax1AAAAABJRU5ErkJg'
+        b'gg=='),
+    'question-circle.png': (
+        b'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAC7npUWHRSYXcgcHJvZmlsZSB0eXBl'
+        b'IGV4aWYAAHja7ZdtktwoDIb/c4ocAUkIieNgPqpygz1+XrDd0z2Z3SS1+2urTTXQAkvy+8j0TBh/'
+        b'fZ/hGy4qmUNS81xyjrhSSYUrJh7Pq+yeYtr9vtK1hO8v9vBYYJgEo5xfrV77K+z6ccMdg45Xe/Br'
+        b'hf1ydC3cDmVFZkz6c5Kw82mnK5NQxjnJxe051YPPsd0p+8dnjtiWSe1cWt/DsyEZVOqKQMI8hCTu'
+        b'Pp0ZCLKTIhU9737tQ4+5iAYMLHRlAkFeHu8eY3wW6EXkexY+q/+YfRKf62WXT1rmSyNMvlwg/Vr8'
+        b'LfFTYHlkxK8LJrerL0Se3ecc59PVlKFovioqhludrf7sBySXfVtGM3wUc9utoHmssQF5B7cDrVEh'
+        b'huIzUKJOlSaNPTZqSDHxYMPI3EBi2VyMC7dNLq1Gkw0MuzhgNR4B6JLwIxfaccuO18gRuRO2MsHZ'
+        b'wv63LfzT4p+0MOcqUqLoD62QF6+6RhqL3OqxC0BoXtx0C3y3C398qh+UKgjqltnxgDUep4tD6aO2'
+        b'ZHMW7FOM5ytEwfrlABIhtiIZEhCImUQpUzRmI4KODkAVmbMkPkCAVLkjSU4iOI+MnVds3GO097Jy'
+        b'5mXG2QQQKlkMbPCWAVZKivqx5KihqqJJVbOaetCiNUtOWXPOltchV00smVo2M7di1cWTq2c3dy9e'
+        b'CxfBGaglFyteSqmVQ0WgCl8V+yssBx9ypEOPfNjhRzlqQ/m01LTlZs1babVzl45joudu3XvpdVAY'
+        b'OClGGjrysOGjjDpRa1NmmjrztOmzzPqgdlH9qf0BNbqo8Sa19tmDGqzB7HZB6zjRxQzEOBGI2yKA'
+        b'gubFLDqlxIvcYhYLr/OMkaQuNqHTIgaEaRDrpAe7D3K/xS2o/xY3/hW5sND9F+QC0P3M7Qtqff3O'
+        b'tU3sfAuXplHw9mF9eA3sdf2o1X87vh29Hb0dvR29Hb0dvR39DxxN/PGAf2LDD2K4nqmB/xTEAAAB'
+        b'hGlDQ1BJQ0MgcHJvZmlsZQAAeJx9kT1Iw0AcxV9bpVoqDnYQEQlSnSyIijhqFYpQIdQKrTqYXPoF'
+        b'TRqSFBdHwbXg4Mdi1cHFWVcHV0EQ/ABxcXVSdJES/5cUWsR4cNyPd/ced+8Af73MVLNjHFA1y0gl'
+        b'4kImuyoEXxFGCN0YxpDETH1OFJPwHF/38PH1LsazvM/9OXqUnMkAn0A8y3TDIt4gnt60dM77xBFW'
+        b'lBTic+Ixgy5I/Mh12eU3zgWH/TwzYqRT88QRYqHQxnIbs6KhEk8RRxVVo3x/xmWF8xZntVxlzXvy'
+        b'F4Zz2soy12kOIoFFLEGEABlVlFCGhRitGikmUrQf9/APOH6RXDK5SmDkWEAFKiTHD/4Hv7s185MT'
+        b'blI4DnS+2PbHCBDcBRo12/4+tu3GCRB4Bq60lr9SB2Y+Sa+1tOgR0LsNXFy3NHkPuNwB+p90yZAc'
+        b'KUDTn88D72f0TVmg7xYIrbm9Nfdx+gCkqavkDXBwCIwWKHvd491d7b39e6bZ3w9U/3KbEassawAA'
+        b'AAZiS0dEAP8A/wD/oL2nkwAAAAlwSFlzAAAO7wAADu8BjjAGhwAAAAd0SU1FB+MMCgkjFrPlN1YA'
+        b'AAQpSURBVHja7ZpNaBVXFMd/aRKMKBXbWD9eMdWouNBGqm7U2k0UtS517yLrUIw0AUEQQVe2iHSj'
+        b'aBBX3aqg0A8o2m7qR9SCjRJQElstinnGQMzT1EX+geGRN3PvzJnJkzd/uBDy3pvzn3PP1z33QI4c'
+        b'OXLkyFGzqMtAxgfAPGA+sBrYAqwDVgCfAHP1vVfAU2AAuA1cA+4BL4AiMPG+KaABWAtsBzYDG4FF'
+        b'ns94AlyXMn4C7gKl98GylgJngUFgHPg/4RoHhoBePbtq3akZ6AJeGrx0pfVSMpozcmFnbAUuG+24'
+        b'i0Vckcyq2PkO+etEBi8/tSYks2MmLWEW0AmMZPji5WtEHGbNxM53As8SmPEg0Af8odT3OOaznotL'
+        b'ppbQEWPn3wI3gW+ANmAZUFB6LADL5dc/AMMxLKEjq53fKv9zJfca+AvYCzQ6ylkAfK/iyDW2PBG3'
+        b'VC2hWRHYldQocAJYErOY2iYXcQ2Ml8UxNXR5prpDgXI3rsUVgN88YktXWi/f4lHkjAPfGcr+TIHS'
+        b'tVgyrxgbVN66muIF4GPjQ9U+jw04K85m+EJpy0X4MLAnIhg1Al8C+4Fv5etRufxD4IYjh0FxNtN+'
+        b't4fvjwGHK/h+PfA5cHWa392TIsIyRY+HC3aLe2LMl0n75uVTQGuZItuBByG/+1ffqYTNHhwuiHti'
+        b'LBcx3wrtrQLXV3KHFuBWRAqdAI6E7NwSD/n/iHtifJ2wXv8POKkq0KVoCitrWz1l77JQwLGMDjYl'
+        b'NT0KIVx2eD7zaFRqc0FbBiX2Q+AgcEmpLkwBPlhnQe5+imf6Z8Bp4FMHHsukKB8Z/RYKGE7h5d+o'
+        b'vN3peHiZozOFb8dp2EIBb1JQwJ8KaC4vX6fMMBpT0VWngKLuCKJQD6wEfkxoaVXnAsccZC4CDqiP'
+        b'kKTXaOIC/ca+vyFC3iZdiIwZyOuPqvFdMGCY7kbkAmE7fxxYb9ToHLBQwG1DBTQCH0X0HNYYyuuz'
+        b'KISuGRKaA5wPHGvLo/36hB2kVLjHPQzN9Io8DLm6wAvlbWuMyET79Lc1rot7YgUUgd+xvZq+qHP/'
+        b'bq12/c8KJXEuWrbEhozS4JkKyq/TZxaFl2lLbCp69xoQu6NIH5YF7hrI6bVuivq2xSutU8DsEBmz'
+        b'9Z2kMwQtrs1OHzxSszNJLChG/L6U0G9L4vgoDQUAnAN+nSaHu2Ix0BTyeRPxrtEQp1/EMTXEuRwN'
+        b'riFgVcjzVyUItplcjk4hzvX41PpZfb/6sqNvQZ/FHZTI5Ho8aAmdTA4nxCF8k8lLjl1aPbjf+lTF'
+        b'gAQkH5EZF/nnxB+umrERmaAl1OyQVBA1OyYXtISaHpQMIo1R2UGVty3Wu5YWGpi8Bm9nckJ8g4og'
+        b'H5QPS9+x6vJmoYBgtTnduHwrsJDK4/JXgb9JeVw+R44cOXLkyJGjZvEOJA2o05Q0pd8AAAAASUVO'
+        b'RK5CYII='),
+    'save.png': (
+        b'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAC7HpUWHRSYXcgcHJvZmlsZSB0eXBl'
+        b'IGV4aWYAAHja7ZddsuMoDIXfWUUvAUkIieVgfqp6B7P8PmA7N7l9Z7q7Zp6mYiqABRby+QRJwvjr'
+        b'+wzfcFHJHJKa55JzxJVKKlzR8XheZdcU0673la4h3L/Yw2OAYRK0ct5aveZX2PXjgXsNOl7twa8R'
+        b'9svRNXA7lLUyo9Ofg4SdTztdkYQyzk4ubs+hHny27Q7ZPz7TtuuHk3Ufng3JoFJXzBLmISRx1+mM'
+        b'QBCdFKmoCTWLYl7cFhYP58AVCQR5eb27jfFZoBeR7174rP6j90l8rpddPmmZL43Q+XKA9Gvxt8RP'
+        b'C8sjIn4dMLldfSHy7D7nON+upgxF85VRMdzqbPVnPyC57McyiuGj6NsuBcVjjQ1wemzxQGlUiEFl'
+        b'BkrUqdKksdtGDSEmHmxomRvLtrkYF26bXFqFJhuIdXEwazyCCMz8iIX2umWv18ixcidMZYIzwiN/'
+        b'W8I/Df5JCXO2JRFFf2iFuHhlLsJY5FaNWQBC8+KmW+C7XPjjU/6sVE2YtmR2vGCNx+niUPrILdmc'
+        b'BfMU7bkrKFi/HEAirK0IBpmeKGYSpUzRmI0IOjoAVUTOkvgAAVLljiA5ieA8MnZea+MZoz2XlTMv'
+        b'M84mgFDJYmCDPQVYKSnyx5Ijh6qKJlXNaupBi9YsOWXNOVteh1w1sWRq2czcilUXT66e3dy9eC1c'
+        b'BGegllyseCmlVg4VC1X4qphfYTn4kCMdeuTDDj/KURvSp6WmLTdr3kqrnbt0HBM9d+veS6+DwsBJ'
+        b'MdLQkYcNH2XUiVybMtPUmadNn2XWB7WL6k/lD6jRRY03qTXPHtRgDWa3C1rHiS5mIMaJQNwWASQ0'
+        b'L2bRKSVe5BazWBibQhlB6mITOi1iQJgGsU56sPsg91vcgvpvceNfkQsL3X9BLgDdz9y+oNbX91zb'
+        b'xM5duDSNgt2H8eE1sNf1pVb/bft29Hb0dvR29Hb0dvR29D9wNPHjAX9iww+ly53rZVwzsQAAAYRp'
+        b'Q0NQSUNDIHByb2ZpbGUAAHicfZE9SMNQFIVPU8WiFQc7qDhkqE4WREUctQpFqBBqhVYdTF76B00a'
+        b'khQXR8G14ODPYtXBxVlXB1dBEPwBcXF1UnSREu9LCi1ifHB5H+e9c7jvPkCol5lmdYwDmm6bqURc'
+        b'zGRXxa5X9GAQIaqgzCxjTpKS8F1f9wjw/S7Gs/zv/bl61ZzFgIBIPMsM0ybeIJ7etA3O+8QRVpRV'
+        b'4nPiMZMaJH7kuuLxG+eCywLPjJjp1DxxhFgstLHSxqxoasRTxFFV0ylfyHisct7irJWrrNknf2E4'
+        b'p68sc51qGAksYgkSRCioooQybMRo10mxkKLzuI9/yPVL5FLIVQIjxwIq0CC7fvA/+D1bKz854SWF'
+        b'40Dni+N8jABdu0Cj5jjfx47TOAGCz8CV3vJX6sDMJ+m1lhY9Avq2gYvrlqbsAZc7wMCTIZuyKwWp'
+        b'hHweeD+jb8oC/bdA95o3t+Y5Th+ANM0qeQMcHAKjBcpe93l3qH1u/95pzu8HHAByhOJfKZsAAAAG'
+        b'YktHRAD/AP8A/6C9p5MAAAAJcEhZcwAADtMAAA7TAY57uK4AAAAHdElNRQfjCxkIHAt5cz/lAAAC'
+        b'b0lEQVR42u3aP2sUQRjH8c8lp+QPqFEIQclLUCy0M4LYpFWxSesLECV2grERQd+FdoLRJmBho2An'
+        b'CKIQxDI2JsZI5OIR9ixuA0HiZu/fZG9vfjAc7M3sM/Pd2WeemX2IioqKioqKisrWKC5gEWtI0AhY'
+        b'EvzAC1xM+xN08HewHnjQ/ysbuIvxUABm8LMgg98pm1gIBWCxYIPfXRZCzIS1AgPYDAEhKTCAjl+H'
+        b'So46jQwwq/iVUacbquB4WrJ0H4/wu5WbVzvo2Cpu4F2PAQzhMh5jOqPefPrbMoQ8M2Cv8gUnAjni'
+        b'I3jWi9eh2iGYJBCABuo56o3jXiszYaikkes8buWJGMsKYDyFcH5QAcBR3B5kADth/EADmBh0AJVB'
+        b'ByACiAB6B+AQjgXqZzUNh8M7iYyNTh2v8BbbPQZwBtfb3PdXegWgFCtB9AERQAQQAQy0qgdgs4YV'
+        b'fMSH9NpZnMYpgT975VE3j7CXcVPzcLPyz1I1nf633GWbhQGwgksYzrA1nNZZKRuAOuZasDmXtikN'
+        b'gKV9nvxeznmpTACutmH3WggAQ4G8/uc22n1K2/Z9HLCtvQ8oSYBdZhAAoxhro91YiJggBIAqZtto'
+        b'N3tAgVpPnOBXTLVgcyptU6pA6AlGctgbwdMyRoJbeIjJDFuTaZ2tUABCH4nV8RrP8R7f0usncQ5X'
+        b'NJMhDoc6EjuoM8GaZt5hbddKMdEjr98xgCRnvSKqsd9Kl2cZXO/j8459+54HwJs+BtCVvs8oTp5w'
+        b'K2VdM8E7U3m2qN/xRzPdZKRPnvwGHuBlt/YTu9PlVxUzezTRTOtdTGftqKioqKioqKioDP0F9Qyx'
+        b'bs3sa20AAAAASUVORK5CYII='),
+    'video.png': (
+        b'iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAAC7HpUWHRSYXcgcHJvZmlsZSB0eXBl'
+        b'IGV4aWYAAHja7ZdtktwoDIb/c4ocAUkIieNgPqpygz1+XrDd0z2Z3SS1+2urTdlgCQv5fWR6Joy/'
+        b'vs/wDQeVzCGpeS45RxyppMIVA4/nUfaVYtrXfaTLhfsXe3g4GCZBL+et1Wt+hV0/HrjXoOPVHvzy'
+        b'sF+BLscdUNbKjEF/ThJ2Pu10ZRLKOAe5uD2nevDZtztl/zjniG2Z1E7Xug/PhmRQqSsWEuYhJHFf'
+        b'05mBnGfFKbiyIKnlxRjDsE33u0KQl9e7+xifBXoR+R6Fz+o/Rp/E53rZ5ZOW+dIIgy8dpF+LvyV+'
+        b'WlgeGfGrw+QO9YXIs/uc43y7mjIUzVdFxXCrs9Wf/YDksh/LaIZTMbbdCprHGhuQd3A70BoVYlCZ'
+        b'gRJ1qjRp7L5RQ4qJBxt65saybS7GhZucnNBoskmRLg5YjUcAuiT8yIX2umWv18ixcidMZUIwwiN/'
+        b'28I/Of+khTlXkRJFf2iFvHjVNdJY5NYVswCE5sVNt8B3u/DHp/pBqYKgbpkdL1jjcYY4lD5qSzZn'
+        b'wTxFf35CFKxfASAR1lYkQwICMZMoZYrGbETQ0QGoInOWxAcIkCp3JMlJBPuRsfNaG88Y7bmsnHmZ'
+        b'sTcBhEoWA5siFbBSUtSPJUcNVRVNqprV1IMWrVlyyppztrw2uWpiydSymbkVqy6eXD27uXvxWrgI'
+        b'9kAtuVjxUkqtHCoWqohVMb/CcvAhRzr0yIcdfpSjNpRPS01bbta8lVY7d+nYJnru1r2XXgeFgZ1i'
+        b'pKEjDxs+yqgTtTZlpqkzT5s+y6wPahfVn9ofUKOLGm9Sa549qMEazO4QtLYTXcxAjBOBuC0CKGhe'
+        b'zKJTSrzILWaxYGcTZSSpi03otIgBYRrEOunB7oPcb3EL6r/FjX9FLix0/wW5AHQ/c/uCWl+/c20T'
+        b'O7/CpWkUfH3wD6+Bva4ftfpv+3egd6B3oHegd6B3oHeg/0GgiT8e8E9s+AFwRp6qo4ZBrwAAAYRp'
+        b'Q0NQSUNDIHByb2ZpbGUAAHicfZE9SMNAHMVfW6UiLQ4WlOIQsDpZEBVx1CoUoUKoFVp1MLn0C5o0'
+        b'JCkujoJrwcGPxaqDi7OuDq6CIPgB4uTopOgiJf4vKbSI8eC4H+/uPe7eAf5Ghalm1zigapaRTiaE'
+        b'bG5VCL4igAGEEcWwxEx9ThRT8Bxf9/Dx9S7Os7zP/TnCSt5kgE8gnmW6YRFvEE9vWjrnfeIIK0kK'
+        b'8TnxmEEXJH7kuuzyG+eiw36eGTEy6XniCLFQ7GC5g1nJUImniGOKqlG+P+uywnmLs1qpsdY9+QtD'
+        b'eW1lmes0h5DEIpYgQoCMGsqowEKcVo0UE2naT3j4o45fJJdMrjIYORZQhQrJ8YP/we9uzcLkhJsU'
+        b'SgDdL7b9MQIEd4Fm3ba/j227eQIEnoErre2vNoCZT9LrbS12BPRtAxfXbU3eAy53gMEnXTIkRwrQ'
+        b'9BcKwPsZfVMO6L8Fetfc3lr7OH0AMtRV6gY4OARGi5S97vHuns7e/j3T6u8HY/1yoZclrCIAAAAG'
+        b'YktHRAD/AP8A/6C9p5MAAAAJcEhZcwAADu8AAA7vAY4wBocAAAAHdElNRQfkAxcNIBqrUahJAAAD'
+        b'kUlEQVR42u2az0uUQRzGP+tquahQ5g/6QZRQHQKJSoK0g3gqD128FEYkgtTFw+If0KluHaKDRwn0'
+        b'lNAPArsk1aGDQh2EokOxZRilG7W6q+jaYb8Lb8O677u78747u8wDc3jZmWd2npl55/t95gULCwsL'
+        b'CwsLC70IAa3ALWAeSAHbRZQUMAfcFL5QpQhwAnhW5KB3Kk+B45Uw+F3AA2BTswCbwH3hNxoHgRXN'
+        b'g8+WZeHXhhofBLgO7PVJ3Gbgmsmzvxv47tPsZ8ui9KMFtR5WSDPQCIQ98F0A9vss8gHgCvDaQ90t'
+        b'ICFbMr3TcZVvuV0FLgPHgIiHYygiYvmNBJB0qbMtdT4Bj4FJEcITGoB7wJrPyzmosibjafAqwMUS'
+        b'ghdTS0rG5QkzVTb4bJnx+g74G9BeDhoJoMmLANtVnqf4GghVFGrL1O8y8Bb4LNutCTgCnJOsr+zQ'
+        b'/fLZkgjuoQRLoTzLs0fqLUo73f8lcAHiwDjQVcCWq5H649K+YgVIAUMuAUjYJSAb0hyTBCbAMtCv'
+        b'8NaLqREFXjrS5hV5jsrv9Uq7fuGrGAFWgGGFsx24C3x1aRuTeu1K+2FNPoPvAqSBCSWQ6gDeARse'
+        b'OTakfoeDo1F406YLEJcXWBaHgNkiuWYVB6hLw0vRdwEmHW/7MHAbWC+Sa13ahx2nw5TpApx28LQA'
+        b'SyXyLQlPFmdMFiCm8EQ1vbmjCm9MlwC6c4H3yvOAJt4Bl36McYV/KM+dmng7XfoxRoDVHB6hDkRc'
+        b'+jFGgKYcxooO/HHpxxgBVEt8ThPvvEs/xghwCqhzPE9pcJe2hSeLOunHWD+gT4kDPpbI9wHY5+Ds'
+        b'Mz0QeuEwPGqAUUr7PmDUsVJDwm+0AAmgV1kFj4pIYtLSzjn7vcJvfDY4rXh7hyWTSxUw8xPSLotW'
+        b'4TU+G8wOYCzH0XXDQxgbExdIPerGNDlDgTlCG8BgDndnDzACPAEWyFxeLpD5BGZEflddpMECvASj'
+        b'PMFVSWfb8kR4LXkixjZpv1rJrnASeAN0F3gUnyfzDUDST1c4yKuxNPBcrO4FmdWUeP9hWeoNwEnZ'
+        b'Cpd8urkKlUsApxDfgC+S1SVlC7QDR8UC8/PKruwClBueLkerVQDPjlC8SgWIexXgVZUK4HlcPcBv'
+        b'quvzmLiM6z/sdDH5k4wnf1ajrVXupX+HzOdym4X4cN2SgPzSkIQEXdJkLlSnZeYjWFhYWFhYWFg4'
+        b'8A+HKc5w4p7KJAAAAABJRU5ErkJggg=='),
+}
+LOCALES = {
+    'de': 'Aufnahme laden\nAufnahme speichern\nAufnahme starten\nAufnahme spielen\nZu Exe-Datei kompilieren\nEinstellungen\nHilfe\nGeschwindigkeit: schnell\nunendliche Wiedergabe\nAnzahl der Wiederholungen\nSpeichertaste\nWiedergabetaste \nImmer oben\nSprache\nInfo\nAufnahme-Timer\nMaus-Abtastung\nKontrollpunkt-Taste\nAufnahme untersuchen\nFlugschreiber\nFlugschreiber-Taste\nFlugschreiber-Grenzen\nWiedergaberate der Maus\nIn separatem Prozess aufnehmen\nWiedergabeliste laden\nAufnahmeregeln\n',
+    'en': 'Load a capture file\nSave capture\nRecord capture\nPlay capture\nCompile to exe\nPreferences\nHelp\nPlay Speed: Fast\nInfinite Playback\nSet Repeat Count\nRecording Hotkey\nPlayback Hotkey\nAlways on Top\nLanguage\nAbout\nRecording Timer\nMouse Sampling\nCheckpoint Hotkey\nInspect Capture\nFlight Recorder\nFlight Recorder Hotkey\nFlight Recorder Limits\nMouse Replay Rate\nRecord In A Separate Process\nLoad Playlist\nRecording Rules\n',
+    'es': 'Cargar captura\nSalvar captura\nGrabar captura\nEjecutar captura\nCompilar exe\nPreferencias\nAyuda\nVelocidad reproducción: Rápida\nBucle Infinito\nEstablecer Contador Repetición\nTecla Grabación\nTecla Reproducción\nSiempre en Primer Plano\nLenguaje\nAcerca de\nTemporizador\nMuestreo del ratón\nTecla Punto de Control\nInspeccionar captura\nCaja negra\nTecla Caja negra\nLímites de la caja negra\nFrecuencia de reproducción del ratón\nGrabar en un proceso separado\nCargar lista de reproducción\nReglas de grabación\n',
+    'fr': "Charger un fichier capture du disque\nSauvegarder une capture\nEnregistrer\nJouer une capture\nTransformer en exécutable\nParamètres\nAide\nVitesse : rapide\nPlayback infini\nNombre de répétitions\nTouche d'enregistrement\nTouche de playback\nToujours au-dessus\nLangue\nÀ propos\nMinuterie d'enregistrement\nÉchantillonnage de la souris\nTouche de point de contrôle\nInspecter la capture\nBoîte noire\nTouche de boîte noire\nLimites de la boîte noire\nFréquence de relecture (souris)\nEnregistrer dans un processus séparé\nCharger une liste de lecture\nRègles d'enregistrement\n",
+    'it': 'Carica un file di acquisizione\nSalva acquisizione\nRegistra acquisizione \nRiproduci acquisizione\nCompiler exe\nPreferences\nAiuto\nAlta velocità\nRiproduzione infini\nRipetere il conteggio\nPulsante di registrazione\nPulsante di riproduzione\nSempre sopra\nLingua\ndi\ntimer di registrazione\ncampionamento del mouse\nPulsante di checkpoint\nIspeziona acquisizione\nscatola nera\nPulsante della scatola nera\nLimiti della scatola nera\nfrequenza di riproduzione del mouse\nRegistra in un processo separato\nCarica playlist\nRegole di registrazione\n',
+    'jp': 'キャプチャファイルをロードする\nキャプチャをファイルにセーブする\nキャプチャを開始する\nキャプチャを再生する\n実行できるようコンパイルする\n設定\nヘルプ\n再生速度\n無限に繰り返す\n繰り返し回数\n記録用のショートカットキー\n再生用のショートカットキー\n常にトップに表示する\n言語\nこのアプリについて\n記録開始までのタイマー\nマウスのサンプリング\nチェックポイント用のショートカットキー\nキャプチャを確認する\nフライトレコーダー\nフライトレコーダー用のショートカットキー\nフライトレコーダーの上限\nマウスの再生レート\n別プロセスで記録\nプレイリストを読み込む\n記録ルール\n',
+    'pl': 'Wczytaj nagranie\nZapisz nagranie\nRozpocznij nagrywanie\nOdtwórz nagranie\nSkompiluj do exe\nUstawienia\nPomoc\nPrędkość odtwarzania: szybka\nOdtwarzanie w pętli\nUstaw ilość odtworzeń\nSkrót klawiszowy nagrywania\nSkrót klawiszowy odtwarzania\nZawsze na wierzchu\nJęzyk\nO programie\nUstaw czas nagrywania\nPróbkowanie myszy\nSkrót klawiszowy punktu kontrolnego\nPrzeglądaj nagranie\nCzarna skrzynka\nSkrót klawiszowy czarnej skrzynki\nLimity czarnej skrzynki\nCzęstotliwość odtwarzania myszy\nNagrywaj w osobnym procesie\nWczytaj listę odtwarzania\nReguły nagrywania\n',
+    'tr': 'Bir yakalama dosyası yükle\nYakalamayı kaydet\nYakalama kaydı\nYakalamayı oynat\nExe için derleyin\nTercihler\nYardım\nOynatma Hızı: Hızlı\nSonsuz Oynatma\nTekrar Sayısını Ayarla\nKayıt Kısayolu\nOynatma Kısayol Tuşu\nHer zaman üstte\nDil\nhakkında\nkayıt zamanlayıcısı\nfare örnekleme\nKontrol noktası kısayolu\nYakalamayı incele\nkara kutu\nKara kutu kısayolu\nKara kutu sınırları\nfare oynatma hızı\nAyrı bir süreçte kaydet\nÇalma listesi yükle\nKayıt kuralları\n',
+}
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Rules leaving events out of a recording.
+
+The rules are a JSON file:
+
+    {"rules": [{"region": [1920, 0, 1920, 1080]},
+               {"keys": ["caps_lock", "f13"]},
+               {"buttons": ["middle"], "after": 0, "before": 5}]}
+
+An event is left out when it matches one of the rules, and it matches a
+rule when it meets all of its conditions:
+
+region -- [x, y, width, height] the pointer is in, for the mouse events
+keys -- names of the keys, a character or a pynput key name like "shift"
+buttons -- names of the mouse buttons, for the clicks
+after, before -- seconds since the start of the recording
+events -- kinds of events the rule applies to, among move, click, scroll
+          and key (default: the kinds the other conditions make sense for)
+
+The rules are compiled into one Python expression per kind of event, so
+the listener callbacks only pay for a few comparisons.
+"""
+
+import json
+import math
+import numbers
+
+
+KINDS = ("move", "click", "scroll", "key")
+# Arguments of the predicate of each kind
+_ARGUMENTS = {"move": "t, x, y", "click": "t, x, y, button", "scroll": "t, x, y", "key": "t, key"}
+_MOUSE = ("move", "click", "scroll")
+_CONDITIONS = {"region", "keys", "buttons", "after", "before", "events"}
+
+
+def _number(name, value):
+    if isinstance(value, bool) or not isinstance(value, numbers.Real) or not math.isfinite(value):
+        raise ValueError(f"{name} must be a number: {value!r}")
+    return value
+
+
+def _names(rule, name):
+    value = rule[name]
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"{name} must be a list of names: {value!r}")
+    return frozenset(item.lower() for item in value)
+
+
+def _kinds(rule):
+    """Return the kinds of events the rule applies to."""
+    if "events" in rule:
+        kinds = _names(rule, "events")
+        unknown = kinds - set(KINDS)
+        if unknown:
+            raise ValueError(f"unknown events: {', '.join(sorted(unknown))}")
+    else:
+        kinds = set(KINDS)
+    if "region" in rule:
+        kinds &= set(_MOUSE)
+    if "buttons" in rule:
+        kinds &= {"click"}
+    if "keys" in rule:
+        kinds &= {"key"}
+    return kinds
+
+
+def _terms(rule, kind, constants):
+    """Return the conditions of the rule for a kind of event, as Python expressions."""
+    terms = []
+    if "region" in rule:
+        region = rule["region"]
+        if not isinstance(region, list) or len(region) != 4:
+            raise ValueError(f"region must be [x, y, width, height]: {region!r}")
+        x, y, width, height = (_number("region", value) for value in region)
+        terms.append(f"{x!r} <= x < {x + width!r} and {y!r} <= y < {y + height!r}")
+    for name, argument in (("buttons", "button"), ("keys", "key")):
+        if name in rule:
+            constant = f"_{len(constants)}"
+            constants[constant] = _names(rule, name)
+            terms.append(f"{argument} in {constant}")
+    if "after" in rule:
+        terms.append(f"{_number('after', rule['after'])!r} <= t")
+    if "before" in rule:
+        terms.append(f"t < {_number('before', rule['before'])!r}")
+    return terms
+
+
+def compile_rules(rules):
+    """Return the predicate of each kind of event, True for the events to leave out.
+
+    The predicates take the time since the start of the recording and
+    the position of the pointer, plus the button name for the clicks,
+    or the key name for the keys.
+
+    Raise ValueError when a rule is invalid.
+    """
+    expressions = {kind: [] for kind in KINDS}
+    constants = {}
+    for rule in rules:
+        if not isinstance(rule, dict):
+            raise ValueError(f"a rule is an object: {rule!r}")
+        unknown = set(rule) - _CONDITIONS
+        if unknown:
+            raise ValueError(f"unknown conditions: {', '.join(sorted(unknown))}")
+        kinds = _kinds(rule)
+        if not kinds:
+            raise ValueError(f"the rule applies to no event: {rule!r}")
+        for kind in kinds:
+            terms = _terms(rule, kind, constants)
+            expressions[kind].append(" and ".join(f"({term})" for term in terms) or "True")
+    return {kind: eval(f"lambda {_ARGUMENTS[kind]}: {' or '.join(expressions[kind]) or 'False'}",
+                       {"__builtins__": {}, **constants})
+            for kind in KINDS}
+
+
+def load(path):
+    """Return the list of rules in the file at path.
+
+    Raise ValueError when the rules are invalid, OSError when the file
+    can't be read.
+    """
+    with open(path, encoding="utf-8") as f:
+        content = json.load(f)
+    rules = content.get("rules") if isinstance(content, dict) else None
+    if not isinstance(rules, list):
+        raise ValueError("the rules are an object with a list of rules")
+    compile_rules(rules)
+    return rules
+
+
+def key_name(key):
+    """Return the name the rules give to a pynput key, None if it has none."""
+    name = getattr(key, "char", None) or getattr(key, "name", None)
+    return name.lower() if isinstance(name, str) else None
+
+
+class Filter:
+    """Decide which events of a recording are left out, and count them.
+
+    The rules only look at the first press of a key or button, its
+    auto repeated presses and its release are kept or left out with it so
+    the replay never holds a button or a key down.
+
+    Keyword arguments:
+    rules -- the list of rules, like the ones returned by load
+    """
+
+    def __init__(self, rules=()):
+        self.rules = list(rules)
+        predicates = compile_rules(self.rules)
+        self._move = predicates["move"]
+        self._click = predicates["click"]
+        self._scroll = predicates["scroll"]
+        self._key = predicates["key"]
+        self.start = 0.0
+        self.filtered = dict.fromkeys(KINDS, 0)
+        # Whether the held buttons and keys are left out, by (kind, name)
+        self._held = {}
+
+    def reset(self, start):
+        """Start a new recording at the time start, the counters back to 0."""
+        self.start = start
+        self.filtered = dict.fromkeys(KINDS, 0)
+        self._held = {}
+
+    def _pair(self, kind, name, pressed, predicate, *arguments):
+        # The rules are only asked about the first press of a key, its
+        # repeated presses and its release follow the same decision
+        key = (kind, name)
+        if not pressed:
+            left_out = self._held.pop(key, False)
+        else:
+            left_out = self._held.get(key)
+            if left_out is None:
+                left_out = self._held[key] = bool(predicate(*arguments))
+        if left_out:
+            self.filtered[kind] += 1
+        return left_out
+
+    @property
+    def total(self):
+        """Number of events left out since the last reset."""
+        return sum(self.filtered.values())
+
+    def move(self, t, x, y):
+        """Return True if the move is left out."""
+        if self._move(t - self.start, x, y):
+            self.filtered["move"] += 1
+            return True
+        return False
+
+    def click(self, t, x, y, button, pressed):
+        """Return True if the press or release of the pynput button is left out."""
+        name = getattr(button, "name", None)
+        return self._pair("click", name, pressed, self._click, t - self.start, x, y, name)
+
+    def scroll(self, t, x, y):
+        """Return True if the scroll is left out."""
+        if self._scroll(t - self.start, x, y):
+            self.filtered["scroll"] += 1
+            return True
+        return False
+
+    def key(self, t, key, pressed):
+        """Return True if the press or release of the pynput key is left out."""
+        name = key_name(key)
+        return self._pair("key", name, pressed, self._key, t - self.start, name)
@@ -0,0 +1,195 @@
+"""Decimation of the mouse moves delivered by the OS."""
+
+# atbswp: Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import math
+import re
+
+import numpy
+
+import capture
+
+
+# Pointer speed (pixels per second) at which the sampling rate doubles
+REFERENCE_SPEED = 1000.0
+# Rates offered for the replay of the mouse moves, in moves per second
+REPLAY_RATES = (60, 120, 240)
+
+MOVE = re.compile(r"^pyautogui\.moveTo\((-?\d+), (-?\d+)\)$")
+SLEEP = "time.sleep("
+
+
+class MouseDecimator:
+    """Drop the redundant mouse moves before they are recorded.
+
+    A move is kept when the pointer traveled at least `min_distance` pixels
+    and `1 / max_rate` seconds elapsed since the last kept move. The rate
+    grows with the pointer speed, up to `max_boost` times, so fast flicks
+    keep more samples than slow drags.
+
+    The last dropped move is held back, `flush` returns it so the position
+    of the pointer is exact before a click, a key or the end of the capture.
+
+    Keyword arguments:
+    max_rate -- maximum number of moves kept per second, 0 for no limit
+    min_distance -- minimum distance in pixels from the last kept move
+    max_boost -- maximum factor applied to max_rate for fast moves
+    """
+
+    def __init__(self, max_rate=60, min_distance=3, max_boost=4.0):
+        """Set the thresholds."""
+        self.interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self.min_distance2 = min_distance * min_distance
+        self.max_boost = max_boost
+        self.reset()
+
+    def reset(self):
+        """Forget the previous moves and the counters."""
+        self.kept = 0
+        self.dropped = 0
+        self._time = -math.inf
+        self._x = self._y = None
+        self._pending = None
+
+    def accept(self, t, x, y):
+        """Return True if the move to (x, y) at time t must be recorded."""
+        if self._x is None:
+            return self._keep(t, x, y)
+        dx = x - self._x
+        dy = y - self._y
+        distance2 = dx * dx + dy * dy
+        elapsed = t - self._time
+        if distance2 >= self.min_distance2:
+            if elapsed >= self.interval:
+                return self._keep(t, x, y)
+            if elapsed > 0.0:
+                speed = math.sqrt(distance2) / elapsed
+                boost = min(self.max_boost, 1.0 + speed / REFERENCE_SPEED)
+                if elapsed * boost >= self.interval:
+                    return self._keep(t, x, y)
+        self.dropped += 1
+        self._pending = (t, x, y)
+        return False
+
+    def _keep(self, t, x, y):
+        self._time, self._x, self._y = t, x, y
+        self._pending = None
+        self.kept += 1
+        return True
+
+    def flush(self):
+        """Return the held back move as (t, x, y), or None."""
+        pending = self._pending
+        if pending is not None:
+            self.dropped -= 1
+            self._keep(*pending)
+        return pending
+
+
+def decimate(events, decimator):
+    """Return a copy of an EventBuffer with the moves the decimator drops removed.
+
+    The held back move is flushed before every other event, like the
+    recorder does, so the clicks and keys still happen at the same place.
+
+    Keyword arguments:
+    events -- the capture.EventBuffer to decimate
+    decimator -- the MouseDecimator deciding which moves are kept
+    """
+    decimated = capture.EventBuffer(events.start)
+    # The checkpoints are all kept, their blobs keep their codes
+    decimated.blobs = list(events.blobs)
+    decimator.reset()
+    for time, kind, x, y, code, flags in events:
+        if kind == capture.MOVE:
+            if decimator.accept(time, x, y):
+                decimated.append(time, kind, x, y)
+            continue
+        pending = decimator.flush()
+        if pending is not None:
+            decimated.append(pending[0], capture.MOVE, pending[1], pending[2])
+        decimated.append(time, kind, x, y, code, flags)
+    pending = decimator.flush()
+    if pending is not None:
+        decimated.append(pending[0], capture.MOVE, pending[1], pending[2])
+    return decimated
+
+
+def resample(lines, rate):
+    """Return the lines of a capture with its mouse paths replayed at a fixed rate.
+
+    Each run of moveTo separated only by sleeps becomes a path of the
+    pointer in time, which is interpolated `rate` times per second between
+    its first and its last move. The moves of the path don't make the
+    pause pyautogui adds after each call, so they follow the recorded
+    timing, and the rest of the capture is left as it is.
+
+    Keyword arguments:
+    lines -- the lines of the capture
+    rate -- number of moves per second
+    """
+    resampled = []
+    run = []  # (time, x, y, line) of the moves of the current run
+    tail = []  # sleeps following the last move of the run
+    now = 0.0
+    for line in lines:
+        stripped = line.strip()
+        # A delay which isn't a literal ends the run like any other line
+        delay = capture.parse_delay(stripped) if run and stripped.startswith(SLEEP) else None
+        if delay is not None:
+            tail.append(line)
+            now += delay
+            continue
+        match = MOVE.match(stripped) if line.startswith("pyautogui.moveTo(") else None
+        if match is not None:
+            run.append((now, int(match.group(1)), int(match.group(2)), line))
+            tail = []
+            continue
+        if run:
+            resampled.extend(_path(run, rate))
+            resampled.extend(tail)
+            run, tail, now = [], [], 0.0
+        resampled.append(line)
+    resampled.extend(_path(run, rate))
+    resampled.extend(tail)
+    return resampled
+
+
+def _path(run, rate):
+    """Return the lines replaying a run of moves at a fixed rate."""
+    if len(run) < 2:
+        return [move[3] for move in run]
+    times, xs, ys, _ = zip(*run)
+    times = numpy.array(times)
+    samples = numpy.append(numpy.arange(times[0], times[-1], 1.0 / rate), times[-1])
+    x = numpy.rint(numpy.interp(samples, times, xs)).astype(int).tolist()
+    y = numpy.rint(numpy.interp(samples, times, ys)).astype(int).tolist()
+    lines = []
+    last = None
+    previous = samples[0]
+    for t, position in zip(samples.tolist(), zip(x, y)):
+        if position == last:
+            continue
+        if t > previous:
+            lines.append(f"time.sleep({t - previous})\n")
+        previous = t
+        lines.append(f"pyautogui.moveTo({position[0]}, {position[1]}, _pause=False)\n")
+        last = position
+    if samples[-1] > previous:
+        # The pointer stood still at the end, the path still lasts as long
+        lines.append(f"time.sleep({samples[-1] - previous})\n")
+    return lines
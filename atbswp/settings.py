@@ -18,15 +18,23 @@
 # Handle the config file of the program
 
 import configparser
+import io
 import os
 import platform
+import tempfile
+import threading
 from datetime import date
 
 
-CONFIG = configparser.ConfigParser()
 VERSION = "0.3.1"
 YEAR = date.today().strftime("%Y")
 
+# Bump when an option is renamed or changes meaning, and register the
+# conversion in MIGRATIONS
+CONFIG_VERSION = 2
+# Seconds to wait after the last change before writing the config file
+SAVE_DELAY = 1.0
+
 
 # Check the location of the configuration file, default to the home directory
 filename = "atbswp.cfg"
@@ -40,23 +48,217 @@ else:
 config_location = os.path.join(config_location, filename)
 
 
+def atomic_write(path, text, encoding="utf-8"):
+    """Replace the content of path without ever leaving it half written.
+
+    The text goes to a temporary file in the same directory which is then
+    renamed over path, readers see either the old or the new content.
+
+    Keyword arguments:
+    path -- the file replaced
+    text -- its new content
+    encoding -- of the file, None for the one of the locale (default utf-8,
+                the encoding the captures are read in)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".atbswp-")
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def to_bool(value):
+    """Convert the usual config file spellings of a boolean."""
+    if isinstance(value, bool):
+        return value
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[str(value).strip().lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value!r}")
+
+
+class Option:
+    """A typed entry of the DEFAULT section of the config file.
+
+    Keyword arguments:
+    key -- the name of the entry in the config file
+    kind -- bool, int, float or str
+    default -- value used when the entry is missing or invalid
+    """
+
+    def __init__(self, key, kind, default):
+        self.key = key
+        self.kind = kind
+        self.default = default
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj._values[self.name]
+
+    def __set__(self, obj, value):
+        obj.set(self.name, value)
+
+    def parse(self, value):
+        """Convert a raw value, raise ValueError if it doesn't fit."""
+        if self.kind is bool:
+            return to_bool(value)
+        return self.kind(value)
+
+
+def _replace_mouse_speed(section):
+    """Mouse Speed was a per axis threshold, it becomes the minimum distance."""
+    old_value = section.pop("Mouse Speed", None)
+    # Keep the threshold only if the user changed the former default
+    if old_value is not None and old_value.strip() != "21":
+        section["Mouse Min Distance"] = old_value
+
+
+# Migrations indexed by the version they bring the file to, each one
+# receives the raw DEFAULT section of a file written by an older version
+MIGRATIONS = {
+    2: _replace_mouse_speed,
+}
+
+
+class Settings:
+    """In-memory, typed view of the config file.
+
+    Values are parsed once when the file is loaded so reading an option is
+    a plain attribute access. Every change notifies the subscribers of the
+    option and schedules a debounced, atomic write of the whole file.
+    """
+
+    fast_play_speed = Option("Fast Play Speed", bool, False)
+    infinite_playback = Option("Infinite Playback", bool, False)
+    repeat_count = Option("Repeat Count", int, 1)
+    recording_hotkey = Option("Recording Hotkey", int, 348)
+    playback_hotkey = Option("Playback Hotkey", int, 349)
+    checkpoint_hotkey = Option("Checkpoint Hotkey", int, 347)
+    always_on_top = Option("Always On Top", bool, True)
+    language = Option("Language", str, "en")
+    recording_timer = Option("Recording Timer", int, 0)
+    mouse_max_rate = Option("Mouse Max Rate", int, 60)
+    mouse_min_distance = Option("Mouse Min Distance", int, 3)
+    # JSON file of the rules leaving events out of the recordings, none when empty
+    recording_rules = Option("Recording Rules", str, "")
+    # Record with the listeners of a separate process, away from the GIL of the GUI
+    capture_process = Option("Capture Process", bool, False)
+    # Moves per second of the replayed mouse paths, 0 to replay them as recorded
+    replay_mouse_rate = Option("Replay Mouse Rate", int, 0)
+    flight_recorder = Option("Flight Recorder", bool, False)
+    flight_recorder_minutes = Option("Flight Recorder Minutes", int, 5)
+    flight_recorder_events = Option("Flight Recorder Events", int, 100000)
+    flight_recorder_hotkey = Option("Flight Recorder Hotkey", int, 346)
+    # Where the flight recorder writes, the temporary directory when empty
+    flight_recorder_directory = Option("Flight Recorder Directory", str, "")
+    config_version = Option("Config Version", int, CONFIG_VERSION)
+
+    def __init__(self, path, delay=SAVE_DELAY):
+        """Load the settings stored at path."""
+        self.path = path
+        self.delay = delay
+        self._options = self.options()
+        self._values = {}
+        self._subscribers = {}
+        self._lock = threading.Lock()
+        self._timer = None
+        self.load()
+
+    @classmethod
+    def options(cls):
+        """Return the options declared on the class, by attribute name."""
+        return {name: value for name, value in vars(cls).items()
+                if isinstance(value, Option)}
+
+    def load(self):
+        """Read the file, migrate it and fall back to defaults when needed."""
+        parser = configparser.ConfigParser()
+        try:
+            parser.read(self.path)
+        except configparser.Error:
+            # Unreadable file, start over from the defaults
+            parser = configparser.ConfigParser()
+        section = parser["DEFAULT"]
+
+        try:
+            version = int(section.get("Config Version", 0))
+        except ValueError:
+            version = 0
+        for target in sorted(MIGRATIONS):
+            if version < target:
+                MIGRATIONS[target](section)
+
+        for name, option in self._options.items():
+            try:
+                self._values[name] = option.parse(section[option.key])
+            except (KeyError, ValueError):
+                self._values[name] = option.default
+        self._values["config_version"] = CONFIG_VERSION
+
+    def get(self, name):
+        """Return the current value of the option called name."""
+        return self._values[name]
+
+    def set(self, name, value):
+        """Change an option, notify its subscribers and schedule a save."""
+        value = self._options[name].parse(value)
+        if self._values[name] == value:
+            return
+        self._values[name] = value
+        for callback in list(self._subscribers.get(name, ())):
+            callback(value)
+        self.schedule_save()
+
+    def subscribe(self, name, callback):
+        """Call callback with the new value each time the option changes."""
+        self._subscribers.setdefault(name, []).append(callback)
+
+    def unsubscribe(self, name, callback):
+        """Stop notifying callback about the option."""
+        self._subscribers.get(name, []).remove(callback)
+
+    def schedule_save(self):
+        """Save once no change happened for `delay` seconds."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.save)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def save(self):
+        """Write every option to disk right away."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            parser = configparser.ConfigParser()
+            for name, option in self._options.items():
+                parser["DEFAULT"][option.key] = str(self._values[name])
+            content = io.StringIO()
+            parser.write(content)
+            # configparser reads the file in the encoding of the locale
+            atomic_write(self.path, content.getvalue(), encoding=None)
+
+
+CONFIG = Settings(config_location)
+
+
 def save_config():
-    with open(config_location, "w") as config_file:
-        CONFIG.write(config_file)
-
-
-try:
-    with open(config_location) as config_file:
-        CONFIG.read(config_location)
-except:
-    CONFIG["DEFAULT"] = {
-        "Fast Play Speed": False,
-        "Infinite Playback": False,
-        "Repeat Count": 1,
-        "Recording Hotkey": 348,
-        "Playback Hotkey": 349,
-        "Always On Top": True,
-        "Language": "en",
-        "Recording Timer": 0,
-        "Mouse Speed": 21,
-    }
+    """Flush the pending changes, used before exiting."""
+    CONFIG.save()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# Record mouse and keyboard actions and reproduce them identically at will
+#
+# Copyright (C) 2019 Paul Mairo <github@rmpr.xyz>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Endurance test of the infinite playback.
+
+Usage: python soak.py [--iterations N] [--sample-every K] [--mouse-rate HZ] [CAPTURE]
+
+The capture, a generated one by default, is replayed in infinite mode by
+the same Player and ProgramCache as the play button, against the virtual
+backend so no display is needed. The reports of the player go through a
+queue read by the main thread, like the events posted to the GUI.
+
+Every K iterations the resident memory, the number of threads and of open
+file descriptors and the time of an iteration are sampled. After a warmup,
+a line is fitted through each of them and the test fails when the growth
+it predicts over the run goes beyond the thresholds.
+"""
+
+import argparse
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+from collections import namedtuple
+
+import numpy
+
+import capture
+import replay
+
+
+ITERATIONS = 20000
+SAMPLE_EVERY = 500
+# Fraction of the samples ignored while the caches fill up
+WARMUP = 0.2
+# Maximum growth over the run, after the warmup
+MAX_RSS_GROWTH = 8 * 1024 * 1024
+MAX_THREAD_GROWTH = 0.5
+MAX_FD_GROWTH = 0.5
+# Relative to the time of an iteration at the end of the warmup
+MAX_TIME_GROWTH = 0.25
+
+Sample = namedtuple("Sample", "iteration rss threads fds seconds")
+
+
+def resident_memory():
+    """Return the resident memory of the process in bytes, None if unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def open_files():
+    """Return the number of open file descriptors, None if unknown."""
+    for directory in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(directory))
+        except OSError:
+            continue
+    return None
+
+
+def virtual_play(program, stop):
+    """Replay against the virtual backend, the stand-in of replay.play."""
+    replay.dry_run(program)
+    return True
+
+
+def generate_capture(path, events=200):
+    """Write a capture of clicks, moves and keys at path."""
+    buffer = capture.EventBuffer(start=0.0)
+    for i in range(events // 4):
+        now = i * 0.05
+        buffer.append(now, capture.MOVE, i % 800, i % 600)
+        buffer.append(now + 0.01, capture.MOUSE_DOWN, i % 800, i % 600, 0)
+        buffer.append(now + 0.02, capture.MOUSE_UP, i % 800, i % 600, 0)
+        buffer.append(now + 0.03, capture.KEY_DOWN, code=ord("a") + i % 26)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(capture.serialize(buffer, "import pyautogui\nimport time\npyautogui.FAILSAFE = False"))
+    return path
+
+
+def soak(path, iterations=ITERATIONS, sample_every=SAMPLE_EVERY, mouse_rate=0, play=virtual_play):
+    """Replay the capture at path in a loop, return the list of Sample.
+
+    Keyword arguments:
+    path -- the capture replayed
+    iterations -- number of replays before ending the infinite playback
+    sample_every -- number of replays between two samples
+    mouse_rate -- replay the mouse paths at this rate, 0 to keep them as recorded
+    play -- makes one replay, like replay.play
+    """
+    cache = replay.ProgramCache()
+    player = replay.Player(play)
+    reports = queue.Queue()
+    samples = []
+    player.start(lambda: cache.load(path, mouse_rate), 0, True,
+                 lambda remaining, playing, error: reports.put(error))
+    try:
+        done = 0
+        window = time.perf_counter()
+        while done < iterations:
+            error = reports.get()
+            if error is not None:
+                raise error
+            done += 1
+            if done % sample_every == 0:
+                now = time.perf_counter()
+                samples.append(Sample(done, resident_memory(), threading.active_count(), open_files(),
+                                      (now - window) / sample_every))
+                window = now
+    finally:
+        player.end()
+        player.close()
+    return samples
+
+
+def trends(samples, warmup=WARMUP):
+    """Return the growth of every measure over the samples after the warmup.
+
+    The growth is the slope of the line fitted through the samples times
+    the number of iterations they span, the measures which couldn't be
+    taken are left out. Return (value at the start of the line, growth)
+    by measure.
+    """
+    kept = samples[int(len(samples) * warmup):]
+    if len(kept) < 3:
+        return {}
+    iterations = numpy.array([sample.iteration for sample in kept], dtype=numpy.float64)
+    span = iterations[-1] - iterations[0]
+    found = {}
+    for name in Sample._fields[1:]:
+        values = [getattr(sample, name) for sample in kept]
+        if None in values:
+            continue
+        slope, intercept = numpy.polyfit(iterations, numpy.array(values, dtype=numpy.float64), 1)
+        found[name] = (float(intercept + slope * iterations[0]), float(slope * span))
+    return found
+
+
+def failures(found, max_rss_growth=MAX_RSS_GROWTH, max_thread_growth=MAX_THREAD_GROWTH,
+             max_fd_growth=MAX_FD_GROWTH, max_time_growth=MAX_TIME_GROWTH):
+    """Return a message for each measure growing beyond its threshold."""
+    limits = {"rss": max_rss_growth, "threads": max_thread_growth, "fds": max_fd_growth}
+    if "seconds" in found:
+        limits["seconds"] = max_time_growth * found["seconds"][0]
+    return [f"{name} grows by {found[name][1]:g} over the run (limit {limit:g})"
+            for name, limit in limits.items() if name in found and found[name][1] > limit]
+
+
+def report(samples, found, out=sys.stdout):
+    """Print the samples and the trends."""
+    print(f"{'iteration':>10}{'rss (MiB)':>12}{'threads':>9}{'fds':>6}{'us/iter':>10}", file=out)
+    for sample in samples:
+        rss = f"{sample.rss / 2 ** 20:.1f}" if sample.rss is not None else "-"
+        fds = sample.fds if sample.fds is not None else "-"
+        print(f"{sample.iteration:>10}{rss:>12}{sample.threads:>9}{fds:>6}{sample.seconds * 1e6:>10.1f}", file=out)
+    for name, (start, growth) in found.items():
+        print(f"{name}: {start:g}, trend {growth:+g} over the run", file=out)
+
+
+def main(argv=None):
+    """Soak the capture given on the command line, exit with 1 when something grows."""
+    parser = argparse.ArgumentParser(description="Endurance test of the infinite playback.")
+    parser.add_argument("path", nargs="?", metavar="CAPTURE", help="the capture replayed (default: a generated one)")
+    parser.add_argument("-n", "--iterations", type=int, default=ITERATIONS, help="number of replays")
+    parser.add_argument("--sample-every", type=int, default=SAMPLE_EVERY, metavar="K",
+                        help="number of replays between two samples")
+    parser.add_argument("--mouse-rate", type=int, default=0, metavar="HZ",
+                        help="replay the mouse paths at this fixed rate (default: as recorded)")
+    parser.add_argument("--max-rss-growth", type=float, default=MAX_RSS_GROWTH / 2 ** 20, metavar="MIB")
+    parser.add_argument("--max-thread-growth", type=float, default=MAX_THREAD_GROWTH, metavar="N")
+    parser.add_argument("--max-fd-growth", type=float, default=MAX_FD_GROWTH, metavar="N")
+    parser.add_argument("--max-time-growth", type=float, default=MAX_TIME_GROWTH, metavar="FRACTION")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.path or generate_capture(os.path.join(directory, "capture.py"))
+        samples = soak(path, args.iterations, args.sample_every, args.mouse_rate)
+    found = trends(samples)
+    report(samples, found)
+    failed = failures(found, args.max_rss_growth * 2 ** 20, args.max_thread_growth,
+                      args.max_fd_growth, args.max_time_growth)
+    for message in failed:
+        print(f"FAILED: {message}", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import analyze
+
+import capture
+
+
+def write_capture(path):
+    events = capture.EventBuffer(start=0.0)
+    events.append(0.5, capture.MOVE, 0, 0)
+    events.append(0.5, capture.MOUSE_DOWN, 30, 40, 0)
+    events.append(2.5, capture.MOUSE_UP, 30, 40, 0)
+    events.append(2.5, capture.KEY_DOWN, code=ord("a"))
+    path.write_text(capture.serialize(events, "import pyautogui\nimport time\n"))
+
+
+def test_analyze_one_capture(tmp_path):
+    write_capture(tmp_path / "capture.py")
+    result = analyze.analyze(str(tmp_path / "capture.py"))
+    assert result["events"] == 4
+    assert result["recorded_duration"] == 2.5
+    assert result["estimated_replay_duration"] == 2.5 + 4 * analyze.PYAUTOGUI_PAUSE
+    assert result["mouse_distance"] == 50.0
+    assert result["idle_time"] == 2.0
+    assert result["clicks"] == 1
+    assert result["click_heatmap"] == [[1]]
+
+
+def test_merge_a_directory(tmp_path):
+    for name in ("a.py", "b.py"):
+        write_capture(tmp_path / name)
+    (tmp_path / "notes.txt").write_text("not a capture")
+    paths = analyze.find_captures([str(tmp_path)])
+    assert len(paths) == 2
+    total = analyze.merge([analyze.analyze(path) for path in paths])
+    assert total["files"] == 2
+    assert total["events"] == 8
+    assert total["click_heatmap"] == [[2]]
+    assert sum(total["gap_histogram"]) == 8
+
+
+def test_malformed_capture_is_reported(tmp_path, capsys):
+    write_capture(tmp_path / "a.py")
+    (tmp_path / "b.py").write_text("import pyautogui\npyautogui.moveTo(100, 200, duration=0.5)\n")
+    analyze.main([str(tmp_path), "--jobs", "1", "--json", "-"])
+    out, err = capsys.readouterr()
+    assert "b.py: ValueError: line 2:" in err
+    assert '"files": 1' in out
+
+
+def test_heatmap_of_negative_coordinates(tmp_path):
+    events = capture.EventBuffer(start=0.0)
+    events.append(0.5, capture.MOUSE_DOWN, -1900, -10, 0)
+    events.append(0.6, capture.MOUSE_DOWN, -1900, -10, 0)
+    (tmp_path / "left.py").write_text(capture.serialize(events, "import pyautogui\nimport time\n"))
+    result = analyze.analyze(str(tmp_path / "left.py"))
+    assert result["click_heatmap"] == [[2]]
+    assert result["click_heatmap_origin"] == [-1920, -64]
+
+    events.append(0.7, capture.MOUSE_DOWN, 70, 10, 0)
+    (tmp_path / "both.py").write_text(capture.serialize(events, "import pyautogui\nimport time\n"))
+    result = analyze.analyze(str(tmp_path / "both.py"))
+    assert result["click_heatmap_origin"] == [-1920, -64]
+    assert len(result["click_heatmap"]) == 2
+    assert result["click_heatmap"][0][0] == 2
+    assert result["click_heatmap"][1][31] == 1
+
+    write_capture(tmp_path / "primary.py")
+    total = analyze.merge([analyze.analyze(str(tmp_path / name)) for name in ("left.py", "primary.py")])
+    assert total["click_heatmap_origin"] == [-1920, -64]
+    assert total["click_heatmap"][0][0] == 2
+    assert total["click_heatmap"][1][30] == 1
+    assert sum(map(sum, total["click_heatmap"])) == 3
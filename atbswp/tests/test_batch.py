@@ -0,0 +1,109 @@
+import io
+import json
+
+import pytest
+
+import batch
+
+import capture
+
+import replay
+
+
+HEADER = "#!/bin/env python3\nimport pyautogui\nimport time\npyautogui.FAILSAFE = False\n"
+OPTIONS = batch.Options(max_rate=60, min_distance=3, time_tolerance=0.01, position_tolerance=0)
+
+
+def write_capture(path, repetitions=10):
+    events = capture.EventBuffer(start=0.0)
+    now = 0.0
+    for _ in range(repetitions):
+        for i in range(100):
+            now += 0.001
+            events.append(now, capture.MOVE, i * 4, i * 2)
+        events.append(now, capture.MOUSE_DOWN, 400, 200, 0)
+        now += 0.05
+        events.append(now, capture.MOUSE_UP, 400, 200, 0)
+        events.append(now, capture.KEY_DOWN, code=ord("x"))
+        events.append(now, capture.KEY_UP, code=ord("x"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(capture.serialize(events, HEADER))
+    return path
+
+
+def timeline(path):
+    return replay.dry_run(replay.compile_capture(path.read_text().splitlines(True)))
+
+
+def test_convert_in_place(tmp_path):
+    path = write_capture(tmp_path / "capture.py")
+    before, replay_before = timeline(path)
+    entry = batch.convert(str(path), str(path), None, OPTIONS)
+    assert entry["status"] == "converted"
+    assert entry["loops"] == 1
+    assert entry["bytes_after"] == path.stat().st_size < entry["bytes_before"]
+    assert entry["moves_after"] < entry["moves_before"] == 1000
+
+    after, replay_after = timeline(path)
+    assert batch.actions(after) == batch.actions(before)
+    assert replay_after == pytest.approx(entry["replay_after"])
+    assert replay_after < replay_before == pytest.approx(entry["replay_before"])
+    assert path.read_text().startswith(HEADER)
+
+    # The converted file is recognized, and so is the original
+    assert batch.convert(str(path), str(path), entry, OPTIONS)["skipped"]
+    assert not batch.convert(str(path), str(path), entry, OPTIONS._replace(max_rate=30))["skipped"]
+
+
+def test_unsupported_capture_is_left_alone(tmp_path):
+    path = tmp_path / "capture.py"
+    path.write_text("import pyautogui\npyautogui.hotkey('ctrl', 'c')\n")
+    entry = batch.convert(str(path), str(path), None, OPTIONS)
+    assert entry["status"] == "failed"
+    assert "pyautogui.hotkey" in entry["error"]
+    assert path.read_text() == "import pyautogui\npyautogui.hotkey('ctrl', 'c')\n"
+
+
+def test_batch_resumes_from_the_manifest(tmp_path):
+    library = tmp_path / "library"
+    write_capture(library / "a.py")
+    write_capture(library / "nested" / "b.py", repetitions=5)
+    (library / "notes.txt").write_text("not a capture")
+    output = tmp_path / "optimized"
+    files = batch.targets([str(library)], str(output))
+    assert sorted(output for _, output in files) == [str(output / "a.py"), str(output / "nested" / "b.py")]
+
+    manifest = str(output / batch.MANIFEST)
+    done = batch.run(files, manifest, OPTIONS, jobs=2)
+    assert [entry["status"] for entry in done.values()] == ["converted", "converted"]
+    assert set(json.loads((output / batch.MANIFEST).read_text())["captures"]) == {source for source, _ in files}
+
+    skipped = []
+    batch.run(files, manifest, OPTIONS, progress=lambda source, entry: skipped.append(entry["skipped"]))
+    assert skipped == [True, True]
+
+    write_capture(library / "a.py", repetitions=3)
+    skipped = []
+    batch.run(files, manifest, OPTIONS, progress=lambda source, entry: skipped.append(entry["skipped"]))
+    assert sorted(skipped) == [False, True]
+
+    out = io.StringIO()
+    batch.summary(list(done.values()), 0, 1.0, out)
+    assert out.getvalue().startswith("2 converted (0 unchanged since the last run), 0 failed")
+
+
+def test_malformed_capture_fails_alone(tmp_path):
+    library = tmp_path / "library"
+    write_capture(library / "a.py")
+    malformed = library / "b.py"
+    malformed.write_text(HEADER + "pyautogui.moveTo(100, 200, duration=0.5)\n")
+    output = tmp_path / "optimized"
+    files = batch.targets([str(library)], str(output))
+    manifest = str(output / batch.MANIFEST)
+    done = batch.run(files, manifest, OPTIONS, jobs=2)
+    assert done[str(library / "a.py")]["status"] == "converted"
+    entry = done[str(malformed)]
+    assert entry["status"] == "failed"
+    assert entry["error"].startswith("line 5: ")
+    assert set(json.loads((output / batch.MANIFEST).read_text())["captures"]) == {source for source, _ in files}
+    assert not (output / "b.py").exists()
@@ -0,0 +1,237 @@
+import pytest
+
+import capture
+
+
+def test_buffer_grows_in_chunks_and_truncates():
+    buffer = capture.EventBuffer(chunk_size=4)
+    for i in range(10):
+        buffer.append(float(i), capture.MOVE, i, -i)
+    assert len(buffer) == 10
+    assert list(buffer.column("x")) == list(range(10))
+    buffer.truncate(8)
+    buffer.append(42.0, capture.KEY_DOWN, code=ord("a"))
+    assert len(buffer) == 9
+    assert list(buffer)[-1] == (42.0, capture.KEY_DOWN, 0, 0, ord("a"), 0)
+    buffer.truncate(0)
+    assert list(buffer) == []
+
+
+def test_serialize_replays_the_events():
+    buffer = capture.EventBuffer(start=1.0)
+    buffer.append(1.5, capture.MOVE, 10, 20)
+    buffer.append(1.5, capture.MOUSE_DOWN, 10, 20, 0)
+    buffer.append(2.0, capture.KEY_DOWN, code=ord("a"))
+    buffer.append(2.0, capture.KEY_DOWN, code=ord("a"))
+    buffer.append(2.0, capture.KEY_UP, code=capture.KEY_NAMES.index("enter"),
+                  flags=capture.SPECIAL_KEY)
+    buffer.append(2.0, capture.SCROLL, 10, 20, -3)
+    assert capture.serialize(buffer, "HEADER").splitlines() == [
+        "HEADER",
+        "time.sleep(0.5)",
+        "pyautogui.moveTo(10, 20)",
+        "pyautogui.mouseDown(10, 20, 'left')",
+        "time.sleep(0.5)",
+        "pyautogui.keyDown('a')",
+        "pyautogui.press('a')",
+        "pyautogui.keyUp('enter')",
+        "pyautogui.scroll(-3)",
+    ]
+
+
+def test_virtual_keys_are_written_as_comments(tmp_path):
+    buffer = capture.EventBuffer(start=0.0)
+    buffer.append(0.5, capture.KEY_DOWN, code=173, flags=capture.VIRTUAL_KEY)
+    buffer.append(0.5, capture.KEY_DOWN, code=173, flags=capture.VIRTUAL_KEY)
+    buffer.append(0.5, capture.KEY_UP, code=173, flags=capture.VIRTUAL_KEY)
+    program = capture.serialize(buffer, "import pyautogui")
+    assert program.splitlines()[2:] == [
+        f"{capture.UNSUPPORTED_KEY_NAME}: virtual key 173 pressed",
+        f"{capture.UNSUPPORTED_KEY_NAME}: virtual key 173 pressed",
+        f"{capture.UNSUPPORTED_KEY_NAME}: virtual key 173 released",
+    ]
+    path = tmp_path / "capture.py"
+    path.write_text(program)
+    assert len(capture.load(str(path))) == 0
+
+
+def test_checkpoint_replaces_the_recorded_delay():
+    buffer = capture.EventBuffer(start=0.0)
+    code = buffer.add_blob(((0, 0, 64, 64), "AAAA"))
+    buffer.append(30.0, capture.CHECKPOINT, 0, 0, code)
+    buffer.append(30.5, capture.MOUSE_DOWN, 5, 5, 1)
+    assert capture.serialize(buffer, "HEADER").splitlines() == [
+        "HEADER",
+        *capture.CHECKPOINT_IMPORT.splitlines(),
+        "checkpoint.wait_for((0, 0, 64, 64), 'AAAA')",
+        "time.sleep(0.5)",
+        "pyautogui.mouseDown(5, 5, 'right')",
+    ]
+
+
+def test_checkpoints_replay_without_atbswp(tmp_path):
+    import builtins
+    import time
+
+    class Screenshot:
+        def convert(self, mode):
+            return self
+
+        def resize(self, size, resample):
+            return self
+
+        def tobytes(self):
+            return bytes(256)
+
+    class Pyautogui:
+        regions = []
+
+        def screenshot(self, region):
+            self.regions.append(region)
+            return Screenshot()
+
+        def mouseDown(self, x, y, button):
+            pass
+
+    def import_module(name, *args):
+        if name == "checkpoint":
+            raise ImportError(name)
+        return {"pyautogui": Pyautogui(), "time": time}.get(name) or builtins.__import__(name, *args)
+
+    buffer = capture.EventBuffer(start=0.0)
+    code = buffer.add_blob(((0, 0, 64, 64), "A" * 344))
+    buffer.append(0.0, capture.CHECKPOINT, 0, 0, code)
+    buffer.append(0.5, capture.MOUSE_DOWN, 5, 5, 1)
+    program = capture.serialize(buffer, "import pyautogui\nimport time")
+    namespace = {"__builtins__": dict(vars(builtins), __import__=import_module)}
+    exec(compile(program.replace("time.sleep(0.5)", "pass"), "capture.py", "exec"), namespace)
+    assert Pyautogui.regions == [(0, 0, 64, 64)]
+
+    path = tmp_path / "capture.py"
+    path.write_text(program)
+    assert list(capture.load(str(path))) == list(buffer)
+    index = capture.CaptureIndex(str(path))
+    assert len(index) == 2
+    assert index.row(0)[1] == "checkpoint.wait_for"
+    index.close()
+
+
+def test_captures_without_checkpoints_import_nothing():
+    buffer = capture.EventBuffer(start=0.0)
+    buffer.add_blob(((0, 0, 64, 64), "AAAA"))
+    buffer.append(0.5, capture.MOVE, 5, 5)
+    assert "checkpoint" not in capture.serialize(buffer, "HEADER")
+
+
+def test_index_reads_rows_on_demand(tmp_path):
+    path = tmp_path / "capture.py"
+    path.write_text("import pyautogui\n"
+                    "import time\n"
+                    "pyautogui.FAILSAFE = False\n"
+                    "time.sleep(0.5)\n"
+                    "pyautogui.moveTo(10, 20)\n"
+                    "pyautogui.mouseDown(10, 20, 'left')\n"
+                    "time.sleep(1.5)\n"
+                    "pyautogui.keyDown('a')\n")
+    index = capture.CaptureIndex(str(path))
+    assert len(index) == 3
+    assert index.duration == 2.0
+    assert index.row(1) == (0.5, "pyautogui.mouseDown", (10, 20, "left"))
+    assert index.row(2) == (2.0, "pyautogui.keyDown", ("a",))
+    assert index.find(1.0) == 1
+    assert index.find(0.0) == 0
+    index.close()
+
+
+def test_load_reads_back_what_serialize_wrote(tmp_path):
+    buffer = capture.EventBuffer(start=0.0)
+    buffer.append(0.25, capture.MOVE, 10, 20)
+    buffer.append(0.25, capture.MOUSE_DOWN, 10, 20, 2)
+    buffer.append(0.75, capture.KEY_DOWN, code=ord("'"))
+    buffer.append(1.0, capture.KEY_UP, code=capture.KEY_NAMES.index("tab"),
+                  flags=capture.SPECIAL_KEY)
+    buffer.append(1.0, capture.SCROLL, code=-2)
+    path = tmp_path / "capture.py"
+    path.write_text(capture.serialize(buffer, "import pyautogui\n"))
+    assert list(capture.load(str(path))) == list(buffer)
+
+
+def test_sleeps_which_are_not_literals(tmp_path):
+    path = tmp_path / "capture.py"
+    path.write_text("import pyautogui\n"
+                    "import time\n"
+                    "delay = 2\n"
+                    "time.sleep(0.5)\n"
+                    "pyautogui.moveTo(10, 20)\n"
+                    "time.sleep(delay)\n"
+                    "pyautogui.keyDown('a')\n")
+    index = capture.CaptureIndex(str(path))
+    assert len(index) == 2
+    assert index.duration == 0.5
+    assert index.row(1) == (0.5, "pyautogui.keyDown", ("a",))
+    index.close()
+    with pytest.raises(ValueError, match="^line 6: "):
+        capture.load(str(path))
+    assert capture.parse_delay(b"time.sleep((1.5))") == 1.5
+    assert capture.parse_delay("time.sleep('1')") is None
+
+
+def test_load_rejects_calls_it_cannot_read(tmp_path):
+    path = tmp_path / "capture.py"
+    for line in ("pyautogui.moveTo(100, 200, duration=0.5)", "pyautogui.moveTo(x, y)",
+                 "pyautogui.keyDown(1)", "pyautogui.mouseDown(1, 2, 'thumb')"):
+        path.write_text(f"import pyautogui\n{line}\n")
+        with pytest.raises(ValueError, match="^line 2: "):
+            capture.load(str(path))
+
+
+def test_ring_keeps_the_last_events():
+    ring = capture.RingBuffer(4)
+    for i in range(10):
+        ring.append(float(i), capture.MOVE, i, i)
+    assert len(ring) == 4
+    snapshot = ring.snapshot()
+    assert [event[2] for event in snapshot] == [6, 7, 8, 9]
+    assert snapshot.start == 6.0
+    assert [event[2] for event in ring.snapshot(max_age=1.5)] == [8, 9]
+    ring.append(10.0, capture.MOVE, 10, 10)
+    assert [event[2] for event in snapshot] == [6, 7, 8, 9]
+
+
+def test_ring_forgets_the_checkpoints_it_overwrites():
+    ring = capture.RingBuffer(3)
+    for i in range(5):
+        code = ring.add_blob(((i, i, 64, 64), f"thumbnail{i}"))
+        ring.append(float(i), capture.CHECKPOINT, i, i, code)
+    assert len(ring._blobs) == 3
+    snapshot = ring.snapshot()
+    assert snapshot.blobs == [((i, i, 64, 64), f"thumbnail{i}") for i in (2, 3, 4)]
+    assert [event[4] for event in snapshot] == [0, 1, 2]
+    assert "checkpoint.wait_for((4, 4, 64, 64), 'thumbnail4')" in capture.serialize(snapshot, "")
+
+
+def test_stop_click_is_dropped_with_the_held_back_move():
+    import sampling
+
+    decimator = sampling.MouseDecimator(max_rate=10, min_distance=3)
+    buffer = capture.EventBuffer(start=0.0)
+    for t, x in ((0.0, 0), (0.01, 100), (0.02, 110)):
+        if decimator.accept(t, x, 0):
+            buffer.append(t, capture.MOVE, x, 0)
+    buffer.append(0.5, capture.MOUSE_DOWN, 105, 0)
+    buffer.append(0.6, capture.MOUSE_UP, 105, 0)
+    held = decimator.flush()
+    assert held is not None
+    buffer.append(held[0], capture.MOVE, held[1], held[2])
+
+    assert list(buffer)[-1] == (0.02, capture.MOVE, 110, 0, 0, 0)
+
+
+    def on_button(x, y):
+        return 100 <= x < 120
+
+    capture.drop_clicks_on(buffer, on_button)
+    assert list(buffer) == [(0.0, capture.MOVE, 0, 0, 0, 0)]
+    buffer.append(1.0, capture.MOVE, 110, 0)
+    capture.drop_clicks_on(buffer, on_button)
+    assert len(buffer) == 2
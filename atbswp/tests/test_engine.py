@@ -0,0 +1,124 @@
+import queue
+import threading
+from collections import namedtuple
+
+import capture
+
+import engine
+
+
+Named = namedtuple("Named", "name")
+Char = namedtuple("Char", "char")
+LEFT = Named("left")
+
+
+class ScriptedMouse:
+    """Mouse listener of the engine making a few moves and a click."""
+
+    def __init__(self, on_move, on_click, on_scroll):
+        self.on_move, self.on_click, self.on_scroll = on_move, on_click, on_scroll
+        self.done = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self.run, daemon=True).start()
+
+    def run(self):
+        for i in range(200):
+            self.on_move(i * 10, i)
+        self.on_click(1990, 199, LEFT, True)
+        self.on_click(1990, 199, LEFT, False)
+        self.on_scroll(1990, 199, 0, -2)
+        self.done.set()
+
+    def wait(self):
+        self.done.wait()
+
+    def stop(self):
+        pass
+
+    def join(self):
+        pass
+
+
+class ScriptedKeyboard(ScriptedMouse):
+    def __init__(self, on_press, on_release):
+        self.on_press, self.on_release = on_press, on_release
+        self.done = threading.Event()
+
+    def run(self):
+        self.on_press(Char("a"))
+        self.on_release(Char("a"))
+        self.on_press(Named("shift_r"))
+        self.done.set()
+
+
+def test_ring_wraps_and_overflows():
+    ring = engine.SharedEventRing(capacity=4)
+    try:
+        for i in range(3):
+            assert ring.append(float(i), capture.MOVE, i, i)
+        assert ring.read()["x"].tolist() == [0, 1, 2]
+        for i in range(3, 8):
+            ring.append(float(i), capture.KEY_DOWN, code=i, flags=capture.SPECIAL_KEY)
+        assert ring.overflow == 1
+        events = ring.read()
+        assert events["code"].tolist() == [3, 4, 5, 6]
+        assert events["flags"].tolist() == [capture.SPECIAL_KEY] * 4
+        assert len(ring.read()) == 0
+    finally:
+        ring.close()
+
+
+def test_record_in_the_engine_process():
+    process = engine.CaptureProcess({"max_rate": 0, "min_distance": 0},
+                                    mouse_listener=ScriptedMouse, keyboard_listener=ScriptedKeyboard)
+    process.start(start=0.0)
+    assert process.state == engine.RECORDING
+    events = process.stop()
+    assert process.state == engine.STOPPED
+    kinds = list(events.column("kind"))
+    assert kinds.count(capture.MOVE) == 200
+    # The mouse and the keyboard listeners run on their own threads
+    assert [kind for kind in kinds if kind in (capture.MOUSE_DOWN, capture.MOUSE_UP, capture.SCROLL)] == \
+        [capture.MOUSE_DOWN, capture.MOUSE_UP, capture.SCROLL]
+    assert [kind for kind in kinds if kind in (capture.KEY_DOWN, capture.KEY_UP)] == \
+        [capture.KEY_DOWN, capture.KEY_UP, capture.KEY_DOWN]
+    assert min(events.column("time")) > 0.0
+    program = capture.serialize(events, "import pyautogui\nimport time")
+    assert "pyautogui.keyDown('shiftright')" in program
+    assert "pyautogui.mouseDown(1990, 199, 'left')" in program
+    assert process.counters == (200, 0)
+
+
+def test_rules_of_the_engine_process():
+    process = engine.CaptureProcess({"max_rate": 0, "min_distance": 0,
+                                     "rules": [{"region": [1000, 0, 1000, 1000]}, {"keys": ["a"]}]},
+                                    mouse_listener=ScriptedMouse, keyboard_listener=ScriptedKeyboard)
+    process.start(start=0.0)
+    events = process.stop()
+    assert list(events.column("x")) == [i * 10 for i in range(100)] + [0]
+    assert process.counters == (100, 0)
+    # 100 moves, the click, the scroll and the press and release of a
+    assert process.filtered == 105
+
+
+def test_drain_keeps_the_events_after_a_lost_checkpoint(monkeypatch):
+    monkeypatch.setattr(engine, "TIMEOUT", 0.01)
+    process = engine.CaptureProcess({})
+    process.events = capture.EventBuffer(0.0)
+    process.ring = engine.SharedEventRing(capacity=8)
+    process._blobs = queue.Queue()
+    process._checkpoints = {}
+    try:
+        process.ring.append(1.0, capture.MOVE, 1, 1)
+        process.ring.append(2.0, capture.CHECKPOINT, 0, 0, 0)
+        process.ring.append(3.0, capture.MOVE, 3, 3)
+        process._drain()
+        process._blobs.put((1, ((0, 0, 64, 64), "AAAA")))
+        process.ring.append(4.0, capture.CHECKPOINT, 0, 0, 1)
+        process._drain()
+    finally:
+        process.ring.close()
+    assert process.failed
+    assert [event[1:3] for event in process.events] == [(capture.MOVE, 1), (capture.MOVE, 3),
+                                                        (capture.CHECKPOINT, 0)]
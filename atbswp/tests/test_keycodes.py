@@ -0,0 +1,47 @@
+from collections import namedtuple
+from types import SimpleNamespace
+
+import keycodes
+
+
+Char = namedtuple("Char", "char")
+Named = namedtuple("Named", "name value")
+Virtual = namedtuple("Virtual", "char vk")
+
+
+def test_encode():
+    encode = keycodes.Encoder([Named("shift_r", None)])
+    assert encode(Char("é")) == (ord("é"), 0)
+    assert encode(Named("shift_r", None)) == (keycodes.CODES["shiftright"], keycodes.SPECIAL_KEY)
+    assert encode(Named("media_volume_up", None)) == (keycodes.CODES["volumeup"], keycodes.SPECIAL_KEY)
+    assert encode(Named("f24", None)) == (keycodes.CODES["f24"], keycodes.SPECIAL_KEY)
+    # A named key pyautogui doesn't know is recorded by its virtual key code
+    assert encode(Named("media_eject", Virtual(None, 161))) == (161, keycodes.VIRTUAL_KEY)
+    assert encode(Named("media_eject", None)) == (keycodes.UNSUPPORTED, keycodes.SPECIAL_KEY)
+    assert encode(Virtual(None, 0x7FFF_FFFF)) == (0x7FFF_FFFF, keycodes.VIRTUAL_KEY)
+    assert encode(Virtual(None, None)) is None
+    # Not hashable
+    assert encode(SimpleNamespace(char="a")) == (ord("a"), 0)
+
+
+def test_virtual_keys_of_each_platform():
+    tables = {platform: {vk: keycodes.CODES[name] for vk, name in keycodes._platform_names(platform).items()}
+              for platform in ("win32", "darwin", "linux")}
+    assert keycodes.NAMES[tables["win32"][0x65]] == "num5"
+    assert keycodes.NAMES[tables["win32"][0xAD]] == "volumemute"
+    assert keycodes.NAMES[tables["darwin"][0x4C]] == "enter"
+    assert keycodes.NAMES[tables["linux"][0xFFB5]] == "num5"
+    assert keycodes.NAMES[tables["linux"][0xFFD5]] == "f24"
+    assert keycodes.NAMES[tables["linux"][0x1008FF17]] == "nexttrack"
+
+
+def test_names_round_trip():
+    for code, name in enumerate(keycodes.NAMES):
+        assert keycodes.code(name) == (code, keycodes.SPECIAL_KEY)
+        assert keycodes.name(code, keycodes.SPECIAL_KEY) == name
+    assert keycodes.code(keycodes.name(173, keycodes.VIRTUAL_KEY)) == (173, keycodes.VIRTUAL_KEY)
+    assert keycodes.code("a") == (ord("a"), 0)
+    # Written by the older versions
+    assert keycodes.code("print_screen") == (keycodes.CODES["printscreen"], keycodes.SPECIAL_KEY)
+    assert keycodes.code("hyper") == (keycodes.UNSUPPORTED, keycodes.SPECIAL_KEY)
+    assert keycodes.name(keycodes.UNSUPPORTED, keycodes.SPECIAL_KEY) == keycodes.UNSUPPORTED_NAME
@@ -0,0 +1,147 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import listeners
+
+
+class FakeListener:
+    created = []
+
+    def __init__(self, **callbacks):
+        self.callbacks = callbacks
+        self.running = False
+        FakeListener.created.append(self)
+
+    def start(self):
+        self.running = True
+
+    def wait(self):
+        pass
+
+    def stop(self):
+        self.running = False
+
+    def join(self):
+        pass
+
+
+class Sink:
+    def __init__(self):
+        self.events = []
+
+    def on_move(self, x, y):
+        self.events.append(("move", x, y))
+
+    def on_click(self, x, y, button, pressed):
+        self.events.append(("click", x, y, button, pressed))
+
+    def on_scroll(self, x, y, dx, dy):
+        self.events.append(("scroll", dy))
+
+    def on_press(self, key):
+        self.events.append(("press", key))
+
+    def on_release(self, key):
+        self.events.append(("release", key))
+
+
+def make_manager():
+    FakeListener.created = []
+    return listeners.ListenerManager(FakeListener, FakeListener)
+
+
+def test_listeners_are_created_once():
+    manager = make_manager()
+    sink = Sink()
+    for _ in range(3):
+        manager.arm(sink)
+        manager.disarm(sink)
+    assert len(FakeListener.created) == 2
+    assert all(listener.running for listener in FakeListener.created)
+    manager.stop()
+    assert not any(listener.running for listener in FakeListener.created)
+    assert not manager.running
+
+
+def test_only_armed_sinks_get_the_events():
+    manager = make_manager()
+    first, second = Sink(), Sink()
+    manager.arm(first)
+    manager.on_move(1, 2)
+    manager.arm(second)
+    manager.arm(second)
+    manager.on_click(3, 4, "left", True)
+    manager.disarm(first)
+    manager.on_scroll(0, 0, 0, -1)
+    assert first.events == [("move", 1, 2), ("click", 3, 4, "left", True)]
+    assert second.events == [("click", 3, 4, "left", True), ("scroll", -1)]
+
+
+def test_hotkeys_never_reach_the_sinks():
+    manager = make_manager()
+    sink = Sink()
+    pressed = []
+    manager.arm(sink)
+    manager.bind("record", "f9")
+    manager.bind("dump", "f7", lambda: pressed.append("f7"))
+    for key in ("f9", "a", "f7"):
+        manager.on_press(key)
+        manager.on_release(key)
+    assert sink.events == [("press", "a"), ("release", "a")]
+    assert pressed == ["f7"]
+
+    manager.bind("record", "f10")
+    manager.unbind("dump")
+    manager.on_press("f9")
+    manager.on_press("f10")
+    manager.on_press("f7")
+    assert sink.events[2:] == [("press", "f9"), ("press", "f7")]
+
+
+def test_source_clock_offset_is_the_quickest_delivery():
+    clock = listeners.SourceClock(0.001)
+    assert clock.convert(1000, now=101.005) == 101.005
+    # Delivered quicker, this one sets the offset of the clocks
+    assert clock.convert(1010, now=101.011) == 101.011
+    assert clock.convert(1020, now=101.030) == pytest.approx(101.021)
+    assert clock.convert(1000, now=101.012) == pytest.approx(101.001)
+
+
+def test_source_clock_wraps_and_drifts():
+    clock = listeners.SourceClock(0.001, wrap=1000)
+    assert clock.convert(990, now=50.0) == 50.0
+    assert clock.convert(5, now=50.020) == pytest.approx(50.015)
+    # A bogus timestamp is replaced by the callback time
+    assert clock.convert(5, now=60.0) == 60.0
+
+    # The source clock runs slower, the offset measured two windows ago is forgotten
+    clock = listeners.SourceClock(0.001, window=10)
+    clock.convert(1000, now=10.000)
+    clock.convert(12000, now=21.005)
+    assert clock.convert(23000, now=32.010) == pytest.approx(32.005)
+    clock.convert(34000, now=43.010)
+    assert clock.convert(34010, now=43.030) == pytest.approx(43.020)
+
+
+class FakeXorg(FakeListener):
+    __module__ = "pynput.mouse._xorg"
+
+    def _handle_message(self, display, event, injected):
+        self.callbacks["on_move"](event.x, event.y)
+
+
+def test_events_are_stamped_at_the_source():
+    manager = make_manager()
+    seen = []
+    listener = listeners.stamped(FakeXorg, manager)(on_move=lambda x, y: seen.append(manager.now()))
+    before = time.perf_counter()
+    listener._handle_message(None, SimpleNamespace(time=1000, x=0, y=0), False)
+    # Delivered after the first one but it happened before
+    listener._handle_message(None, SimpleNamespace(time=998, x=0, y=0), False)
+    assert seen[0] - seen[1] == pytest.approx(0.002)
+    assert before <= seen[0] <= time.perf_counter()
+    # Outside of a dispatch it is the current time
+    assert manager.now() > seen[0]
+    assert listeners.stamped(FakeListener, manager) is FakeListener
@@ -0,0 +1,69 @@
+import pytest
+
+import capture
+
+import loops
+
+import replay
+
+
+HEADER = "import pyautogui\nimport time\n"
+
+
+def repetitive_capture(path, repetitions=20, jitter=0.002):
+    events = capture.EventBuffer(start=0.0)
+    now = 0.0
+    for repetition in range(repetitions):
+        for x, y in ((10, 10), (200, 40), (200, 80), (350, 300)):
+            now += 0.1 + (jitter if repetition % 2 else -jitter)
+            events.append(now, capture.MOVE, x, y)
+        events.append(now, capture.MOUSE_DOWN, 350, 300, 0)
+        now += 0.05
+        events.append(now, capture.MOUSE_UP, 350, 300, 0)
+        events.append(now, capture.KEY_DOWN, code=ord("x"))
+        events.append(now, capture.KEY_UP, code=ord("x"))
+    now += 1.0
+    events.append(now, capture.MOVE, 0, 0)
+    path.write_text(capture.serialize(events, HEADER) + "\n")
+    return path
+
+
+def test_fold_repeated_block(tmp_path):
+    original = repetitive_capture(tmp_path / "capture.py")
+    lines = original.read_text().splitlines(True)
+    folded, found = loops.fold(lines)
+    assert found == [(3, 8, 20)]
+    assert len(folded) < len(lines) // 10
+    assert folded[3] == "for _ in range(20):\n"
+
+    (tmp_path / "folded.py").write_text("".join(folded))
+    before = capture.load(str(original))
+    after = capture.load(str(tmp_path / "folded.py"))
+    assert list(after.column("kind")) == list(before.column("kind"))
+    assert list(after.column("x")) == list(before.column("x"))
+    assert list(after.column("time")) == pytest.approx(list(before.column("time")), abs=loops.TIME_TOLERANCE)
+
+    index = capture.CaptureIndex(str(tmp_path / "folded.py"))
+    assert len(index) == len(before)
+    assert index.row(len(index) - 2)[1:] == ("pyautogui.keyUp", ("x",))
+    index.close()
+
+
+def test_folded_capture_replays_the_same_calls(tmp_path):
+    lines = repetitive_capture(tmp_path / "capture.py").read_text().splitlines(True)
+    before, duration = replay.dry_run(replay.compile_capture(lines))
+    after, folded_duration = replay.dry_run(replay.compile_capture(loops.fold(lines)[0]))
+    assert [step[1:] for step in after] == [step[1:] for step in before]
+    assert folded_duration == pytest.approx(duration, abs=1e-9)
+
+
+def test_time_tolerance_limits_the_loops(tmp_path):
+    lines = repetitive_capture(tmp_path / "capture.py", jitter=0.02).read_text().splitlines(True)
+    assert loops.fold(lines)[1] == []
+    assert loops.fold(lines, time_tolerance=0.1)[1] == [(3, 8, 20)]
+
+
+def test_unique_captures_are_unchanged():
+    lines = [HEADER] + [f"time.sleep(0.1)\npyautogui.moveTo({i}, {i})\n" for i in range(50)]
+    lines = "".join(lines).splitlines(True)
+    assert loops.fold(lines) == (lines, [])
@@ -0,0 +1,31 @@
+import json
+
+import pytest
+
+import playlist
+
+
+def test_load(tmp_path):
+    path = tmp_path / "day.json"
+    path.write_text(json.dumps({"items": ["login.py",
+                                          {"path": "flows/work.py", "repeat": 3, "speed": 2},
+                                          {"path": str(tmp_path.parent / "logout.py")}]}))
+    items = playlist.load(str(path))
+    assert items == [playlist.Item(str(tmp_path / "login.py"), 1, 1.0),
+                     playlist.Item(str(tmp_path / "flows" / "work.py"), 3, 2.0),
+                     playlist.Item(str(tmp_path.parent / "logout.py"), 1, 1.0)]
+
+
+@pytest.mark.parametrize("content", [
+    [],
+    {"items": []},
+    {"items": [{"repeat": 2}]},
+    {"items": [{"path": "a.py", "repeat": 0}]},
+    {"items": [{"path": "a.py", "repeat": True}]},
+    {"items": [{"path": "a.py", "speed": -1}]},
+])
+def test_invalid_playlists(tmp_path, content):
+    path = tmp_path / "bad.json"
+    path.write_text(json.dumps(content))
+    with pytest.raises(ValueError):
+        playlist.load(str(path))
@@ -0,0 +1,179 @@
+import threading
+
+import pytest
+
+import capture
+
+import playlist
+
+import replay
+
+import settings
+
+
+HEADER = "import pyautogui\nimport time\npyautogui.FAILSAFE = False\n"
+
+
+def make_program():
+    events = capture.EventBuffer(start=0.0)
+    events.append(0.5, capture.MOVE, 10, 20)
+    events.append(1.5, capture.MOUSE_DOWN, 10, 20, 0)
+    events.append(1.5, capture.MOUSE_UP, 10, 20, 0)
+    events.append(3.0, capture.KEY_DOWN, code=ord("a"))
+    return replay.compile_capture(capture.serialize(events, HEADER).splitlines(True))
+
+
+def test_dry_run_timeline():
+    timeline, duration = replay.dry_run(make_program())
+    assert [(step.function, step.arguments) for step in timeline] == [
+        ("pyautogui.moveTo", (10, 20)),
+        ("pyautogui.mouseDown", (10, 20, "left")),
+        ("pyautogui.mouseUp", (10, 20, "left")),
+        ("pyautogui.keyDown", ("a",)),
+    ]
+    # Recorded delays plus the pause pyautogui makes after each call
+    assert [step.time for step in timeline] == pytest.approx([0.5, 1.6, 1.7, 3.3])
+    assert duration == pytest.approx(3.4)
+
+
+def test_dry_run_checkpoint_and_pause():
+    program = replay.compile_capture([
+        "import pyautogui\n", "import time\n", "import checkpoint\n",
+        "pyautogui.PAUSE = 0\n",
+        "checkpoint.wait_for((0, 0, 64, 64), 'AAAA')\n",
+        "time.sleep(2.0)\n",
+        "pyautogui.scroll(-3)\n",
+    ])
+    timeline, duration = replay.dry_run(program)
+    assert timeline == [
+        replay.Step(0.0, "checkpoint.wait_for", ((0, 0, 64, 64),)),
+        replay.Step(2.0, "pyautogui.scroll", (-3,)),
+    ]
+    assert duration == 2.0
+
+
+def test_blocks_keep_indented_lines_together():
+    lines = ["import time\n", "for _ in range(3):\n", "    time.sleep(1)\n",
+             "    time.sleep(1)\n", "time.sleep(0.5)\n"]
+    program = replay.compile_capture(lines, block_size=2)
+    assert len(program) == 2
+    assert replay.dry_run(program)[1] == 6.5
+
+
+def test_interruptible_sleep():
+    stop = threading.Event()
+    clock = replay.InterruptibleTime(stop)
+    clock.sleep(0)
+    stop.set()
+    with pytest.raises(replay.Stopped):
+        clock.sleep(60)
+    assert clock.monotonic() > 0
+
+    # The sleeps are shortened by the speed
+    clock = replay.InterruptibleTime(threading.Event(), speed=100.0)
+    before = clock.monotonic()
+    clock.sleep(0.5)
+    assert clock.monotonic() - before < 0.25
+
+
+def test_stop_without_sleeps_and_during_checkpoints():
+    stop = threading.Event()
+    calls = []
+
+    class Backend:
+        def moveTo(self, x, y):
+            calls.append((x, y))
+            if x == 1:
+                stop.set()
+
+    lines = [f"pyautogui.moveTo({x}, 0)\n" for x in range(4)]
+    with pytest.raises(replay.Stopped):
+        replay.run(replay.compile_capture(lines, block_size=2), {"pyautogui": Backend()}, stop)
+    assert calls == [(0, 0), (1, 0)]
+
+    class Checkpoint:
+        def wait_for(self, region, expected, sleep):
+            while True:
+                sleep(0.05)
+
+    clock = replay.InterruptibleTime(stop)
+    with pytest.raises(replay.Stopped):
+        replay.InterruptibleCheckpoint(Checkpoint(), clock).wait_for((0, 0, 64, 64), "AAAA")
+
+
+def test_player_reports_each_replay():
+    played = threading.Semaphore(0)
+    reports = []
+
+    def report(remaining, playing, error):
+        reports.append((remaining, playing, error))
+        played.release()
+
+    player = replay.Player(play=lambda program, stop: True)
+    player.start(lambda: None, 3, False, report)
+    for _ in range(3):
+        assert played.acquire(timeout=5)
+    assert reports == [(2, True, None), (1, True, None), (0, False, None)]
+
+    error = SyntaxError("invalid syntax")
+
+    def load():
+        raise error
+
+    player.start(load, 3, False, report)
+    assert played.acquire(timeout=5)
+    assert reports[-1] == (3, False, error)
+    player.close()
+    assert not player._thread.is_alive()
+
+
+def test_player_preloads_the_playlist():
+    items = [playlist.Item("a", repeat=2, speed=2.0), playlist.Item("b")]
+    loaded = threading.Event()
+    loads, played, reports = [], [], []
+    done = threading.Semaphore(0)
+
+    def load(path):
+        loads.append((path, threading.current_thread().name))
+        if path == "b":
+            loaded.set()
+        return path
+
+    def play(program, stop, speed):
+        if len(played) == 1:
+            # b is loaded while the last repetition of a plays
+            assert loaded.wait(timeout=5)
+        played.append((program, speed))
+        return True
+
+    def report(remaining, playing, error):
+        reports.append((remaining, playing, error))
+        done.release()
+
+    player = replay.Player(play=play)
+    player.start_playlist(items, load, 2, False, report)
+    for _ in range(2):
+        assert done.acquire(timeout=5)
+    player.close()
+    assert played == [("a", 2.0), ("a", 2.0), ("b", 1.0)] * 2
+    assert reports == [(1, True, None), (0, False, None)]
+    assert [path for path, _ in loads] == ["a", "a", "b", "a", "a", "b"]
+    assert all(name.startswith("atbswp-preload") for _, name in loads)
+
+
+def test_program_cache(tmp_path):
+    path = tmp_path / "capture.py"
+    path.write_text("import time\ntime.sleep(1)\n")
+    cache = replay.ProgramCache()
+    program = cache.load(str(path))
+    assert cache.load(str(path)) is program
+    path.write_text("import time\ntime.sleep(2.0)\n")
+    assert replay.dry_run(cache.load(str(path)))[1] == 2.0
+
+
+def test_captures_are_written_and_read_in_utf8(tmp_path):
+    path = tmp_path / "capture.py"
+    settings.atomic_write(str(path), "import pyautogui\npyautogui.keyDown('é')\n")
+    assert path.read_bytes().endswith("('é')\n".encode("utf-8"))
+    timeline, _ = replay.dry_run(replay.ProgramCache().load(str(path)))
+    assert timeline[0].arguments == ("é",)
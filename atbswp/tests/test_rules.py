@@ -0,0 +1,75 @@
+import json
+from collections import namedtuple
+
+import pytest
+
+import rules
+
+
+Named = namedtuple("Named", "name")
+Char = namedtuple("Char", "char")
+
+
+def test_compiled_predicates():
+    predicates = rules.compile_rules([
+        {"region": [1920, 0, 1920, 1080]},
+        {"keys": ["Caps_Lock", "q"], "after": 1},
+        {"buttons": ["middle"]},
+        {"events": ["move"], "before": 0.5},
+    ])
+    assert predicates["move"](0.2, 0, 0)
+    assert not predicates["move"](1.0, 1919, 1079)
+    assert predicates["move"](1.0, 1920, 0)
+    assert not predicates["move"](1.0, 3840, 0)
+    assert predicates["click"](0.0, 0, 0, "middle")
+    assert not predicates["click"](0.0, 0, 0, "left")
+    assert predicates["scroll"](0.0, 2000, 500)
+    assert predicates["key"](1.0, "caps_lock")
+    assert not predicates["key"](0.5, "q")
+    assert not predicates["key"](2.0, None)
+    assert not rules.compile_rules([])["key"](0.0, "a")
+
+
+def test_filter_counts_and_pairs():
+    event_filter = rules.Filter([{"keys": ["a"], "before": 1}, {"region": [0, 0, 100, 100]}])
+    event_filter.reset(10.0)
+    assert event_filter.key(10.5, Char("A"), True)
+    # The auto repeated presses and the release go with the first press,
+    # whatever the rules say
+    assert event_filter.key(11.5, Char("a"), True)
+    assert event_filter.key(11.6, Char("a"), False)
+    assert not event_filter.key(11.7, Char("a"), True)
+    assert not event_filter.key(11.7, Char("a"), True)
+    assert not event_filter.key(11.8, Char("a"), False)
+    assert event_filter.click(12.0, 50, 50, Named("left"), True)
+    assert event_filter.click(12.1, 500, 500, Named("left"), False)
+    assert not event_filter.click(12.2, 500, 500, Named("left"), True)
+    assert not event_filter.click(12.3, 50, 50, Named("left"), False)
+    assert event_filter.move(13.0, 99, 99)
+    assert not event_filter.scroll(13.0, 100, 99)
+    assert event_filter.filtered == {"move": 1, "click": 2, "scroll": 0, "key": 3}
+    assert event_filter.total == 6
+    event_filter.reset(0.0)
+    assert event_filter.total == 0
+
+    # A key kept on its first press stays kept until released
+    event_filter = rules.Filter([{"after": 1.0}])
+    assert [event_filter.key(0.5, Char("a"), True), event_filter.key(1.2, Char("a"), True),
+            event_filter.key(1.3, Char("a"), False), event_filter.key(1.4, Char("a"), True)] == \
+        [False, False, False, True]
+
+
+@pytest.mark.parametrize("content", [
+    [{"region": [0, 0, 10]}],
+    [{"keys": "a"}],
+    [{"buttons": ["left"], "keys": ["a"]}],
+    [{"events": ["wheel"]}],
+    [{"after": "1"}],
+    [{"screen": 2}],
+    ["a"],
+])
+def test_invalid_rules(tmp_path, content):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps({"rules": content}))
+    with pytest.raises(ValueError):
+        rules.load(str(path))
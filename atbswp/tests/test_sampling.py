@@ -0,0 +1,78 @@
+import pytest
+
+import capture
+
+import replay
+
+import sampling
+
+
+def test_slow_jitter_is_dropped_and_flushed():
+    decimator = sampling.MouseDecimator(max_rate=60, min_distance=3)
+    assert decimator.accept(0.0, 100, 100)
+    assert not decimator.accept(0.001, 101, 100)
+    assert not decimator.accept(0.002, 102, 101)
+    assert decimator.flush() == (0.002, 102, 101)
+    assert decimator.flush() is None
+    assert (decimator.kept, decimator.dropped) == (2, 1)
+
+
+def test_fast_moves_keep_more_samples():
+    slow = sampling.MouseDecimator(max_rate=60, min_distance=3)
+    fast = sampling.MouseDecimator(max_rate=60, min_distance=3)
+    # 1000 Hz mouse, 5000 px/s flick versus 100 px/s drag
+    for i in range(1000):
+        slow.accept(i / 1000, i // 10, 0)
+        fast.accept(i / 1000, i * 5, 0)
+    assert slow.kept <= 61
+    assert fast.kept > 3 * slow.kept
+    assert fast.kept + fast.dropped == 1000
+
+
+def path_capture(moves, interval):
+    lines = ["import pyautogui\n", "import time\n"]
+    for i in range(moves):
+        lines.append(f"time.sleep({interval})\n")
+        lines.append(f"pyautogui.moveTo({i}, {2 * i})\n")
+    lines.append("pyautogui.mouseDown(0, 0, 'left')\n")
+    return lines
+
+
+def test_resample_dense_path():
+    lines = path_capture(1001, 0.001)
+    resampled = sampling.resample(lines, 60)
+    moves = [line for line in resampled if line.startswith("pyautogui.moveTo(")]
+    assert len(moves) == 61
+    assert moves[0] == "pyautogui.moveTo(0, 0, _pause=False)\n"
+    assert moves[-1] == "pyautogui.moveTo(1000, 2000, _pause=False)\n"
+    assert resampled[-1] == "pyautogui.mouseDown(0, 0, 'left')\n"
+    timeline, duration = replay.dry_run(replay.compile_capture(resampled))
+    assert timeline[-1].time == pytest.approx(1.001)
+    assert len(timeline) == 62
+
+
+def test_resample_sparse_path():
+    lines = ["time.sleep(1.0)\n", "pyautogui.moveTo(0, 0)\n", "time.sleep(1.0)\n", "pyautogui.moveTo(240, 480)\n"]
+    resampled = sampling.resample(lines, 120)
+    timeline, duration = replay.dry_run(replay.compile_capture(resampled))
+    assert len(timeline) == 121
+    assert timeline[60] == replay.Step(pytest.approx(1.5), "pyautogui.moveTo", (120, 240))
+    assert duration == pytest.approx(2.0)
+
+
+def test_resample_keeps_isolated_moves():
+    lines = ["time.sleep(0.5)\n", "pyautogui.moveTo(5, 5)\n", "pyautogui.keyDown('a')\n"]
+    assert sampling.resample(lines, 60) == lines
+
+
+def test_decimate_flushes_before_other_events():
+    events = capture.EventBuffer(start=0.0)
+    for i in range(10):
+        events.append(i * 0.001, capture.MOVE, i * 5, 0)
+    events.append(0.01, capture.CHECKPOINT, 0, 0, events.add_blob(((0, 0, 8, 8), "AAAA")))
+    decimated = sampling.decimate(events, sampling.MouseDecimator(max_rate=60, min_distance=3))
+    kinds, xs = list(decimated.column("kind")), list(decimated.column("x"))
+    assert len(kinds) < len(events)
+    assert kinds[-1] == capture.CHECKPOINT
+    assert xs[0] == 0 and xs[-2] == 45
+    assert decimated.blobs == [((0, 0, 8, 8), "AAAA")]
@@ -0,0 +1,52 @@
+import settings
+
+
+def make_settings(tmp_path, content=None):
+    path = tmp_path / "atbswp.cfg"
+    if content is not None:
+        path.write_text(content)
+    return settings.Settings(str(path), delay=0.01)
+
+
+def test_defaults_when_file_is_missing(tmp_path):
+    config = make_settings(tmp_path)
+    assert config.repeat_count == 1
+    assert config.always_on_top is True
+    assert config.language == "en"
+
+
+def test_invalid_and_missing_values_fall_back_to_defaults(tmp_path):
+    config = make_settings(tmp_path, "[DEFAULT]\nrepeat count = many\n"
+                                     "infinite playback = yes\n")
+    assert config.repeat_count == 1
+    assert config.infinite_playback is True
+    assert config.recording_timer == 0
+
+
+def test_set_notifies_and_persists_atomically(tmp_path):
+    config = make_settings(tmp_path)
+    seen = []
+    config.subscribe("repeat_count", seen.append)
+    config.repeat_count = "3"
+    config.repeat_count = 3
+    assert seen == [3]
+    config.save()
+    assert list(tmp_path.iterdir()) == [tmp_path / "atbswp.cfg"]
+    assert make_settings(tmp_path).repeat_count == 3
+
+
+def test_migrations_run_for_older_files(tmp_path, monkeypatch):
+    def rename(section):
+        section["Repeat Count"] = section.pop("Old Count")
+
+    monkeypatch.setitem(settings.MIGRATIONS, settings.CONFIG_VERSION, rename)
+    config = make_settings(tmp_path, "[DEFAULT]\nold count = 7\n")
+    assert config.repeat_count == 7
+    assert config.config_version == settings.CONFIG_VERSION
+
+
+def test_mouse_speed_becomes_the_minimum_distance(tmp_path):
+    config = make_settings(tmp_path, "[DEFAULT]\nmouse speed = 5\n")
+    assert config.mouse_min_distance == 5
+    config = make_settings(tmp_path, "[DEFAULT]\nmouse speed = 21\n")
+    assert config.mouse_min_distance == 3
@@ -0,0 +1,40 @@
+import threading
+
+import pytest
+
+import soak
+
+
+def test_replays_in_a_loop_without_growing(tmp_path):
+    path = soak.generate_capture(str(tmp_path / "capture.py"), events=40)
+    before = threading.active_count()
+    samples = soak.soak(path, iterations=600, sample_every=100)
+    assert [sample.iteration for sample in samples] == [100, 200, 300, 400, 500, 600]
+    assert {sample.threads for sample in samples} == {before + 1}
+    assert threading.active_count() == before
+    found = soak.trends(samples)
+    assert found["threads"][1] == pytest.approx(0, abs=1e-9)
+    assert not soak.failures(found, max_time_growth=100)
+
+
+def test_leaking_threads_fail(tmp_path):
+    path = soak.generate_capture(str(tmp_path / "capture.py"), events=4)
+    release = threading.Event()
+
+    def leaking_play(program, stop):
+        threading.Thread(target=release.wait, daemon=True).start()
+        return True
+
+    try:
+        samples = soak.soak(path, iterations=100, sample_every=10, play=leaking_play)
+    finally:
+        release.set()
+    failed = soak.failures(soak.trends(samples), max_time_growth=100)
+    assert any(message.startswith("threads grows") for message in failed)
+
+
+def test_memory_growth_fails():
+    samples = [soak.Sample(i * 100, 2 ** 20 * (10 + i), 2, 4, 1e-4) for i in range(1, 21)]
+    found = soak.trends(samples)
+    assert found["rss"] == pytest.approx((2 ** 20 * 15, 2 ** 20 * 15))
+    assert [message.split()[0] for message in soak.failures(found)] == ["rss"]